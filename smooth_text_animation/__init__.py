@@ -12,6 +12,7 @@ from .animations import (
     animated_line_dual,
     fade_in_text,
     marquee_text,
+    marquee_stream,
     wave_text,
     blinking_text,
     random_fill,
@@ -23,6 +24,8 @@ from .animations import (
     matrix_reveal,
     typewriter_advanced,
     bounce_text,
+    drop_text,
+    rise_text,
     scramble_solve,
     slide_in,
     pulse_text,
@@ -31,12 +34,22 @@ from .animations import (
     expanding_center,
     neon_flicker,
 )
+from .clock import MonotonicClock, VirtualClock
+from .rain import matrix_rain
+from .grid import grid_frame, scramble_screen, plasma_field
+from .screen import ScreenBuffer, StyleTable
+from .progress import ProgressBar, LiveProgress
+from .multiprocess import RenderServer, RenderHandle
+from .handlers import AnimatedLogHandler
+from .output import BroadcastSink
+from .session import LiveSession
 
 __all__ = [
     "animated_line",
     "animated_line_dual",
     "fade_in_text",
     "marquee_text",
+    "marquee_stream",
     "wave_text",
     "blinking_text",
     "random_fill",
@@ -48,6 +61,8 @@ __all__ = [
     "matrix_reveal",
     "typewriter_advanced",
     "bounce_text",
+    "drop_text",
+    "rise_text",
     "scramble_solve",
     "slide_in",
     "pulse_text",
@@ -55,4 +70,19 @@ __all__ = [
     "zigzag_text",
     "expanding_center",
     "neon_flicker",
+    "matrix_rain",
+    "scramble_screen",
+    "plasma_field",
+    "grid_frame",
+    "MonotonicClock",
+    "VirtualClock",
+    "ScreenBuffer",
+    "StyleTable",
+    "ProgressBar",
+    "LiveProgress",
+    "RenderServer",
+    "RenderHandle",
+    "AnimatedLogHandler",
+    "BroadcastSink",
+    "LiveSession",
 ]
@@ -0,0 +1,10 @@
+"""
+Allow ``python -m smooth_text_animation``
+"""
+
+import sys
+
+from .cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
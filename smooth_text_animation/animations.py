@@ -3,70 +3,263 @@
 Main animation functions for text effects
 """
 
-import sys
-import time
+import itertools
 import random
-
-from .utils import validate_delay, colorize_text, clear_line
-
-
-def animated_line(text, delay=0.05):
+from collections import deque
+
+from .clock import resolve_clock
+from .easing import resolve_easing
+from .layout import char_width
+from .output import resolve_stream
+from .quality import quality_for
+from .screen import ScreenBuffer
+from .utils import validate_delay, colorize_text, get_terminal_size
+
+
+class _Player:
+    """
+    Writes the frames of one effect run to its output and paces them.
+
+    Holds are measured against a running deadline rather than slept after
+    each write, so time spent building and writing frames does not add up
+    as drift. A player that falls behind does not rush to catch up.
+
+    Every write is timed, and frames to a terminal pass through its shared
+    :class:`~smooth_text_animation.quality.AdaptiveQuality`, which trims
+    or drops them while the terminal cannot keep up.
+    """
+
+    def __init__(self, stream=None, clock=None):
+        self.out = resolve_stream(stream)
+        self.clock = resolve_clock(clock)
+        self.deadline = self.clock.now()
+        self.quality = quality_for(self.out)
+
+    def frame(self, data, delay=0.0):
+        """Write *data* as one flushed frame, then hold it for *delay* seconds."""
+        started = self.clock.now()
+        data = self.quality.prepare(data, started)
+        if data:
+            self.out.write(data)
+            self.out.flush()
+            finished = self.clock.now()
+            self.quality.record(finished - started, finished)
+        self.pause(delay)
+
+    def pause(self, delay):
+        """Hold the current frame for *delay* seconds."""
+        if not delay:
+            return
+        self.quality.adjust(delay)
+        self.deadline += delay
+        now = self.clock.now()
+        if self.deadline > now:
+            self.clock.sleep_until(self.deadline)
+        else:
+            self.deadline = now
+
+    def end(self, text=""):
+        """Finish the effect like ``print(text)`` would."""
+        self.frame(text + "\n")
+
+
+def _screen_size(width, height):
+    """Fill in the terminal's size where *width* or *height* is None."""
+    if width is None or height is None:
+        term_width, term_height = get_terminal_size()
+        width = width or term_width
+        # Leave the last row free so drawing never scrolls the screen
+        height = height or max(1, term_height - 1)
+    return max(1, width), max(1, height)
+
+
+def _play_screen(rows, step, duration, fps, stream=None, clock=None,
+                 finish=None):
+    """
+    Play a full-screen effect of *rows* rows.
+
+    The cursor is hidden and the screen cleared, then every frame shows
+    ``step(frame, frames, interval)`` for *interval* seconds, followed by
+    ``finish()`` if given. The cursor is always restored below the last
+    row, even if the run is interrupted.
+    """
+    player = _Player(stream, clock)
+    interval = 1.0 / max(1.0, fps)
+    frames = max(1, int(duration * fps))
+    player.frame("\033[?25l\033[2J")
+    try:
+        for frame in range(frames):
+            player.frame(step(frame, frames, interval), interval)
+        if finish is not None:
+            player.frame(finish())
+    finally:
+        player.frame(f"\033[{rows};1H\033[?25h")
+        player.end()
+
+
+def _progress(player, total, delay, duration=None, easing="linear", fps=60,
+              first=0):
+    """
+    Yield how many of *total* steps to show in each frame, ending at *total*.
+
+    Without *duration* every count from *first* to *total* gets its own frame,
+    held for *delay*. With *duration* frames come at *fps* and the count
+    follows the eased fraction of elapsed time, so a long text shows many
+    steps per frame and the run lasts *duration* seconds at any length.
+    The caller writes its frame after each count; this generator paces.
+    """
+    if duration is None:
+        for count in range(first, total + 1):
+            yield count
+            player.pause(delay)
+        return
+    ease = resolve_easing(easing)
+    frames = max(1, round(duration * fps)) if duration > 0 and fps > 0 else 1
+    start = player.clock.now()
+    shown = -1
+    for index in range(frames + 1):
+        # A player that fell behind skips ahead to the current time
+        t = index / frames
+        if duration > 0:
+            t = max(t, (player.clock.now() - start) / duration)
+        if t >= 1.0:
+            break
+        count = min(total, max(0, int(ease(t) * total)))
+        if count != shown and count >= first:
+            shown = count
+            yield count
+        player.pause(duration / frames)
+    yield total
+
+
+class _RedrawLine(ScreenBuffer):
+    """
+    One-row buffer that redraws the whole line on every render.
+
+    Used for text with wide or zero-width characters, where a cell's index
+    is not its display column, so cells cannot be positioned one by one.
+    Each cell is padded to the width of the final character at its index,
+    so everything drawn sits at the column it ends up in.
+    """
+
+    __slots__ = ("widths",)
+
+    def __init__(self, text: str):
+        super().__init__(1, max(1, len(text)))
+        self.widths = [char_width(char) for char in text]
+
+    def render(self, inline: bool = False) -> str:
+        if not self._spans:
+            return ""
+        self._spans = []
+        self._dirty[0] = 0
+        self._dirty_rows = []
+        parts = []
+        for code, width in zip(self.codes, self.widths):
+            char = chr(code)
+            pad = width - char_width(char)
+            if pad >= 0:
+                parts.append(char + " " * pad)
+            elif char != " ":
+                # A placeholder for a zero-width character takes no column
+                parts.append(char)
+        return "\r" + "".join(parts) + "\033[K"
+
+
+def _line_screen(player, width, shown="", text=""):
+    """
+    One-row buffer for effects that change a few cells per frame.
+
+    The line is cleared and *shown* is written once; after that each frame
+    is ``screen.render(inline=True)``, which only emits the changed cells.
+    If *text* (the effect's final text) has characters that are not one
+    column wide, every frame redraws the whole line instead.
+    """
+    narrow = (text.isascii() and text.isprintable()) or all(
+        char_width(char) == 1 for char in text
+    )
+    screen = ScreenBuffer(1, max(1, width)) if narrow else _RedrawLine(text)
+    screen.blit(0, 0, shown)
+    screen.render()
+    player.out.write("\r\033[K" + shown + "\r")
+    return screen
+
+
+def animated_line(text, delay=0.05, duration=None, easing="linear", fps=60,
+                  stream=None, clock=None):
     """
     Typing effect animation from left to right.
 
     Args:
         text (str): Text to display.
         delay (float): Delay between each character (seconds).
+        duration (float): Total run time in seconds; frames then come at
+            *fps* regardless of text length (*delay* is ignored).
+        easing: Easing name (``'linear'``, ``'ease_in'``, ``'ease_out'``,
+            ``'ease_in_out'``, ``'ease'``) or function of progress t.
+        fps (int): Frame rate used with *duration*.
+        stream: Output target — text stream, binary stream or file
+            descriptor (defaults to ``sys.stdout``).
+        clock: Clock used for pacing (defaults to the real monotonic clock).
     """
     delay = validate_delay(delay)
-    for i in range(len(text) + 1):
-        sys.stdout.write("\r" + text[:i])
-        sys.stdout.flush()
-        time.sleep(delay)
-    print()
+    player = _Player(stream, clock)
+    for i in _progress(player, len(text), delay, duration, easing, fps):
+        player.frame("\r" + text[:i])
+    player.end()
 
 
-def animated_line_dual(text, delay=0.1):
+def animated_line_dual(text, delay=0.1, duration=None, easing="linear", fps=60,
+                       stream=None, clock=None):
     """
     Animation appearing from both sides to center.
 
     Args:
         text (str): Text to display.
         delay (float): Delay between each step (seconds).
+        duration (float): Total run time in seconds; frames then come at
+            *fps* regardless of text length (*delay* is ignored).
+        easing: Easing name (``'linear'``, ``'ease_in'``, ``'ease_out'``,
+            ``'ease_in_out'``, ``'ease'``) or function of progress t.
+        fps (int): Frame rate used with *duration*.
+        stream: Output target — text stream, binary stream or file
+            descriptor (defaults to ``sys.stdout``).
+        clock: Clock used for pacing (defaults to the real monotonic clock).
     """
     delay = validate_delay(delay)
+    player = _Player(stream, clock)
     length = len(text)
-    for i in range(length // 2 + 1):
+    for i in _progress(player, length // 2, delay, duration, easing, fps):
         left_part = text[:i]
         right_part = text[length - i:]
-        sys.stdout.write(
+        player.frame(
             "\r" + left_part
             + " " * (length - len(left_part) - len(right_part))
             + right_part
         )
-        sys.stdout.flush()
-        time.sleep(delay)
-    print()
+    player.end()
 
 
-def fade_in_text(text, delay=0.2):
+def fade_in_text(text, delay=0.2, stream=None, clock=None):
     """
     Text fade-in effect from dim to bright.
 
     Args:
         text (str): Text to display.
         delay (float): Delay between brightness levels (seconds).
+        stream: Output target — text stream, binary stream or file
+            descriptor (defaults to ``sys.stdout``).
+        clock: Clock used for pacing (defaults to the real monotonic clock).
     """
     delay = validate_delay(delay)
+    player = _Player(stream, clock)
     brightness_levels = [90, 37, 97]
     for level in brightness_levels:
-        sys.stdout.write(f"\r{colorize_text(text, level)}")
-        sys.stdout.flush()
-        time.sleep(delay)
-    print(text)
+        player.frame(f"\r{colorize_text(text, level)}", delay)
+    player.end(text)
 
 
-def marquee_text(text, width=30, delay=0.1):
+def marquee_text(text, width=30, delay=0.1, stream=None, clock=None):
     """
     Scrolling text effect from right to left.
 
@@ -74,17 +267,94 @@ def marquee_text(text, width=30, delay=0.1):
         text (str): Text to display.
         width (int): Display screen width.
         delay (float): Delay between each step (seconds).
+        stream: Output target — text stream, binary stream or file
+            descriptor (defaults to ``sys.stdout``).
+        clock: Clock used for pacing (defaults to the real monotonic clock).
     """
     delay = validate_delay(delay)
-    padded_text = " " * width + text + " " * width
-    for i in range(len(padded_text) - width + 1):
-        sys.stdout.write("\r" + padded_text[i:i + width])
-        sys.stdout.flush()
-        time.sleep(delay)
-    print()
+    player = _Player(stream, clock)
+    for window in _scroll(text, width):
+        player.frame("\r" + window, delay)
+    player.end()
+
+
+def _scroll(chars, width, speed=1):
+    """
+    Yield the visible *width* cells of a right-to-left scroll over *chars*.
+
+    The window is a ring buffer (``deque`` with ``maxlen=width``): each
+    shift appends the next character and drops the oldest, and input is
+    pulled only as it scrolls into view, so memory stays O(width) for any
+    length of input. The window starts and ends blank.
+    """
+    window = deque(" " * width, maxlen=width)
+    chars = itertools.chain(chars, itertools.repeat(" ", width))
+    carry = 0.0
+    yield "".join(window)
+    for step in itertools.count():
+        carry += max(0.0, speed(step) if callable(speed) else speed)
+        shift = int(carry)
+        carry -= shift
+        for moved in range(shift):
+            char = next(chars, None)
+            if char is None:
+                if moved:
+                    yield "".join(window)
+                return
+            window.append(char)
+        yield "".join(window)
+
+
+def marquee_stream(segments, width=30, delay=0.1, speed=1, separator="",
+                   stream=None, clock=None):
+    """
+    Scrolling marquee over text that arrives piece by piece.
+
+    Segments are read lazily from any iterable — a generator of feed
+    updates can run forever — and memory stays bounded by *width*.
+
+    Args:
+        segments: String or iterable of strings to scroll through.
+        width (int): Display screen width.
+        delay (float): Delay between each step (seconds).
+        speed: Cells scrolled per step — a number (fractions accumulate)
+            or a function of the step index returning one.
+        separator (str): Text inserted between segments.
+        stream: Output target — text stream, binary stream or file
+            descriptor (defaults to ``sys.stdout``).
+        clock: Clock used for pacing (defaults to the real monotonic clock).
 
+    Raises:
+        ValueError: If *speed* is a number that is not positive.
+    """
+    if not callable(speed) and speed <= 0:
+        raise ValueError(f"speed must be positive, got {speed!r}")
 
-def wave_text(text, delay=0.1, repeat=3):
+    delay = validate_delay(delay)
+    player = _Player(stream, clock)
+    if isinstance(segments, str):
+        chars = segments
+    else:
+        pieces = iter(segments)
+        if separator:
+            first = next(pieces, None)
+            pieces = itertools.chain(
+                () if first is None else (first,),
+                (separator + piece for piece in pieces),
+            )
+        chars = itertools.chain.from_iterable(pieces)
+    shown = None
+    for window in _scroll(chars, width, speed):
+        if window == shown:
+            # Speed below one cell per step: hold the frame
+            player.pause(delay)
+            continue
+        shown = window
+        player.frame("\r" + window, delay)
+    player.end()
+
+
+def wave_text(text, delay=0.1, repeat=3, stream=None, clock=None):
     """
     Loading effect with dots.
 
@@ -92,18 +362,20 @@ def wave_text(text, delay=0.1, repeat=3):
         text (str): Text to display.
         delay (float): Delay between each step (seconds).
         repeat (int): Number of times to repeat the effect.
+        stream: Output target — text stream, binary stream or file
+            descriptor (defaults to ``sys.stdout``).
+        clock: Clock used for pacing (defaults to the real monotonic clock).
     """
     delay = validate_delay(delay)
+    player = _Player(stream, clock)
     wave = ["", ".", "..", "..."]
     for _ in range(repeat):
         for w in wave:
-            sys.stdout.write("\r" + text + w + " " * (3 - len(w)))
-            sys.stdout.flush()
-            time.sleep(delay)
-    print()
+            player.frame("\r" + text + w + " " * (3 - len(w)), delay)
+    player.end()
 
 
-def blinking_text(text, repeat=5, delay=0.3):
+def blinking_text(text, repeat=5, delay=0.3, stream=None, clock=None):
     """
     Blinking warning effect.
 
@@ -111,57 +383,77 @@ def blinking_text(text, repeat=5, delay=0.3):
         text (str): Text to display.
         repeat (int): Number of blinks.
         delay (float): Delay between each blink (seconds).
+        stream: Output target — text stream, binary stream or file
+            descriptor (defaults to ``sys.stdout``).
+        clock: Clock used for pacing (defaults to the real monotonic clock).
     """
     delay = validate_delay(delay)
+    player = _Player(stream, clock)
     for _ in range(repeat):
-        sys.stdout.write("\r" + text)
-        sys.stdout.flush()
-        time.sleep(delay)
-        sys.stdout.write("\r" + " " * len(text))
-        sys.stdout.flush()
-        time.sleep(delay)
-    print(text)
+        player.frame("\r" + text, delay)
+        player.frame("\r" + " " * len(text), delay)
+    player.end(text)
 
 
-def random_fill(text, delay=0.1):
+def random_fill(text, delay=0.1, duration=None, easing="linear", fps=60,
+                stream=None, clock=None):
     """
     Characters appear randomly one by one.
 
     Args:
         text (str): Text to display.
         delay (float): Delay between each character (seconds).
+        duration (float): Total run time in seconds; frames then come at
+            *fps* regardless of text length (*delay* is ignored).
+        easing: Easing name (``'linear'``, ``'ease_in'``, ``'ease_out'``,
+            ``'ease_in_out'``, ``'ease'``) or function of progress t.
+        fps (int): Frame rate used with *duration*.
+        stream: Output target — text stream, binary stream or file
+            descriptor (defaults to ``sys.stdout``).
+        clock: Clock used for pacing (defaults to the real monotonic clock).
     """
     delay = validate_delay(delay)
-    result = [" "] * len(text)
-    indices = list(range(len(text)))
-    while indices:
-        idx = random.choice(indices)
-        result[idx] = text[idx]
-        sys.stdout.write("\r" + "".join(result))
-        sys.stdout.flush()
-        indices.remove(idx)
-        time.sleep(delay)
-    print()
-
-
-def reverse_text(text, delay=0.2):
+    player = _Player(stream, clock)
+    screen = _line_screen(player, len(text), text=text)
+    order = list(range(len(text)))
+    random.shuffle(order)
+    shown = 0
+    for count in _progress(player, len(text), delay, duration, easing, fps,
+                           first=1):
+        for idx in order[shown:count]:
+            screen.put(0, idx, text[idx])
+        shown = count
+        player.frame(screen.render(inline=True))
+    player.frame("\r" + text)
+    player.end()
+
+
+def reverse_text(text, delay=0.2, duration=None, easing="linear", fps=60,
+                 stream=None, clock=None):
     """
     Text appears from right to left.
 
     Args:
         text (str): Text to display.
         delay (float): Delay between each character (seconds).
+        duration (float): Total run time in seconds; frames then come at
+            *fps* regardless of text length (*delay* is ignored).
+        easing: Easing name (``'linear'``, ``'ease_in'``, ``'ease_out'``,
+            ``'ease_in_out'``, ``'ease'``) or function of progress t.
+        fps (int): Frame rate used with *duration*.
+        stream: Output target — text stream, binary stream or file
+            descriptor (defaults to ``sys.stdout``).
+        clock: Clock used for pacing (defaults to the real monotonic clock).
     """
     delay = validate_delay(delay)
-    reversed_text = text[::-1]
-    for i in range(len(text) + 1):
-        sys.stdout.write("\r" + reversed_text[:i][::-1])
-        sys.stdout.flush()
-        time.sleep(delay)
-    print()
+    player = _Player(stream, clock)
+    length = len(text)
+    for i in _progress(player, length, delay, duration, easing, fps):
+        player.frame("\r" + text[length - i:])
+    player.end()
 
 
-def rotate_text(text, delay=0.2, cycles=10):
+def rotate_text(text, delay=0.2, cycles=10, stream=None, clock=None):
     """
     Loading effect with rotating characters | / - \\.
 
@@ -169,18 +461,20 @@ def rotate_text(text, delay=0.2, cycles=10):
         text (str): Text to display.
         delay (float): Delay between each frame (seconds).
         cycles (int): Number of complete rotation cycles.
+        stream: Output target — text stream, binary stream or file
+            descriptor (defaults to ``sys.stdout``).
+        clock: Clock used for pacing (defaults to the real monotonic clock).
     """
     delay = validate_delay(delay)
+    player = _Player(stream, clock)
     rotations = ["|", "/", "-", "\\"]
     for _ in range(cycles):
         for rot in rotations:
-            sys.stdout.write(f"\r{rot} {text}")
-            sys.stdout.flush()
-            time.sleep(delay)
-    print()
+            player.frame(f"\r{rot} {text}", delay)
+    player.end()
 
 
-def _animated_fade_dual(text, delay=0.1):
+def _animated_fade_dual(player, text, delay=0.1):
     """Fade-in effect appearing from both ends to center."""
     length = len(text)
     brightness_levels = [90, 37, 97]
@@ -190,36 +484,35 @@ def _animated_fade_dual(text, delay=0.1):
         brightness = brightness_levels[min(i, num_brightness_levels - 1)]
         left_part = text[:i]
         right_part = text[length - i:]
-        clear_line()
-        sys.stdout.write(
-            f"\033[{brightness}m"
+        player.frame(
+            "\r\033[K"
+            + f"\033[{brightness}m"
             + left_part
             + " " * (length - len(left_part) - len(right_part))
             + right_part
-            + "\033[0m"
+            + "\033[0m",
+            delay,
         )
-        sys.stdout.flush()
-        time.sleep(delay)
 
 
-def _fade_out_dual(text, delay=0.1):
+def _fade_out_dual(player, text, delay=0.1):
     """Fade-out effect disappearing from center to both ends."""
     length = len(text)
     for i in range(length // 2 + 1):
         left_part = text[:length // 2 - i]
         right_part = text[length // 2 + i:]
-        clear_line()
-        sys.stdout.write(
-            left_part
+        player.frame(
+            "\r\033[K"
+            + left_part
             + " " * (length - len(left_part) - len(right_part))
-            + right_part
+            + right_part,
+            delay,
         )
-        sys.stdout.flush()
-        time.sleep(delay)
-    clear_line()
+    player.frame("\r\033[K")
 
 
-def combined_animation_simultaneous(text, delay=0.1, pause=0.5):
+def combined_animation_simultaneous(text, delay=0.1, pause=0.5, stream=None,
+                                    clock=None):
     """
     Combined appear and disappear effect (both sides).
 
@@ -227,13 +520,17 @@ def combined_animation_simultaneous(text, delay=0.1, pause=0.5):
         text (str): Text to display.
         delay (float): Delay between each step (seconds).
         pause (float): Pause time between fade-in and fade-out (seconds).
+        stream: Output target — text stream, binary stream or file
+            descriptor (defaults to ``sys.stdout``).
+        clock: Clock used for pacing (defaults to the real monotonic clock).
     """
-    _animated_fade_dual(text, delay=validate_delay(delay))
-    time.sleep(validate_delay(pause))
-    _fade_out_dual(text, delay=validate_delay(delay))
+    player = _Player(stream, clock)
+    _animated_fade_dual(player, text, delay=validate_delay(delay))
+    player.pause(validate_delay(pause))
+    _fade_out_dual(player, text, delay=validate_delay(delay))
 
 
-def glitch_text(text, delay=0.05, intensity=3):
+def glitch_text(text, delay=0.05, intensity=3, stream=None, clock=None):
     """
     Digital glitch effect with random character swaps.
 
@@ -241,68 +538,73 @@ def glitch_text(text, delay=0.05, intensity=3):
         text (str): Text to display.
         delay (float): Delay between glitch frames (seconds).
         intensity (int): Number of glitch iterations before resolving.
+        stream: Output target — text stream, binary stream or file
+            descriptor (defaults to ``sys.stdout``).
+        clock: Clock used for pacing (defaults to the real monotonic clock).
     """
     delay = validate_delay(delay)
+    player = _Player(stream, clock)
     glitch_chars = "!@#$%^&*()_+-=[]{}|;:,.<>?"
 
-    for _ in range(intensity):
+    for _ in range(intensity if text else 0):
         glitched = list(text)
         num_glitches = random.randint(1, max(1, len(text) // 3))
         for _ in range(num_glitches):
             pos = random.randint(0, len(text) - 1)
             glitched[pos] = random.choice(glitch_chars)
-        sys.stdout.write("\r" + "".join(glitched))
-        sys.stdout.flush()
-        time.sleep(delay)
+        player.frame("\r" + "".join(glitched), delay)
 
-    sys.stdout.write("\r" + text)
-    sys.stdout.flush()
-    print()
+    player.frame("\r" + text)
+    player.end()
 
 
-def rainbow_text(text, delay=0.1):
+def rainbow_text(text, delay=0.1, stream=None, clock=None):
     """
     Cycles through rainbow colors using ANSI codes.
 
     Args:
         text (str): Text to display.
         delay (float): Delay between color changes (seconds).
+        stream: Output target — text stream, binary stream or file
+            descriptor (defaults to ``sys.stdout``).
+        clock: Clock used for pacing (defaults to the real monotonic clock).
     """
     delay = validate_delay(delay)
+    player = _Player(stream, clock)
     colors = [31, 33, 32, 36, 34, 35]  # Red, Yellow, Green, Cyan, Blue, Magenta
     for color in colors:
-        sys.stdout.write(f"\r{colorize_text(text, color)}")
-        sys.stdout.flush()
-        time.sleep(delay)
-    print()
+        player.frame(f"\r{colorize_text(text, color)}", delay)
+    player.end()
 
 
-def matrix_reveal(text, delay=0.05):
+def matrix_reveal(text, delay=0.05, stream=None, clock=None):
     """
     Matrix-style cascading reveal effect.
 
     Args:
         text (str): Text to display.
         delay (float): Delay between each character scramble step (seconds).
+        stream: Output target — text stream, binary stream or file
+            descriptor (defaults to ``sys.stdout``).
+        clock: Clock used for pacing (defaults to the real monotonic clock).
     """
     delay = validate_delay(delay)
+    player = _Player(stream, clock)
     chars = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789@#$%"
-    result = list(text)
+    screen = _line_screen(player, len(text), text, text=text)
 
     for i in range(len(text)):
         for _ in range(random.randint(3, 8)):
-            temp = result.copy()
-            temp[i] = random.choice(chars)
-            sys.stdout.write("\r" + "".join(temp))
-            sys.stdout.flush()
-            time.sleep(delay)
-        result[i] = text[i]
-        sys.stdout.write("\r" + "".join(result))
-        sys.stdout.flush()
-    print()
+            screen.put(0, i, random.choice(chars))
+            player.frame(screen.render(inline=True), delay)
+        screen.put(0, i, text[i])
+        player.frame(screen.render(inline=True))
+    player.frame("\r" + text)
+    player.end()
 
 
-def typewriter_advanced(text, delay=0.08, mistake_probability=0.15):
+def typewriter_advanced(text, delay=0.08, mistake_probability=0.15, stream=None,
+                        clock=None):
     """
     Realistic typing with occasional mistakes and corrections.
 
@@ -310,8 +612,12 @@ def typewriter_advanced(text, delay=0.08, mistake_probability=0.15):
         text (str): Text to display.
         delay (float): Base delay between characters (seconds).
         mistake_probability (float): Probability of making a typing mistake (0.0–1.0).
+        stream: Output target — text stream, binary stream or file
+            descriptor (defaults to ``sys.stdout``).
+        clock: Clock used for pacing (defaults to the real monotonic clock).
     """
     delay = validate_delay(delay)
+    player = _Player(stream, clock)
     mistake_probability = max(0.0, min(1.0, mistake_probability))
     result = ""
     i = 0
@@ -320,48 +626,129 @@ def typewriter_advanced(text, delay=0.08, mistake_probability=0.15):
         if random.random() < mistake_probability and i > 0:
             wrong_char = random.choice("qwertyuiopasdfghjklzxcvbnm")
             result += wrong_char
-            sys.stdout.write("\r" + result)
-            sys.stdout.flush()
-            time.sleep(delay)
+            player.frame("\r" + result, delay)
 
             result = result[:-1]
-            sys.stdout.write("\r" + result + " ")
-            sys.stdout.flush()
-            time.sleep(delay * 0.5)
+            player.frame("\r" + result + " ", delay * 0.5)
 
         result += text[i]
-        sys.stdout.write("\r" + result)
-        sys.stdout.flush()
         # Clamp jitter so sleep is always non-negative
         jitter = random.uniform(-0.02, 0.04)
-        time.sleep(max(0.0, delay + jitter))
+        player.frame("\r" + result, max(0.0, delay + jitter))
         i += 1
-    print()
+    player.end()
+
+
+class _VerticalRegion:
+    """
+    Fixed-height block of rows below the cursor for vertical-motion effects.
+
+    The rows are reserved once up front; after that each frame returns to
+    the saved top-left corner, clears only the row it drew last and draws
+    the new row, so nothing scrolls and every frame costs a bounded number
+    of bytes.
+    """
+
+    def __init__(self, player, height):
+        self.player = player
+        self.height = max(1, height)
+        self.row = None
+
+    def reserve(self):
+        """Make room for the region and remember its top-left corner."""
+        if self.height > 1:
+            self.player.out.write("\n" * (self.height - 1) + f"\033[{self.height - 1}A")
+        self.player.out.write("\r\0337")
+
+    def _goto(self, row):
+        return "\0338" + (f"\033[{row}B" if row else "")
+
+    def draw(self, row, line, delay):
+        """Move *line* to *row* (0 is the top) and hold it for *delay* seconds."""
+        parts = []
+        if self.row is not None and self.row != row:
+            parts.append(self._goto(self.row) + "\033[2K")
+        parts.append(self._goto(row) + "\033[2K" + line)
+        self.row = row
+        self.player.frame("".join(parts), delay)
+
+    def finish(self):
+        """Leave the cursor on the line below the last drawn row."""
+        row = 0 if self.row is None else self.row
+        if row + 1 < self.height:
+            self.player.frame(self._goto(row + 1) + "\r")
+        else:
+            self.player.end()
 
 
-def bounce_text(text, delay=0.1, bounces=3):
+def bounce_text(text, delay=0.1, bounces=3, stream=None, clock=None):
     """
-    Bouncing animation using vertical spacing.
+    Bouncing animation inside a fixed four-row region.
 
     Args:
         text (str): Text to display.
         delay (float): Delay between bounce frames (seconds).
         bounces (int): Number of complete bounce cycles.
+        stream: Output target — text stream, binary stream or file
+            descriptor (defaults to ``sys.stdout``).
+        clock: Clock used for pacing (defaults to the real monotonic clock).
     """
     delay = validate_delay(delay)
+    player = _Player(stream, clock)
     heights = [0, 1, 2, 3, 2, 1, 0]
+    region = _VerticalRegion(player, max(heights) + 1)
+    region.reserve()
 
     for _ in range(bounces):
         for height in heights:
-            sys.stdout.write("\r" + "\n" * height + text + "\033[K")
-            sys.stdout.flush()
-            time.sleep(delay)
-            if height > 0:
-                sys.stdout.write(f"\033[{height}A")
-    print()
+            region.draw(height, text, delay)
+    region.draw(0, text, 0)
+    region.finish()
+
+
+def drop_text(text, delay=0.05, height=5, stream=None, clock=None):
+    """
+    Text falls from the top to the bottom of a fixed-height region.
+
+    Args:
+        text (str): Text to display.
+        delay (float): Delay between each row (seconds).
+        height (int): Number of rows the text falls through.
+        stream: Output target — text stream, binary stream or file
+            descriptor (defaults to ``sys.stdout``).
+        clock: Clock used for pacing (defaults to the real monotonic clock).
+    """
+    delay = validate_delay(delay)
+    player = _Player(stream, clock)
+    region = _VerticalRegion(player, height)
+    region.reserve()
+    for row in range(region.height):
+        region.draw(row, text, delay)
+    region.finish()
+
 
+def rise_text(text, delay=0.05, height=5, stream=None, clock=None):
+    """
+    Text rises from the bottom to the top of a fixed-height region.
 
-def scramble_solve(text, delay=0.05, iterations=20):
+    Args:
+        text (str): Text to display.
+        delay (float): Delay between each row (seconds).
+        height (int): Number of rows the text rises through.
+        stream: Output target — text stream, binary stream or file
+            descriptor (defaults to ``sys.stdout``).
+        clock: Clock used for pacing (defaults to the real monotonic clock).
+    """
+    delay = validate_delay(delay)
+    player = _Player(stream, clock)
+    region = _VerticalRegion(player, height)
+    region.reserve()
+    for row in reversed(range(region.height)):
+        region.draw(row, text, delay)
+    region.finish()
+
+
+def scramble_solve(text, delay=0.05, iterations=20, stream=None, clock=None):
     """
     Scrambled text gradually resolving to the correct message.
 
@@ -369,27 +756,36 @@ def scramble_solve(text, delay=0.05, iterations=20):
         text (str): Text to display.
         delay (float): Delay between solve steps (seconds).
         iterations (int): Number of solving iterations.
+        stream: Output target — text stream, binary stream or file
+            descriptor (defaults to ``sys.stdout``).
+        clock: Clock used for pacing (defaults to the real monotonic clock).
     """
     delay = validate_delay(delay)
+    player = _Player(stream, clock)
     chars = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789!@#$%^&*()"
-    current = [random.choice(chars) for _ in range(len(text))]
-    solved = [False] * len(text)
+    screen = _line_screen(player, len(text), text=text)
+    for i in range(len(text)):
+        screen.put(0, i, random.choice(chars))
+    unsolved = list(range(len(text)))
 
     for iteration in range(iterations):
-        for i in range(len(text)):
-            if not solved[i]:
-                if random.random() < (iteration / iterations) or iteration == iterations - 1:
-                    current[i] = text[i]
-                    solved[i] = True
-                else:
-                    current[i] = random.choice(chars)
-        sys.stdout.write("\r" + "".join(current))
-        sys.stdout.flush()
-        time.sleep(delay)
-    print()
-
-
-def slide_in(text, delay=0.05, direction="left"):
+        # Only cells that are still scrambled are visited
+        still_unsolved = []
+        for i in unsolved:
+            if random.random() < (iteration / iterations) or iteration == iterations - 1:
+                screen.put(0, i, text[i])
+            else:
+                screen.put(0, i, random.choice(chars))
+                still_unsolved.append(i)
+        unsolved = still_unsolved
+        player.frame(screen.render(inline=True), delay)
+    if iterations > 0:
+        player.frame("\r" + text)
+    player.end()
+
+
+def slide_in(text, delay=0.05, direction="left", duration=None, easing="linear",
+             fps=60, stream=None, clock=None):
     """
     Text slides in from the specified direction.
 
@@ -397,6 +793,14 @@ def slide_in(text, delay=0.05, direction="left"):
         text (str): Text to display.
         delay (float): Delay between slide steps (seconds).
         direction (str): Direction to slide from — ``'left'`` or ``'right'``.
+        duration (float): Total run time in seconds; frames then come at
+            *fps* regardless of text length (*delay* is ignored).
+        easing: Easing name (``'linear'``, ``'ease_in'``, ``'ease_out'``,
+            ``'ease_in_out'``, ``'ease'``) or function of progress t.
+        fps (int): Frame rate used with *duration*.
+        stream: Output target — text stream, binary stream or file
+            descriptor (defaults to ``sys.stdout``).
+        clock: Clock used for pacing (defaults to the real monotonic clock).
 
     Raises:
         ValueError: If *direction* is not ``'left'`` or ``'right'``.
@@ -405,22 +809,18 @@ def slide_in(text, delay=0.05, direction="left"):
         raise ValueError(f"direction must be 'left' or 'right', got {direction!r}")
 
     delay = validate_delay(delay)
+    player = _Player(stream, clock)
     length = len(text)
 
-    if direction == "left":
-        for i in range(length + 1):
-            sys.stdout.write("\r" + " " * (length - i) + text[:i])
-            sys.stdout.flush()
-            time.sleep(delay)
-    else:
-        for i in range(length + 1):
-            sys.stdout.write("\r" + text[length - i:])
-            sys.stdout.flush()
-            time.sleep(delay)
-    print()
+    for i in _progress(player, length, delay, duration, easing, fps):
+        if direction == "left":
+            player.frame("\r" + " " * (length - i) + text[:i])
+        else:
+            player.frame("\r" + text[length - i:])
+    player.end()
 
 
-def pulse_text(text, delay=0.2, pulses=5):
+def pulse_text(text, delay=0.2, pulses=5, stream=None, clock=None):
     """
     Pulsing brightness effect cycling dim → normal → bold.
 
@@ -428,8 +828,12 @@ def pulse_text(text, delay=0.2, pulses=5):
         text (str): Text to display.
         delay (float): Delay between pulse states (seconds).
         pulses (int): Number of pulse cycles.
+        stream: Output target — text stream, binary stream or file
+            descriptor (defaults to ``sys.stdout``).
+        clock: Clock used for pacing (defaults to the real monotonic clock).
     """
     delay = validate_delay(delay)
+    player = _Player(stream, clock)
     styles = [
         f"\033[2m{text}\033[0m",   # Dim
         text,                        # Normal
@@ -438,13 +842,12 @@ def pulse_text(text, delay=0.2, pulses=5):
     ]
     for _ in range(pulses):
         for style in styles:
-            sys.stdout.write("\r" + style)
-            sys.stdout.flush()
-            time.sleep(delay)
-    print()
+            player.frame("\r" + style, delay)
+    player.end()
 
 
-def reveal_mask(text, delay=0.1, mask_char="█"):
+def reveal_mask(text, delay=0.1, mask_char="█", duration=None, easing="linear",
+                fps=60, stream=None, clock=None):
     """
     Reveal effect with a moving mask uncovering text left to right.
 
@@ -452,65 +855,97 @@ def reveal_mask(text, delay=0.1, mask_char="█"):
         text (str): Text to display.
         delay (float): Delay between reveal steps (seconds).
         mask_char (str): Character used as the mask.
+        duration (float): Total run time in seconds; frames then come at
+            *fps* regardless of text length (*delay* is ignored).
+        easing: Easing name (``'linear'``, ``'ease_in'``, ``'ease_out'``,
+            ``'ease_in_out'``, ``'ease'``) or function of progress t.
+        fps (int): Frame rate used with *duration*.
+        stream: Output target — text stream, binary stream or file
+            descriptor (defaults to ``sys.stdout``).
+        clock: Clock used for pacing (defaults to the real monotonic clock).
     """
     delay = validate_delay(delay)
-    for i in range(len(text) + 1):
+    player = _Player(stream, clock)
+    for i in _progress(player, len(text), delay, duration, easing, fps):
         display = text[:i] + mask_char * (len(text) - i)
-        sys.stdout.write("\r" + display)
-        sys.stdout.flush()
-        time.sleep(delay)
-    print()
+        player.frame("\r" + display)
+    player.end()
 
 
-def zigzag_text(text, delay=0.08):
+def zigzag_text(text, delay=0.08, duration=None, easing="linear", fps=60,
+                stream=None, clock=None):
     """
     Characters appear in zigzag pattern — even indices first, then odd.
 
     Args:
         text (str): Text to display.
         delay (float): Delay between each character (seconds).
+        duration (float): Total run time in seconds; frames then come at
+            *fps* regardless of text length (*delay* is ignored).
+        easing: Easing name (``'linear'``, ``'ease_in'``, ``'ease_out'``,
+            ``'ease_in_out'``, ``'ease'``) or function of progress t.
+        fps (int): Frame rate used with *duration*.
+        stream: Output target — text stream, binary stream or file
+            descriptor (defaults to ``sys.stdout``).
+        clock: Clock used for pacing (defaults to the real monotonic clock).
     """
     delay = validate_delay(delay)
-    result = [" "] * len(text)
+    player = _Player(stream, clock)
+    screen = _line_screen(player, len(text), text=text)
     indices = list(range(0, len(text), 2)) + list(range(1, len(text), 2))
 
-    for idx in indices:
-        result[idx] = text[idx]
-        sys.stdout.write("\r" + "".join(result))
-        sys.stdout.flush()
-        time.sleep(delay)
-    print()
+    shown = 0
+    for count in _progress(player, len(text), delay, duration, easing, fps,
+                           first=1):
+        for idx in indices[shown:count]:
+            screen.put(0, idx, text[idx])
+        shown = count
+        player.frame(screen.render(inline=True))
+    player.frame("\r" + text)
+    player.end()
 
 
-def expanding_center(text, delay=0.1):
+def expanding_center(text, delay=0.1, duration=None, easing="linear", fps=60,
+                     stream=None, clock=None):
     """
     Text expands outward from the center character.
 
     Args:
         text (str): Text to display.
         delay (float): Delay between expansion steps (seconds).
+        duration (float): Total run time in seconds; frames then come at
+            *fps* regardless of text length (*delay* is ignored).
+        easing: Easing name (``'linear'``, ``'ease_in'``, ``'ease_out'``,
+            ``'ease_in_out'``, ``'ease'``) or function of progress t.
+        fps (int): Frame rate used with *duration*.
+        stream: Output target — text stream, binary stream or file
+            descriptor (defaults to ``sys.stdout``).
+        clock: Clock used for pacing (defaults to the real monotonic clock).
     """
     delay = validate_delay(delay)
+    player = _Player(stream, clock)
+    if not text:
+        player.end()
+        return
     center = len(text) // 2
-    result = [" "] * len(text)
-    result[center] = text[center]
-
-    sys.stdout.write("\r" + "".join(result))
-    sys.stdout.flush()
-    time.sleep(delay)
+    screen = _line_screen(player, len(text), text=text)
+    screen.put(0, center, text[center])
 
-    for offset in range(1, max(center, len(text) - center) + 1):
-        if center - offset >= 0:
-            result[center - offset] = text[center - offset]
-        if center + offset < len(text):
-            result[center + offset] = text[center + offset]
-        sys.stdout.write("\r" + "".join(result))
-        sys.stdout.flush()
-        time.sleep(delay)
-    print()
+    shown = 0
+    steps = max(center, len(text) - center)
+    for count in _progress(player, steps, delay, duration, easing, fps):
+        for offset in range(shown + 1, count + 1):
+            if center - offset >= 0:
+                screen.put(0, center - offset, text[center - offset])
+            if center + offset < len(text):
+                screen.put(0, center + offset, text[center + offset])
+        shown = count
+        player.frame(screen.render(inline=True))
+    player.frame("\r" + text)
+    player.end()
 
 
-def neon_flicker(text, delay=0.1, flickers=8):
+def neon_flicker(text, delay=0.1, flickers=8, stream=None, clock=None):
     """
     Neon-style flicker effect with color and brightness variation.
 
@@ -518,19 +953,20 @@ def neon_flicker(text, delay=0.1, flickers=8):
         text (str): Text to display.
         delay (float): Delay between flicker states (seconds).
         flickers (int): Number of flicker events before settling.
+        stream: Output target — text stream, binary stream or file
+            descriptor (defaults to ``sys.stdout``).
+        clock: Clock used for pacing (defaults to the real monotonic clock).
     """
     delay = validate_delay(delay)
+    player = _Player(stream, clock)
     neon_color = 35  # Magenta
 
     for _ in range(flickers):
         if random.random() < 0.3:
-            sys.stdout.write("\r" + " " * len(text))
+            player.frame("\r" + " " * len(text), delay)
         else:
             brightness = random.choice([0, 1, 2])
-            sys.stdout.write(f"\r\033[{brightness};{neon_color}m{text}\033[0m")
-        sys.stdout.flush()
-        time.sleep(delay)
+            player.frame(f"\r\033[{brightness};{neon_color}m{text}\033[0m", delay)
 
-    sys.stdout.write(f"\r\033[1;{neon_color}m{text}\033[0m")
-    sys.stdout.flush()
-    print()
+    player.frame(f"\r\033[1;{neon_color}m{text}\033[0m")
+    player.end()
@@ -0,0 +1,193 @@
+"""
+Command-line entry point that animates lines piped through stdin
+
+Example::
+
+    build.sh | python -m smooth_text_animation --effect typewriter --fps 60
+"""
+
+import argparse
+import queue
+import sys
+import threading
+import time
+
+from .registry import available_effects, get_effect
+
+
+class _LineReader(threading.Thread):
+    """
+    Reads stdin on its own thread so the producer never waits on animation.
+
+    Lines go into a bounded queue together with their arrival time; the
+    reader only blocks when the queue is full, which keeps memory bounded.
+    ``None`` marks the end of input.
+    """
+
+    def __init__(self, stdin, max_pending: int):
+        super().__init__(name="stdin-reader", daemon=True)
+        self.stdin = stdin
+        self.lines = queue.Queue(maxsize=max(1, max_pending))
+        self.arrived = threading.Event()
+        self.finished = False
+
+    def run(self):
+        try:
+            for line in iter(self.stdin.readline, ""):
+                self.lines.put((time.monotonic(), line))
+                self.arrived.set()
+        finally:
+            self.finished = True
+            self.lines.put((time.monotonic(), None))
+            self.arrived.set()
+
+    def pending(self) -> bool:
+        """Whether more lines are waiting (the end marker does not count)."""
+        return self.lines.qsize() > (1 if self.finished else 0)
+
+
+class _Budget:
+    """
+    Clock and output stream for animating one line within its budget.
+
+    Sleeping stops as soon as more input is waiting or the line's latency
+    budget runs out. From then on the remaining frames are dropped and
+    the line is drawn in its final state instead.
+
+    A newline at the end of a write is held back until the next one, so
+    the effect's own line ending can be replaced by the final redraw.
+    """
+
+    def __init__(self, out, reader: _LineReader, expires: float):
+        self.out = out
+        self.reader = reader
+        self.expires = expires
+        self.skipping = False
+        self._newline = False
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def sleep_until(self, deadline: float):
+        while not self.skipping:
+            now = time.monotonic()
+            if self.reader.pending() or now >= self.expires:
+                self.skipping = True
+                return
+            if now >= deadline:
+                return
+            self.reader.arrived.wait(min(deadline, self.expires) - now)
+            self.reader.arrived.clear()
+
+    def write(self, text: str) -> int:
+        if text and not self.skipping:
+            data = "\n" + text if self._newline else text
+            self._newline = data.endswith("\n")
+            self.out.write(data[:-1] if self._newline else data)
+        return len(text)
+
+    def flush(self):
+        if not self.skipping:
+            self.out.flush()
+
+    def isatty(self) -> bool:
+        try:
+            return self.out.isatty()
+        except (AttributeError, ValueError):
+            return False
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m smooth_text_animation",
+        description="Animate lines read from stdin without slowing the producer down.",
+    )
+    parser.add_argument("--effect", "-e", default="typewriter",
+                        help="effect name (see --list; default: typewriter)")
+    parser.add_argument("--fps", type=float, default=30.0,
+                        help="frames per second (default: 30)")
+    parser.add_argument("--block-heads", action="store_true",
+                        help="animate only the first line of each blank-line "
+                             "separated block and print the rest plainly")
+    parser.add_argument("--max-latency", type=float, default=1.0,
+                        help="longest time in seconds a line may spend animating "
+                             "before it is printed in full (default: 1.0)")
+    parser.add_argument("--max-pending", type=int, default=1000,
+                        help="lines buffered before reading stdin pauses "
+                             "(default: 1000)")
+    parser.add_argument("--force", action="store_true",
+                        help="animate even when stdout is not a terminal")
+    parser.add_argument("--list", action="store_true",
+                        help="list available effects and exit")
+    return parser
+
+
+def _passthrough(stdin, stdout):
+    for line in iter(stdin.readline, ""):
+        stdout.write(line)
+        stdout.flush()
+
+
+def main(argv=None, stdin=None, stdout=None) -> int:
+    """
+    Run the command-line interface.
+
+    Args:
+        argv (list): Arguments without the program name (``sys.argv[1:]`` if None).
+        stdin: Input text stream (defaults to ``sys.stdin``).
+        stdout: Output text stream (defaults to ``sys.stdout``).
+
+    Returns:
+        int: Process exit status.
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    stdin = sys.stdin if stdin is None else stdin
+    stdout = sys.stdout if stdout is None else stdout
+
+    if args.list:
+        stdout.write("\n".join(available_effects()) + "\n")
+        return 0
+    try:
+        effect = get_effect(args.effect)
+    except ValueError as exc:
+        parser.error(str(exc))
+    if args.fps <= 0:
+        parser.error("--fps must be positive")
+
+    try:
+        if not (args.force or stdout.isatty()):
+            _passthrough(stdin, stdout)
+            return 0
+
+        reader = _LineReader(stdin, args.max_pending)
+        reader.start()
+        delay = 1.0 / args.fps
+        in_block = False
+        while True:
+            arrived, line = reader.lines.get()
+            if line is None:
+                return 0
+            text = line.rstrip("\r\n")
+            first_in_block = not in_block
+            in_block = bool(text.strip())
+            if args.block_heads and not first_in_block:
+                wanted = False
+            else:
+                wanted = bool(text.strip())
+            expires = arrived + args.max_latency
+            if not wanted or reader.pending() or time.monotonic() >= expires:
+                # Behind or nothing to animate: print the line as it came
+                stdout.write(line if line.endswith("\n") else line + "\n")
+                stdout.flush()
+                continue
+            budget = _Budget(stdout, reader, expires)
+            effect(text, delay=delay, stream=budget, clock=budget)
+            # Whatever state the effect ended in (erased, scrolled away,
+            # decorated), the line itself always reaches the output
+            stdout.write("\r\033[K" + text + "\n")
+            stdout.flush()
+    except KeyboardInterrupt:
+        return 130
+    except BrokenPipeError:
+        return 0
@@ -0,0 +1,104 @@
+"""
+Clocks used to pace animations
+"""
+
+import time
+from typing import List, Tuple
+
+
+class MonotonicClock:
+    """Real time, read from ``time.monotonic``."""
+
+    def now(self) -> float:
+        """Current time in seconds."""
+        return time.monotonic()
+
+    def sleep(self, seconds: float):
+        """
+        Block for *seconds*.
+
+        Args:
+            seconds (float): Time to sleep (ignored if not positive).
+        """
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def sleep_until(self, deadline: float):
+        """
+        Block until ``now()`` reaches *deadline*.
+
+        Args:
+            deadline (float): Target time on this clock.
+        """
+        self.sleep(deadline - self.now())
+
+
+class VirtualClock:
+    """
+    Simulated time that advances instantly when slept on.
+
+    Every sleep is recorded in :attr:`schedule` as ``(start, end)`` pairs,
+    so tests can check exact timing without waiting for it.
+
+    Args:
+        start (float): Initial time in seconds.
+    """
+
+    def __init__(self, start: float = 0.0):
+        self._now = float(start)
+        self.schedule: List[Tuple[float, float]] = []
+
+    def now(self) -> float:
+        """Current simulated time in seconds."""
+        return self._now
+
+    def sleep(self, seconds: float):
+        """
+        Advance the clock by *seconds* and record the sleep.
+
+        Args:
+            seconds (float): Time to sleep (ignored if not positive).
+        """
+        if seconds > 0:
+            start = self._now
+            self._now += seconds
+            self.schedule.append((start, self._now))
+
+    def sleep_until(self, deadline: float):
+        """
+        Advance the clock to *deadline* if it lies in the future.
+
+        Args:
+            deadline (float): Target time on this clock.
+        """
+        self.sleep(deadline - self._now)
+
+    def advance(self, seconds: float):
+        """
+        Move time forward without recording a sleep (e.g. simulated work).
+
+        Args:
+            seconds (float): Time to add.
+        """
+        self._now += max(0.0, seconds)
+
+    @property
+    def durations(self) -> List[float]:
+        """Length of every recorded sleep, in order."""
+        return [end - start for start, end in self.schedule]
+
+
+_default_clock = MonotonicClock()
+
+
+def resolve_clock(clock=None):
+    """
+    Return *clock*, or the shared real clock if None
+
+    Args:
+        clock: Object with ``now()`` and ``sleep_until()``, or None
+
+    Returns:
+        Clock to use
+    """
+    return _default_clock if clock is None else clock
@@ -0,0 +1,130 @@
+"""
+Easing curves that map linear progress to animated progress
+"""
+
+from typing import Callable, Dict, Union
+
+Easing = Callable[[float], float]
+
+
+def linear(t: float) -> float:
+    """Constant speed."""
+    return t
+
+
+def ease_in(t: float) -> float:
+    """Start slowly and speed up (quadratic)."""
+    return t * t
+
+
+def ease_out(t: float) -> float:
+    """Start quickly and slow down (quadratic)."""
+    return t * (2.0 - t)
+
+
+def ease_in_out(t: float) -> float:
+    """Slow at both ends, fastest in the middle (cubic)."""
+    if t < 0.5:
+        return 4.0 * t * t * t
+    u = 2.0 * t - 2.0
+    return 0.5 * u * u * u + 1.0
+
+
+def cubic_bezier(x1: float, y1: float, x2: float, y2: float) -> Easing:
+    """
+    Build a CSS-style ``cubic-bezier(x1, y1, x2, y2)`` easing.
+
+    The curve runs from (0, 0) to (1, 1) with control points (x1, y1) and
+    (x2, y2). *y1* and *y2* may lie outside [0, 1] for overshoot.
+
+    Args:
+        x1 (float): First control point x (0–1).
+        y1 (float): First control point y.
+        x2 (float): Second control point x (0–1).
+        y2 (float): Second control point y.
+
+    Returns:
+        callable: Easing function of t in [0, 1].
+
+    Raises:
+        ValueError: If *x1* or *x2* is outside [0, 1].
+    """
+    if not (0.0 <= x1 <= 1.0 and 0.0 <= x2 <= 1.0):
+        raise ValueError("x1 and x2 must be between 0 and 1")
+
+    # Polynomial coefficients of B(s) = ((a*s + b)*s + c)*s
+    cx = 3.0 * x1
+    bx = 3.0 * (x2 - x1) - cx
+    ax = 1.0 - cx - bx
+    cy = 3.0 * y1
+    by = 3.0 * (y2 - y1) - cy
+    ay = 1.0 - cy - by
+
+    def curve_x(s):
+        return ((ax * s + bx) * s + cx) * s
+
+    def solve(t):
+        # Newton's method first, bisection if the slope is too flat
+        s = t
+        for _ in range(8):
+            error = curve_x(s) - t
+            if abs(error) < 1e-7:
+                return s
+            slope = (3.0 * ax * s + 2.0 * bx) * s + cx
+            if abs(slope) < 1e-6:
+                break
+            s -= error / slope
+        low, high = 0.0, 1.0
+        s = t
+        while high - low > 1e-7:
+            if curve_x(s) < t:
+                low = s
+            else:
+                high = s
+            s = (low + high) / 2.0
+        return s
+
+    def ease(t: float) -> float:
+        if t <= 0.0:
+            return 0.0
+        if t >= 1.0:
+            return 1.0
+        s = solve(t)
+        return ((ay * s + by) * s + cy) * s
+
+    return ease
+
+
+EASINGS: Dict[str, Easing] = {
+    "linear": linear,
+    "ease_in": ease_in,
+    "ease_out": ease_out,
+    "ease_in_out": ease_in_out,
+    # CSS's "ease"
+    "ease": cubic_bezier(0.25, 0.1, 0.25, 1.0),
+}
+
+
+def resolve_easing(easing: Union[str, Easing, None] = None) -> Easing:
+    """
+    Return an easing function from a name or callable.
+
+    Args:
+        easing: Name from :data:`EASINGS`, a function of t, or None for linear.
+
+    Returns:
+        callable: Easing function.
+
+    Raises:
+        ValueError: If *easing* is an unknown name.
+    """
+    if easing is None:
+        return linear
+    if callable(easing):
+        return easing
+    try:
+        return EASINGS[easing]
+    except KeyError:
+        raise ValueError(
+            f"unknown easing {easing!r}; choose from: {', '.join(sorted(EASINGS))}"
+        ) from None
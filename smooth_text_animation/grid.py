@@ -0,0 +1,602 @@
+"""
+Whole-grid frames for full-screen effects, vectorised with NumPy when available
+"""
+
+import math
+import random
+from abc import ABC, abstractmethod
+from array import array
+from typing import List, Sequence
+
+from .animations import _play_screen, _screen_size
+from .screen import Cell, StyleTable
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional; the pure-Python backend is used
+    numpy = None
+
+_SCRAMBLE_GLYPHS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789!@#$%^&*()"
+_PLASMA_GLYPHS = " .:-=+*#%@"
+
+# Dim to bright green for cells about to lock, then the locked text
+_SCRAMBLE_STYLES = ("\033[0;2;32m", "\033[0;32m", "\033[0;92m", "\033[0;97m")
+_MESSAGE_STYLE = "\033[0;1;97m"
+
+# 256-colour hue wheel used by the plasma
+_RAINBOW = (196, 202, 208, 214, 220, 226, 190, 154, 118, 82, 46, 47, 48, 49,
+            50, 51, 45, 39, 33, 27, 21, 57, 93, 129, 165, 201, 200, 199, 198, 197)
+
+_RESET = "\033[0m"
+
+
+def available_backends() -> List[str]:
+    """
+    Grid backends usable in this environment, fastest first.
+
+    Returns:
+        List[str]: ``["numpy", "python"]`` when NumPy is importable,
+        otherwise ``["python"]``.
+    """
+    return ["numpy", "python"] if numpy is not None else ["python"]
+
+
+class GridFrame(ABC):
+    """
+    Rows × cols frame of codepoints and style IDs updated a whole grid at a time.
+
+    Where :class:`~smooth_text_animation.screen.ScreenBuffer` is built for
+    effects that touch a few cells per frame, a grid frame is meant for
+    effects that change most of the screen every frame: noise masks,
+    reveal thresholds and colour ramps are applied to every cell in one
+    call. Per-cell inputs are *fields* — values in the backend's native
+    form, made by :meth:`field`, :meth:`random_field`, :meth:`text_field`
+    or :meth:`plasma` and passed back to the drawing methods.
+
+    Use :func:`grid_frame` to create one; the NumPy backend keeps the
+    frame in arrays and builds each frame's output with array operations,
+    the Python backend does the same work cell by cell. Both produce the
+    same output for the same cells.
+
+    Args:
+        rows (int): Number of rows.
+        cols (int): Number of columns.
+        styles (StyleTable): Style table to share (a new one if None).
+        seed (int): Seed for the frame's random numbers.
+    """
+
+    backend = None
+
+    def __init__(self, rows: int, cols: int, styles: StyleTable = None,
+                 seed: int = None):
+        if rows < 1 or cols < 1:
+            raise ValueError("rows and cols must be positive")
+        self.rows = rows
+        self.cols = cols
+        self.styles = styles if styles is not None else StyleTable()
+        self._moves = [f"\033[{row + 1};1H" for row in range(rows)]
+
+    def _check_size(self, count: int):
+        if count != self.rows * self.cols:
+            raise ValueError(
+                f"expected {self.rows * self.cols} values, got {count}"
+            )
+
+    def _lines(self, text: str) -> List[str]:
+        return [line[:self.cols] for line in text.split("\n")[:self.rows]]
+
+    @abstractmethod
+    def field(self, values: Sequence[float]):
+        """
+        Build a field from one value per cell, row by row.
+
+        Args:
+            values: ``rows * cols`` numbers.
+
+        Returns:
+            Field in the backend's native form.
+
+        Raises:
+            ValueError: If the number of values does not match the grid.
+        """
+
+    @abstractmethod
+    def random_field(self):
+        """Field of uniform random values in [0, 1)."""
+
+    @abstractmethod
+    def text_field(self, text: str):
+        """
+        Field of codepoints with *text* laid out from the top-left corner.
+
+        Lines are split on ``"\\n"`` and clipped to the grid; the rest is
+        spaces.
+
+        Args:
+            text (str): Text to lay out.
+        """
+
+    @abstractmethod
+    def plasma(self, t: float):
+        """
+        Field of values in [0, 1] from overlapping sine waves at time *t*.
+
+        Args:
+            t (float): Time (seconds); the pattern drifts as it grows.
+        """
+
+    @abstractmethod
+    def fill(self, char: str = " ", style: int = 0):
+        """
+        Set every cell to one character and style.
+
+        Args:
+            char (str): Fill character.
+            style (int): Style ID.
+        """
+
+    @abstractmethod
+    def scatter(self, glyphs: str, probability: float, thresholds=None,
+                progress: float = 0.0):
+        """
+        Replace a random share of cells with random glyphs (a noise mask).
+
+        Args:
+            glyphs (str): Characters to draw from.
+            probability (float): Chance that each cell is replaced.
+            thresholds: Field; if given, only cells whose threshold is
+                above *progress* (not yet revealed) are replaced.
+            progress (float): Current progress (0.0–1.0).
+        """
+
+    @abstractmethod
+    def reveal(self, target, thresholds, progress: float, style: int,
+               palette: Sequence[int] = None, window: float = 0.25):
+        """
+        Lock in target characters whose threshold has been reached.
+
+        Cells with ``threshold <= progress`` take their character from
+        *target* and *style*. If *palette* is given, the other cells are
+        styled along it by how close their threshold is: more than
+        *window* away uses the first style, about to lock the last.
+
+        Args:
+            target: Codepoint field (see :meth:`text_field`).
+            thresholds: Field of reveal thresholds in [0, 1).
+            progress (float): Current progress (0.0–1.0).
+            style (int): Style ID of revealed cells.
+            palette (Sequence[int]): Style IDs for unrevealed cells.
+            window (float): Progress range the palette is spread over.
+        """
+
+    @abstractmethod
+    def shade(self, values, glyphs: str, palette: Sequence[int],
+              shift: float = 0.0):
+        """
+        Draw a field with glyph and colour ramps.
+
+        Each cell gets the glyph at ``value * len(glyphs)`` and the style
+        at ``(value + shift) % 1 * len(palette)``.
+
+        Args:
+            values: Field of values in [0, 1].
+            glyphs (str): Glyph ramp, darkest first.
+            palette (Sequence[int]): Style IDs to cycle through.
+            shift (float): Offset into the palette (animates the colours).
+        """
+
+    @abstractmethod
+    def cell(self, row: int, col: int) -> Cell:
+        """
+        Read one cell.
+
+        Args:
+            row (int): Row index.
+            col (int): Column index.
+
+        Returns:
+            Cell: Snapshot of the cell.
+        """
+
+    @abstractmethod
+    def text(self, row: int) -> str:
+        """
+        Return the characters of a row without styles.
+
+        Args:
+            row (int): Row index.
+        """
+
+    @abstractmethod
+    def render(self) -> str:
+        """
+        Build the output that brings the terminal up to date with the frame.
+
+        Rows that changed since the last render are redrawn whole, with
+        absolute positioning and a style sequence at the start of each
+        row and wherever the style changes.
+
+        Returns:
+            str: Escape sequences and characters for the changed rows.
+        """
+
+
+class _PythonGrid(GridFrame):
+    """Grid frame on flat ``array`` storage, one cell at a time."""
+
+    backend = "python"
+
+    def __init__(self, rows, cols, styles=None, seed=None):
+        super().__init__(rows, cols, styles, seed)
+        size = rows * cols
+        self._random = random.Random(seed)
+        self.codes = array("I", [32]) * size
+        self.style_ids = array("H", [0]) * size
+        self._front_codes = array("I", [0]) * size
+        self._front_styles = array("H", [0]) * size
+        self._coords = None
+
+    def field(self, values):
+        values = [float(value) for value in values]
+        self._check_size(len(values))
+        return values
+
+    def random_field(self):
+        rand = self._random.random
+        return [rand() for _ in range(self.rows * self.cols)]
+
+    def text_field(self, text):
+        codes = array("I", [32]) * (self.rows * self.cols)
+        for row, line in enumerate(self._lines(text)):
+            start = row * self.cols
+            codes[start:start + len(line)] = array("I", map(ord, line))
+        return codes
+
+    def plasma(self, t):
+        if self._coords is None:
+            self._coords = _plasma_coords(self.rows, self.cols)
+        sin = math.sin
+        return [
+            (sin(x * 0.16 + t) + sin(y * 0.3 + t * 1.3)
+             + sin((x + y) * 0.1 + t * 0.7) + sin(d * 0.2 - t * 1.5) + 4.0) / 8.0
+            for x, y, d in self._coords
+        ]
+
+    def fill(self, char=" ", style=0):
+        size = self.rows * self.cols
+        self.codes = array("I", [ord(char)]) * size
+        self.style_ids = array("H", [style]) * size
+
+    def scatter(self, glyphs, probability, thresholds=None, progress=0.0):
+        rand = self._random.random
+        pick = self._random.randrange
+        table = [ord(glyph) for glyph in glyphs]
+        count = len(table)
+        codes = self.codes
+        for index in range(len(codes)):
+            if thresholds is not None and thresholds[index] <= progress:
+                continue
+            if rand() < probability:
+                codes[index] = table[pick(count)]
+
+    def reveal(self, target, thresholds, progress, style, palette=None,
+               window=0.25):
+        codes = self.codes
+        style_ids = self.style_ids
+        last = len(palette) - 1 if palette else 0
+        for index, threshold in enumerate(thresholds):
+            if threshold <= progress:
+                codes[index] = target[index]
+                style_ids[index] = style
+            elif palette:
+                near = 1.0 - (threshold - progress) / window
+                step = int(near * len(palette)) if near > 0 else 0
+                style_ids[index] = palette[min(step, last)]
+
+    def shade(self, values, glyphs, palette, shift=0.0):
+        table = [ord(glyph) for glyph in glyphs]
+        top = len(table) - 1
+        count = len(palette)
+        codes = self.codes
+        style_ids = self.style_ids
+        for index, value in enumerate(values):
+            step = int(value * len(table))
+            codes[index] = table[min(max(step, 0), top)]
+            style_ids[index] = palette[int((value + shift) % 1.0 * count) % count]
+
+    def cell(self, row, col):
+        index = row * self.cols + col
+        return Cell(chr(self.codes[index]), self.style_ids[index])
+
+    def text(self, row):
+        start = row * self.cols
+        return "".join(map(chr, self.codes[start:start + self.cols]))
+
+    def render(self):
+        cols = self.cols
+        codes = self.codes
+        style_ids = self.style_ids
+        sequence = self.styles.sequence
+        parts = []
+        for row in range(self.rows):
+            start = row * cols
+            stop = start + cols
+            if (codes[start:stop] == self._front_codes[start:stop]
+                    and style_ids[start:stop] == self._front_styles[start:stop]):
+                continue
+            self._front_codes[start:stop] = codes[start:stop]
+            self._front_styles[start:stop] = style_ids[start:stop]
+            parts.append(self._moves[row])
+            style = None
+            for index in range(start, stop):
+                if style_ids[index] != style:
+                    style = style_ids[index]
+                    parts.append(sequence(style))
+                parts.append(chr(codes[index]))
+        if not parts:
+            return ""
+        parts.append(_RESET)
+        return "".join(parts)
+
+
+class _NumpyGrid(GridFrame):
+    """Grid frame on 2-D NumPy arrays, every operation vectorised."""
+
+    backend = "numpy"
+
+    def __init__(self, rows, cols, styles=None, seed=None):
+        super().__init__(rows, cols, styles, seed)
+        self._rng = numpy.random.default_rng(seed)
+        self.codes = numpy.full((rows, cols), 32, dtype=numpy.uint32)
+        self.style_ids = numpy.zeros((rows, cols), dtype=numpy.uint16)
+        self._front_codes = numpy.zeros((rows, cols), dtype=numpy.uint32)
+        self._front_styles = numpy.zeros((rows, cols), dtype=numpy.uint16)
+        self._move_table = _sequence_table(self._moves)
+        self._style_table = None
+        self._coords = None
+
+    def field(self, values):
+        values = numpy.asarray(values, dtype=float).ravel()
+        self._check_size(values.size)
+        return values.reshape(self.rows, self.cols)
+
+    def random_field(self):
+        return self._rng.random((self.rows, self.cols))
+
+    def text_field(self, text):
+        codes = numpy.full((self.rows, self.cols), 32, dtype=numpy.uint32)
+        for row, line in enumerate(self._lines(text)):
+            codes[row, :len(line)] = _codepoints(line)
+        return codes
+
+    def plasma(self, t):
+        if self._coords is None:
+            y, x = numpy.mgrid[0:self.rows, 0:self.cols].astype(float)
+            y *= 2.0
+            centre_y = (self.rows - 1)
+            centre_x = (self.cols - 1) / 2.0
+            self._coords = (x, y, numpy.hypot(x - centre_x, y - centre_y))
+        x, y, d = self._coords
+        sin = numpy.sin
+        total = (sin(x * 0.16 + t) + sin(y * 0.3 + t * 1.3)
+                 + sin((x + y) * 0.1 + t * 0.7) + sin(d * 0.2 - t * 1.5))
+        return (total + 4.0) / 8.0
+
+    def fill(self, char=" ", style=0):
+        self.codes.fill(ord(char))
+        self.style_ids.fill(style)
+
+    def scatter(self, glyphs, probability, thresholds=None, progress=0.0):
+        mask = self._rng.random((self.rows, self.cols)) < probability
+        if thresholds is not None:
+            mask &= thresholds > progress
+        count = int(numpy.count_nonzero(mask))
+        if count:
+            table = _codepoints(glyphs)
+            self.codes[mask] = table[self._rng.integers(0, len(table), count)]
+
+    def reveal(self, target, thresholds, progress, style, palette=None,
+               window=0.25):
+        locked = thresholds <= progress
+        self.codes[locked] = target[locked]
+        self.style_ids[locked] = style
+        if palette:
+            waiting = ~locked
+            near = 1.0 - (thresholds[waiting] - progress) / window
+            steps = (numpy.clip(near, 0.0, None) * len(palette)).astype(numpy.intp)
+            table = numpy.asarray(palette, dtype=numpy.uint16)
+            self.style_ids[waiting] = table[numpy.minimum(steps, len(palette) - 1)]
+
+    def shade(self, values, glyphs, palette, shift=0.0):
+        table = _codepoints(glyphs)
+        steps = (values * len(table)).astype(numpy.intp)
+        self.codes[...] = table[numpy.clip(steps, 0, len(table) - 1)]
+        colours = numpy.asarray(palette, dtype=numpy.uint16)
+        steps = ((values + shift) % 1.0 * len(colours)).astype(numpy.intp)
+        self.style_ids[...] = colours[steps % len(colours)]
+
+    def cell(self, row, col):
+        return Cell(chr(self.codes[row, col]), int(self.style_ids[row, col]))
+
+    def text(self, row):
+        return self.codes[row].astype("<u4").tobytes().decode("utf-32-le")
+
+    def _styles(self):
+        if self._style_table is None or self._style_table[2] != len(self.styles):
+            count = len(self.styles)
+            codes, lengths = _sequence_table(
+                [self.styles.sequence(style) for style in range(count)]
+            )
+            self._style_table = (codes, lengths, count)
+        return self._style_table[:2]
+
+    def render(self):
+        changed = ((self.codes != self._front_codes).any(axis=1)
+                   | (self.style_ids != self._front_styles).any(axis=1))
+        rows = numpy.flatnonzero(changed)
+        if not rows.size:
+            return ""
+        self._front_codes[rows] = self.codes[rows]
+        self._front_styles[rows] = self.style_ids[rows]
+        cols = self.cols
+        chars = self.codes[rows].ravel()
+        styles = self.style_ids[rows].ravel()
+        style_codes, style_lengths = self._styles()
+        move_codes, move_lengths = self._move_table
+
+        # Every cell is its character, preceded by a cursor move if it
+        # starts a row and by a style sequence if the style changes there
+        row_starts = numpy.arange(0, chars.size, cols)
+        style_starts = numpy.ones(chars.size, dtype=bool)
+        style_starts[1:] = styles[1:] != styles[:-1]
+        style_starts[row_starts] = True
+        move_sizes = numpy.zeros(chars.size, dtype=numpy.intp)
+        move_sizes[row_starts] = move_lengths[rows]
+        style_sizes = numpy.where(style_starts, style_lengths[styles], 0)
+        ends = numpy.cumsum(1 + move_sizes + style_sizes)
+        begins = ends - (1 + move_sizes + style_sizes)
+
+        out = numpy.empty(int(ends[-1]) + len(_RESET), dtype="<u4")
+        out[ends - 1] = chars
+        _place(out, begins[row_starts], move_codes[rows], move_lengths[rows])
+        starts = numpy.flatnonzero(style_starts)
+        started = styles[starts]
+        _place(out, begins[starts] + move_sizes[starts],
+               style_codes[started], style_lengths[started])
+        out[-len(_RESET):] = _codepoints(_RESET)
+        return out.tobytes().decode("utf-32-le")
+
+
+def _codepoints(text: str):
+    """Codepoints of *text* as a NumPy array."""
+    return numpy.frombuffer(text.encode("utf-32-le"), dtype="<u4").astype(numpy.uint32)
+
+
+def _sequence_table(sequences: List[str]):
+    """Pad escape sequences into a 2-D codepoint table plus their lengths."""
+    lengths = numpy.array([len(seq) for seq in sequences], dtype=numpy.intp)
+    table = numpy.zeros((len(sequences), max(1, int(lengths.max()))), dtype="<u4")
+    for index, seq in enumerate(sequences):
+        table[index, :len(seq)] = _codepoints(seq)
+    return table, lengths
+
+
+def _place(out, positions, table, lengths):
+    """Copy each padded table row to ``out`` at its position, unpadded."""
+    offsets = numpy.arange(table.shape[1])
+    used = offsets < lengths[:, None]
+    out[(positions[:, None] + offsets)[used]] = table[used]
+
+
+def _plasma_coords(rows: int, cols: int):
+    """Per-cell (x, y, distance from the centre) with cells twice as tall as wide."""
+    centre_x = (cols - 1) / 2.0
+    centre_y = rows - 1
+    coords = []
+    for row in range(rows):
+        y = row * 2.0
+        for x in range(cols):
+            coords.append((float(x), y, math.hypot(x - centre_x, y - centre_y)))
+    return coords
+
+
+def grid_frame(rows: int, cols: int, styles: StyleTable = None,
+               backend: str = None, seed: int = None) -> GridFrame:
+    """
+    Create a grid frame on the requested backend.
+
+    Args:
+        rows (int): Number of rows.
+        cols (int): Number of columns.
+        styles (StyleTable): Style table to share (a new one if None).
+        backend (str): ``"numpy"``, ``"python"``, or None for the fastest
+            one available.
+        seed (int): Seed for the frame's random numbers.
+
+    Returns:
+        GridFrame: New frame, every cell a blank in the default style.
+
+    Raises:
+        ValueError: If *backend* is unknown.
+        ImportError: If ``"numpy"`` is requested but NumPy is not installed.
+    """
+    if backend is None:
+        backend = available_backends()[0]
+    if backend == "numpy":
+        if numpy is None:
+            raise ImportError(
+                "the numpy grid backend needs NumPy; install it or use backend='python'"
+            )
+        return _NumpyGrid(rows, cols, styles, seed)
+    if backend == "python":
+        return _PythonGrid(rows, cols, styles, seed)
+    raise ValueError(f"unknown grid backend {backend!r}; choose from: numpy, python")
+
+
+def scramble_screen(text, duration=2.0, fps=30, width=None, height=None,
+                    backend=None, stream=None, clock=None):
+    """
+    Full-screen scramble that resolves into a block of text.
+
+    Every cell starts as a random glyph and locks into its final
+    character at a random point of the run, brightening as that point
+    approaches. The text is laid out from the top-left corner, one line
+    per row — suited to revealing a whole log pane or report.
+
+    Args:
+        text (str): Text to reveal (may span several lines).
+        duration (float): Total run time (seconds).
+        fps (float): Target frame rate.
+        width (int): Columns to use (auto-detected if None).
+        height (int): Rows to use (auto-detected if None).
+        backend (str): Grid backend (see :func:`grid_frame`).
+        stream: Output target — text stream, binary stream or file
+            descriptor (defaults to ``sys.stdout``).
+        clock: Clock used for pacing (defaults to the real monotonic clock).
+    """
+    width, height = _screen_size(width, height)
+    grid = grid_frame(height, width, backend=backend)
+    palette = [grid.styles.intern(code) for code in _SCRAMBLE_STYLES]
+    message_style = grid.styles.intern(_MESSAGE_STYLE)
+    target = grid.text_field(text)
+    thresholds = grid.random_field()
+    grid.fill(" ", palette[0])
+    grid.scatter(_SCRAMBLE_GLYPHS, 1.0)
+
+    def step(frame, frames, interval):
+        progress = (frame + 1) / frames
+        grid.scatter(_SCRAMBLE_GLYPHS, 0.3, thresholds, progress)
+        grid.reveal(target, thresholds, progress, message_style, palette)
+        return grid.render()
+
+    _play_screen(grid.rows, step, duration, fps, stream, clock)
+
+
+def plasma_field(duration=3.0, fps=30, width=None, height=None,
+                 glyphs=_PLASMA_GLYPHS, backend=None, stream=None, clock=None):
+    """
+    Full-screen plasma: drifting sine-wave interference in rainbow colours.
+
+    Args:
+        duration (float): Total run time (seconds).
+        fps (float): Target frame rate.
+        width (int): Columns to use (auto-detected if None).
+        height (int): Rows to use (auto-detected if None).
+        glyphs (str): Glyph ramp from low to high values.
+        backend (str): Grid backend (see :func:`grid_frame`).
+        stream: Output target — text stream, binary stream or file
+            descriptor (defaults to ``sys.stdout``).
+        clock: Clock used for pacing (defaults to the real monotonic clock).
+    """
+    if not glyphs:
+        raise ValueError("glyphs must not be empty")
+    width, height = _screen_size(width, height)
+    grid = grid_frame(height, width, backend=backend)
+    palette = [grid.styles.intern(f"\033[0;38;5;{colour}m") for colour in _RAINBOW]
+
+    def step(frame, frames, interval):
+        t = frame * interval
+        grid.shade(grid.plasma(t), glyphs, palette, shift=t * 0.1)
+        return grid.render()
+
+    _play_screen(grid.rows, step, duration, fps, stream, clock)
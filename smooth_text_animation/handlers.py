@@ -0,0 +1,248 @@
+"""
+Logging handler that animates important records on a background thread
+"""
+
+import collections
+import logging
+import sys
+import threading
+import time
+
+from .registry import get_effect
+
+DEFAULT_EFFECTS = {
+    logging.ERROR: "glitch_text",
+}
+
+
+class _Interruptible:
+    """
+    Clock and stream for one animation that gives way to newer records.
+
+    Once another record is queued (or the handler closes) sleeping stops,
+    later frames are dropped. A newline at the end of a write is held back
+    until the next one, so the caller can always finish the record with
+    its own final redraw.
+    """
+
+    def __init__(self, handler, out):
+        self.handler = handler
+        self.out = out
+        self.skipping = False
+        self._newline = False
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def sleep_until(self, deadline: float):
+        cond = self.handler._cond
+        with cond:
+            while not self.skipping:
+                if self.handler._pending or self.handler._closed:
+                    self.skipping = True
+                    return
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                cond.wait(remaining)
+
+    def write(self, text: str) -> int:
+        if text and not self.skipping:
+            data = "\n" + text if self._newline else text
+            self._newline = data.endswith("\n")
+            self.out.write(data[:-1] if self._newline else data)
+        return len(text)
+
+    def flush(self):
+        if not self.skipping:
+            self.out.flush()
+
+    def isatty(self) -> bool:
+        try:
+            return self.out.isatty()
+        except (AttributeError, ValueError):
+            return False
+
+
+class AnimatedLogHandler(logging.Handler):
+    """
+    Handler that animates selected records without blocking the logger.
+
+    ``emit`` only formats the record and appends it to a queue; a render
+    thread writes the output. Records that arrive together are handled as
+    one burst: only the most important one (highest level, then latest)
+    is animated and the others are printed plainly, in their original
+    order. An animation also gives way as soon as a newer record is
+    queued. The time spent animating is limited by a token bucket that
+    refills at *max_animation_share* seconds per second.
+
+    The effect for a record comes from its ``animation`` attribute (set
+    with ``extra={"animation": "fade_in_text"}``, or ``False`` to print it
+    plainly). Otherwise the highest level in *effects* that the record
+    reaches decides.
+
+    Args:
+        stream: Output text stream (defaults to ``sys.stderr``).
+        effects (dict): Level → effect function or registered name
+            (defaults to ``glitch_text`` for ERROR and above).
+        delay (float): Frame delay passed to the effects (seconds).
+        max_animation_share (float): Seconds of animation allowed per second
+            of wall time, on average.
+        burst (float): Largest amount of animation time that can be saved up.
+        level (int): Minimum level handled.
+    """
+
+    def __init__(self, stream=None, effects=None, delay: float = 0.03,
+                 max_animation_share: float = 0.5, burst: float = 2.0,
+                 level: int = logging.NOTSET):
+        super().__init__(level)
+        self.stream = stream
+        self.effects = dict(DEFAULT_EFFECTS if effects is None else effects)
+        self.delay = delay
+        self.max_animation_share = max(0.0, max_animation_share)
+        self.burst = max(0.0, burst)
+        self._tokens = self.burst
+        self._refilled = time.monotonic()
+        self._pending = collections.deque()
+        self._cond = threading.Condition()
+        self._busy = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="AnimatedLogHandler",
+                                        daemon=True)
+        self._thread.start()
+
+    def _out(self):
+        return self.stream if self.stream is not None else sys.stderr
+
+    def _effect_for(self, record):
+        effect = getattr(record, "animation", None)
+        if effect is False:
+            return None
+        if effect is None:
+            levels = [level for level in self.effects if level <= record.levelno]
+            if not levels:
+                return None
+            effect = self.effects[max(levels)]
+        if isinstance(effect, str):
+            effect = get_effect(effect)
+        return effect
+
+    def emit(self, record):
+        """
+        Queue *record* for the render thread; never waits for animation.
+
+        Args:
+            record (logging.LogRecord): Record to output.
+        """
+        try:
+            message = self.format(record)
+            effect = self._effect_for(record)
+        except Exception:
+            self.handleError(record)
+            return
+        with self._cond:
+            if self._closed:
+                return
+            self._pending.append((record, message, effect))
+            self._cond.notify_all()
+
+    def _take_tokens(self) -> bool:
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst,
+            self._tokens + (now - self._refilled) * self.max_animation_share,
+        )
+        self._refilled = now
+        return self._tokens > 0
+
+    def _render(self, batch, out):
+        chosen = None
+        for index, (record, _, effect) in enumerate(batch):
+            if effect is not None and (
+                chosen is None or record.levelno >= batch[chosen][0].levelno
+            ):
+                chosen = index
+        if chosen is not None and not self._take_tokens():
+            chosen = None
+
+        if chosen is None:
+            self._write_plain(batch, out)
+            return
+
+        self._write_plain(batch, out, chosen)
+        record, message, effect = batch[0]
+        first, _, rest = message.partition("\n")
+        target = _Interruptible(self, out)
+        started = time.monotonic()
+        try:
+            effect(first, delay=self.delay, stream=target, clock=target)
+        except Exception:
+            target.skipping = True
+            self.handleError(record)
+        finally:
+            self._tokens -= time.monotonic() - started
+        # Whatever state the effect ended in (erased, scrolled away,
+        # interrupted), the record itself is always written in full
+        after = "\r\033[K" + first + "\n"
+        if rest:
+            after += rest + "\n"
+        out.write(after)
+        del batch[0]
+        self._write_plain(batch, out)
+        out.flush()
+
+    def _write_plain(self, batch, out, count=None):
+        """Write the first *count* records plainly and remove them from *batch*."""
+        done = batch[:count]
+        if done:
+            out.write("".join(message + "\n" for _, message, _ in done))
+            out.flush()
+            del batch[:len(done)]
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                batch = list(self._pending)
+                self._pending.clear()
+                self._busy = True
+            last = batch[-1][0]
+            try:
+                out = self._out()
+                try:
+                    self._render(batch, out)
+                except Exception:
+                    # The stream failed; report it and still try to get the
+                    # unwritten records out, without animation
+                    self.handleError(batch[0][0] if batch else last)
+                    self._write_plain(batch, out)
+            except Exception:
+                for record, _, _ in batch:
+                    self.handleError(record)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def flush(self, timeout: float = None):
+        """
+        Wait until every queued record has been written.
+
+        Args:
+            timeout (float): Longest time to wait in seconds (no limit if None).
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: not self._pending and not self._busy,
+                                timeout)
+
+    def close(self):
+        """Write the remaining records plainly and stop the render thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join()
+        super().close()
@@ -0,0 +1,280 @@
+"""
+Streaming, display-width aware text wrapping
+"""
+
+import re
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
+
+_TOKEN = re.compile(r"\n|[^\S\n]+|\S+")
+
+
+def char_width(char: str) -> int:
+    """
+    Terminal cells taken by one character.
+
+    Args:
+        char (str): Single character.
+
+    Returns:
+        int: 0 for control and combining characters, 2 for wide East
+        Asian characters, otherwise 1.
+    """
+    if " " <= char < "\x7f":
+        return 1
+    if char < " " or "\x7f" <= char < "\xa0" or unicodedata.combining(char):
+        return 0
+    return 2 if unicodedata.east_asian_width(char) in "WF" else 1
+
+
+def text_width(text: str) -> int:
+    """
+    Terminal cells taken by *text*.
+
+    Args:
+        text (str): Text without escape sequences.
+
+    Returns:
+        int: Display width.
+    """
+    if text.isascii() and text.isprintable():
+        return len(text)
+    return sum(map(char_width, text))
+
+
+def _tokens(source: Union[str, Iterable[str]]) -> Iterator[str]:
+    """Split text into newlines, whitespace runs and words, chunk by chunk."""
+    if isinstance(source, str):
+        source = (source,)
+    tail = ""
+    for chunk in source:
+        if not chunk:
+            continue
+        token = None
+        for match in _TOKEN.finditer(tail + chunk if tail else chunk):
+            if token is not None:
+                yield token
+            token = match.group()
+        # The last token may continue in the next chunk
+        if token == "\n":
+            yield token
+            token = ""
+        tail = token
+    if tail:
+        yield tail
+
+
+def _expand(space: str, column: int, tabsize: int) -> str:
+    """Replace tabs in a whitespace run that starts at *column*."""
+    if "\t" not in space:
+        return space
+    parts = []
+    for char in space:
+        if char == "\t":
+            char = " " * (tabsize - column % tabsize)
+        parts.append(char)
+        column += text_width(char)
+    return "".join(parts)
+
+
+def _split(token: str, width: int) -> Tuple[str, str]:
+    """Cut the longest head of *token* that fits in *width* (at least one char)."""
+    used = 0
+    for index, char in enumerate(token):
+        used += char_width(char)
+        if used > width and index:
+            return token[:index], token[index:]
+    return token, ""
+
+
+def wrap(source: Union[str, Iterable[str]], width: int,
+         tabsize: int = 8) -> Iterator[str]:
+    """
+    Lazily wrap text to *width* terminal cells.
+
+    Input can be a string or any iterable of string chunks (e.g. a file
+    read in blocks); lines are produced as soon as they are complete.
+    Newlines end paragraphs and blank lines are kept, as are indentation
+    and runs of spaces between words. Whitespace at a wrap point and at
+    line ends is dropped. Words wider than *width* are hard-broken.
+
+    Args:
+        source: Text, or iterable of text chunks.
+        width (int): Maximum line width in cells.
+        tabsize (int): Tab stop interval.
+
+    Returns:
+        Iterator[str]: Wrapped lines without newlines.
+
+    Raises:
+        ValueError: If *width* is less than 1.
+    """
+    if width < 1:
+        raise ValueError(f"width must be at least 1, got {width!r}")
+    return _wrap(source, width, tabsize)
+
+
+def _wrap(source, width, tabsize):
+    parts: List[str] = []
+    used = 0
+    space = ""
+    paragraph_start = True
+    for token in _tokens(source):
+        if token == "\n":
+            yield "".join(parts)
+            parts, used, space, paragraph_start = [], 0, "", True
+            continue
+        if token[0].isspace():
+            space += token
+            continue
+        # Continuation lines do not start with the whitespace they broke at
+        gap = _expand(space, used, tabsize) if parts or paragraph_start else ""
+        space = ""
+        paragraph_start = False
+        token_width = text_width(token)
+        gap_width = text_width(gap)
+        if used + gap_width + token_width <= width:
+            parts += (gap, token)
+            used += gap_width + token_width
+            continue
+        if parts:
+            yield "".join(parts)
+        while token_width > width:
+            piece, token = _split(token, width)
+            yield piece
+            token_width = text_width(token)
+        parts = [token] if token else []
+        used = token_width
+    if parts:
+        yield "".join(parts)
+
+
+class TextLayout:
+    """
+    Wrapped lines of one document, cached per width and per paragraph.
+
+    :meth:`set_text` keeps the cached layout of every paragraph before the
+    first one that changed, so appending to or editing the end of a long
+    document re-wraps only from there. After a resize, paragraphs that fit
+    on one line are reused as they are and only those that wrap are laid
+    out again.
+
+    Args:
+        text (str): Initial document.
+        tabsize (int): Tab stop interval.
+        max_widths (int): Number of widths whose layout is kept.
+    """
+
+    def __init__(self, text: str = "", tabsize: int = 8, max_widths: int = 4):
+        self.tabsize = tabsize
+        self.max_widths = max_widths
+        self._paragraphs: List[str] = []
+        # Per paragraph: (display width, text) as a single line
+        self._single: List[Tuple[int, str]] = []
+        self._lines: Dict[int, List[List[str]]] = OrderedDict()
+        self.set_text(text)
+
+    def set_text(self, text: str) -> int:
+        """
+        Replace the document.
+
+        Args:
+            text (str): New document.
+
+        Returns:
+            int: Index of the first paragraph that has to be laid out again.
+        """
+        paragraphs = text.split("\n")
+        if paragraphs[-1] == "":
+            # A final newline ends the last paragraph rather than adding one
+            paragraphs.pop()
+        old = self._paragraphs
+        first = 0
+        limit = min(len(old), len(paragraphs))
+        while first < limit and old[first] == paragraphs[first]:
+            first += 1
+        self._paragraphs = paragraphs
+        del self._single[first:]
+        for cached in self._lines.values():
+            del cached[first:]
+        return first
+
+    def _single_line(self, index: int) -> Tuple[int, str]:
+        while len(self._single) <= index:
+            paragraph = self._paragraphs[len(self._single)]
+            line = _expand(paragraph.rstrip(), 0, self.tabsize)
+            self._single.append((text_width(line), line))
+        return self._single[index]
+
+    def lines(self, width: int) -> Iterator[str]:
+        """
+        Lazily yield the document's lines wrapped to *width*.
+
+        Args:
+            width (int): Maximum line width in cells.
+
+        Returns:
+            Iterator[str]: Wrapped lines.
+
+        Raises:
+            ValueError: If *width* is less than 1.
+        """
+        if width < 1:
+            raise ValueError(f"width must be at least 1, got {width!r}")
+        cached = self._lines.get(width)
+        if cached is None:
+            if len(self._lines) >= self.max_widths:
+                self._lines.popitem(last=False)
+            cached = self._lines[width] = []
+        else:
+            self._lines.move_to_end(width)
+        return self._iter_lines(width, cached)
+
+    def _iter_lines(self, width, cached):
+        paragraphs = self._paragraphs
+        for index in range(len(paragraphs)):
+            if self._paragraphs is not paragraphs:
+                # set_text() was called mid-iteration
+                return
+            if index < len(cached):
+                yield from cached[index]
+                continue
+            line_width, line = self._single_line(index)
+            if line_width <= width:
+                lines = [line]
+            else:
+                lines = list(_wrap(paragraphs[index], width, self.tabsize))
+            # Only extend the cache in order, and only for the current text
+            if index == len(cached) and self._lines.get(width) is cached:
+                cached.append(lines)
+            yield from lines
+
+
+_layouts = OrderedDict()
+_MAX_LAYOUTS = 16
+
+
+def layout_for(text: str) -> TextLayout:
+    """
+    Return the cached :class:`TextLayout` for this exact string object.
+
+    Layouts are keyed by ``id(text)``; a small number of recent ones are
+    kept, so redrawing the same document at a new width reuses its layout.
+
+    Args:
+        text (str): Document.
+
+    Returns:
+        TextLayout: Layout of *text*.
+    """
+    key = id(text)
+    entry = _layouts.get(key)
+    if entry is not None and entry[0] is text:
+        _layouts.move_to_end(key)
+        return entry[1]
+    layout = TextLayout(text)
+    _layouts[key] = (text, layout)
+    if len(_layouts) > _MAX_LAYOUTS:
+        _layouts.popitem(last=False)
+    return layout
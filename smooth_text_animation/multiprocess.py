@@ -0,0 +1,285 @@
+"""
+Single-renderer terminal output for animations running in worker processes
+"""
+
+import contextlib
+import itertools
+import multiprocessing
+import queue as queue_module
+import sys
+import threading
+import time
+from typing import Dict, List
+
+# Message kinds sent from handles to the server
+_FRAME = 0
+_LINE = 1
+_CLOSE = 2
+
+
+class RenderHandle:
+    """
+    Cheap, picklable proxy a worker uses instead of writing to the terminal.
+
+    The handle is a minimal text stream: ``write`` and ``flush`` turn the
+    ``"\\r"``-redrawn frames that the effects produce into compact
+    ``(slot, kind, text)`` messages for the :class:`RenderServer`.
+    Frames are throttled on the worker side, so a fast effect never
+    floods the queue; completed lines are always delivered.
+
+    Args:
+        queue: Queue shared with the server.
+        slot (int): Row identifier assigned by the server.
+        min_interval (float): Minimum seconds between two frame messages.
+    """
+
+    def __init__(self, queue, slot: int, min_interval: float = 1 / 60):
+        self.queue = queue
+        self.slot = slot
+        self.min_interval = min_interval
+        self._buffer = ""
+        self._sent = None
+        self._last_send = 0.0
+
+    def __getstate__(self):
+        return {"queue": self.queue, "slot": self.slot,
+                "min_interval": self.min_interval}
+
+    def __setstate__(self, state):
+        self.__init__(state["queue"], state["slot"], state["min_interval"])
+
+    def write(self, text: str) -> int:
+        """
+        Accept effect output; finished lines are forwarded immediately.
+
+        Args:
+            text (str): Text as an effect would write it to stdout.
+
+        Returns:
+            int: Number of characters accepted.
+        """
+        data = self._buffer + text
+        *lines, rest = data.split("\n")
+        for line in lines:
+            self.queue.put((self.slot, _LINE, line.rsplit("\r", 1)[-1]))
+            self._sent = ""
+        self._buffer = rest.rsplit("\r", 1)[-1]
+        return len(text)
+
+    def flush(self, force: bool = False):
+        """
+        Send the current frame if it changed and the throttle allows it.
+
+        Args:
+            force (bool): Ignore *min_interval*.
+        """
+        if self._buffer == self._sent:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_send < self.min_interval:
+            return
+        self.queue.put((self.slot, _FRAME, self._buffer))
+        self._sent = self._buffer
+        self._last_send = now
+
+    def update(self, text: str):
+        """
+        Replace this slot's live row with *text*.
+
+        Args:
+            text (str): New row content.
+        """
+        self.write("\r" + text)
+        self.flush()
+
+    def print(self, text: str = ""):
+        """
+        Print a permanent line above the live rows.
+
+        Args:
+            text (str): Line to print.
+        """
+        self.write("\r" + text + "\n")
+
+    def close(self):
+        """Flush the last frame and release the slot."""
+        self.flush(force=True)
+        self.queue.put((self.slot, _CLOSE, ""))
+
+    @contextlib.contextmanager
+    def redirect(self):
+        """
+        Redirect ``sys.stdout`` to this handle for the enclosed block.
+
+        The redirect is process-wide, so use one handle per process at a
+        time; threads should call :meth:`update` and :meth:`print` instead.
+        """
+        try:
+            with contextlib.redirect_stdout(self):
+                yield self
+        finally:
+            self.flush(force=True)
+
+    def effect(self, func, *args, **kwargs):
+        """
+        Run an animation function with its output routed through the server.
+
+        Args:
+            func: Animation function, or its name in this package.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+        """
+        if isinstance(func, str):
+            from . import animations
+            func = getattr(animations, func)
+        try:
+            return func(*args, stream=self, **kwargs)
+        finally:
+            self.flush(force=True)
+
+    def isatty(self) -> bool:
+        return False
+
+
+class RenderServer:
+    """
+    Owns the terminal and composites rows sent by worker handles.
+
+    Every worker gets a :class:`RenderHandle` with its own row. A thread
+    in the parent drains the queue and redraws all live rows in one write
+    at most *refresh_per_second* times a second; lines a worker finishes
+    are printed permanently above the live rows.
+
+    The default queue can be handed to ``multiprocessing.Process`` args or
+    a pool ``initializer``. For ``ProcessPoolExecutor.submit``/``map``
+    arguments, pass a manager queue::
+
+        with multiprocessing.Manager() as manager:
+            with RenderServer(queue=manager.Queue()) as server:
+                pool.map(work, [server.handle() for _ in range(8)])
+
+    Args:
+        stream: Text stream to draw on (defaults to ``sys.stdout``).
+        refresh_per_second (float): Maximum number of redraws per second.
+        queue: Queue to receive messages on (a new one is created if None).
+    """
+
+    def __init__(self, stream=None, refresh_per_second: float = 30, queue=None):
+        self.stream = stream
+        self.interval = 1.0 / max(0.1, refresh_per_second)
+        self.queue = queue if queue is not None else multiprocessing.Queue()
+        self._slots = itertools.count()
+        self._frames: Dict[int, str] = {}
+        self._pending_lines: List[str] = []
+        self._drawn_lines = 0
+        self._dirty = False
+        self._thread = None
+
+    def handle(self, min_interval: float = 1 / 60) -> RenderHandle:
+        """
+        Create a handle bound to a new row.
+
+        Args:
+            min_interval (float): Worker-side minimum seconds between frames.
+
+        Returns:
+            RenderHandle: Picklable handle for a worker.
+        """
+        return RenderHandle(self.queue, next(self._slots), min_interval)
+
+    def start(self):
+        """Start the render thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="RenderServer",
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Drain outstanding messages, draw the final state and stop."""
+        if self._thread is not None:
+            self.queue.put(None)
+            self._thread.join()
+            self._thread = None
+        self._drain()
+        self._draw()
+        if self._drawn_lines:
+            out = self._out()
+            out.write("\n")
+            out.flush()
+            self._drawn_lines = 0
+
+    def _out(self):
+        return self.stream if self.stream is not None else sys.stdout
+
+    def _apply(self, message):
+        slot, kind, text = message
+        if kind == _FRAME:
+            self._frames[slot] = text
+        elif kind == _LINE:
+            self._frames.pop(slot, None)
+            self._pending_lines.append(text)
+        else:
+            text = self._frames.pop(slot, None)
+            if text:
+                self._pending_lines.append(text)
+        self._dirty = True
+
+    def _draw(self):
+        if not self._dirty:
+            return
+        parts = []
+        if self._drawn_lines > 1:
+            parts.append(f"\033[{self._drawn_lines - 1}A")
+        parts.append("\r")
+        for line in self._pending_lines:
+            parts.append(line + "\033[K\n")
+        rows = [self._frames[slot] for slot in sorted(self._frames)]
+        parts.append("\n".join(row + "\033[K" for row in rows))
+        parts.append("\033[J")
+        out = self._out()
+        out.write("".join(parts))
+        out.flush()
+        self._pending_lines = []
+        self._drawn_lines = len(rows)
+        self._dirty = False
+
+    def _run(self):
+        next_draw = time.monotonic()
+        while True:
+            # Block until a message arrives; once something is waiting to be
+            # drawn, only until the next frame is due.
+            timeout = None
+            if self._dirty:
+                timeout = max(0.0, next_draw - time.monotonic())
+            message = ()
+            try:
+                message = self.queue.get(timeout=timeout)
+                while message is not None:
+                    self._apply(message)
+                    message = self.queue.get_nowait()
+            except queue_module.Empty:
+                pass
+            if message is None:
+                break
+            if time.monotonic() >= next_draw:
+                self._draw()
+                next_draw = time.monotonic() + self.interval
+        self._drain()
+
+    def _drain(self):
+        while True:
+            try:
+                message = self.queue.get_nowait()
+            except queue_module.Empty:
+                return
+            if message is not None:
+                self._apply(message)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
@@ -0,0 +1,400 @@
+"""
+Output backends for animation frames
+"""
+
+import errno
+import io
+import os
+import re
+import select
+import sys
+import threading
+import time
+from typing import Dict, List
+
+
+class FdWriter:
+    """
+    Byte-level writer that sends frames straight to a file descriptor.
+
+    Frames are encoded to UTF-8 once (repeating frames hit a small cache),
+    buffered as ``bytes`` until ``flush`` and then written with
+    ``os.write``, skipping the text layer of ``sys.stdout``. Partial
+    writes continue from a ``memoryview`` of the remaining bytes and
+    ``EAGAIN`` on non-blocking descriptors waits for writability.
+
+    Binary streams without a usable descriptor (e.g. ``io.BytesIO``)
+    receive the encoded bytes through their own ``write``.
+
+    Args:
+        target: File descriptor (int) or binary stream.
+        encoding (str): Encoding used for text frames.
+        cache_size (int): Maximum number of encoded frames kept.
+    """
+
+    def __init__(self, target, encoding: str = "utf-8", cache_size: int = 256):
+        self.encoding = encoding
+        self.cache_size = cache_size
+        self._stream = None
+        self._fd = None
+        if isinstance(target, int):
+            self._fd = target
+        else:
+            try:
+                self._fd = target.fileno()
+            except (AttributeError, OSError, io.UnsupportedOperation):
+                self._stream = target
+            else:
+                # Anything already buffered in the stream must go out first
+                target.flush()
+        if self._fd is not None:
+            _flush_std_streams(self._fd)
+        self._cache: Dict[str, bytes] = {}
+        self._pending: List[bytes] = []
+
+    def encode(self, text: str) -> bytes:
+        """
+        Encode a frame, reusing earlier encodings of the same text.
+
+        Args:
+            text (str): Frame text.
+
+        Returns:
+            bytes: Encoded frame.
+        """
+        data = self._cache.get(text)
+        if data is None:
+            data = text.encode(self.encoding)
+            if len(self._cache) >= self.cache_size:
+                self._cache.clear()
+            self._cache[text] = data
+        return data
+
+    def write(self, text: str) -> int:
+        """
+        Queue a text frame for the next ``flush``.
+
+        Args:
+            text (str): Frame text.
+
+        Returns:
+            int: Number of characters accepted.
+        """
+        if text:
+            self._pending.append(self.encode(text))
+        return len(text)
+
+    def write_bytes(self, data: bytes) -> int:
+        """
+        Queue already encoded bytes for the next ``flush``.
+
+        Args:
+            data (bytes): Encoded output.
+
+        Returns:
+            int: Number of bytes accepted.
+        """
+        if data:
+            self._pending.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        """Write all queued bytes to the target."""
+        if not self._pending:
+            return
+        if len(self._pending) == 1:
+            data = self._pending[0]
+        else:
+            data = b"".join(self._pending)
+        self._pending = []
+        if self._stream is not None:
+            self._stream.write(data)
+            self._stream.flush()
+        else:
+            write_all(self._fd, data)
+
+    def fileno(self) -> int:
+        if self._fd is None:
+            raise io.UnsupportedOperation("fileno")
+        return self._fd
+
+    def isatty(self) -> bool:
+        if self._fd is None:
+            return False
+        try:
+            return os.isatty(self._fd)
+        except OSError:
+            return False
+
+
+# Cursor movement and save/restore; frames without these that start with
+# "\r" redraw the whole line
+_CURSOR_MOVE = re.compile(r"\033(?:\[[\d;]*[A-HSTfsu]|[78])")
+
+
+class _LineLog:
+    """
+    Output written since the last newline — enough to redraw the line.
+
+    A frame that starts with ``"\\r"`` and moves no cursor replaces what
+    came before, so ``"\\r"``-redrawn animations keep only their last frame;
+    diff frames are appended to the frame they patch. Once appended frames
+    exceed *limit* characters the log is dropped and the line counts as
+    unknown (:meth:`replay` returns None) until the next whole-line redraw
+    or newline, so memory stays bounded however long a diff-rendered
+    effect runs.
+
+    Args:
+        limit (int): Most characters kept for one line.
+    """
+
+    __slots__ = ("parts", "size", "limit", "known")
+
+    def __init__(self, limit: int = 1 << 16):
+        self.parts: List[str] = []
+        self.size = 0
+        self.limit = limit
+        self.known = True
+
+    def feed(self, text: str):
+        newline = text.rfind("\n")
+        if newline >= 0:
+            text = text[newline + 1:]
+            self.parts, self.size, self.known = [], 0, True
+        elif text.startswith("\r") and not _CURSOR_MOVE.search(text):
+            self.parts, self.size, self.known = [], 0, True
+        if not text or not self.known:
+            return
+        self.size += len(text)
+        if self.size > self.limit:
+            self.parts, self.size, self.known = [], 0, False
+        else:
+            self.parts.append(text)
+
+    def replay(self):
+        """The line so far, or None if it is too long to have been kept."""
+        if not self.known:
+            return None
+        if len(self.parts) > 1:
+            self.parts = ["".join(self.parts)]
+        return self.parts[0] if self.parts else ""
+
+    def __bool__(self):
+        return bool(self.parts) or not self.known
+
+
+class _Client:
+    """Per-client state of a :class:`BroadcastSink`."""
+
+    __slots__ = ("target", "fd", "pending", "behind")
+
+    def __init__(self, target, fd: int, behind: bool):
+        self.target = target
+        self.fd = fd
+        self.pending = None
+        self.behind = behind
+
+
+class BroadcastSink:
+    """
+    Text stream that renders once and fans each frame out to many clients.
+
+    Pass it as an effect's ``stream``: every ``flush`` encodes the frame
+    once and sends the same bytes to all registered clients (sockets,
+    pipes or file descriptors, switched to non-blocking mode). A client
+    that cannot take a frame keeps only the unsent rest of the frame it
+    is on; the frames it misses meanwhile are skipped. Once it drains,
+    it receives the current line — everything written since the last
+    newline — so it catches up to the latest frame. Memory per client is
+    bounded by one frame no matter how slow the reader is.
+
+    Catching up replays the current line, so the sink is meant for
+    single-line effects. If the line has grown past the replay limit
+    (a long run of diff frames), a client that is behind keeps skipping
+    until the next whole-line ``"\\r"`` redraw or newline. Clients that
+    disconnect are dropped. Calling
+    ``flush`` with nothing written retries pending writes.
+
+    Args:
+        encoding (str): Encoding used for frames.
+    """
+
+    def __init__(self, encoding: str = "utf-8"):
+        self.encoding = encoding
+        self.skipped = 0
+        self._frame: List[str] = []
+        self._line = _LineLog()
+        self._resync = None
+        self._clients: List[_Client] = []
+        self._lock = threading.Lock()
+
+    def add(self, target):
+        """
+        Start sending frames to *target*.
+
+        Args:
+            target: Socket, file object or file descriptor (int).
+        """
+        fd = target if isinstance(target, int) else target.fileno()
+        os.set_blocking(fd, False)
+        with self._lock:
+            # Joining mid-line needs the line so far before the next frame
+            self._clients.append(_Client(target, fd, behind=bool(self._line)))
+
+    def remove(self, target):
+        """
+        Stop sending frames to *target* (it is not closed).
+
+        Args:
+            target: Object previously passed to :meth:`add`.
+        """
+        with self._lock:
+            self._clients = [c for c in self._clients if c.target is not target]
+
+    @property
+    def clients(self) -> int:
+        """Number of connected clients."""
+        return len(self._clients)
+
+    def write(self, text: str) -> int:
+        """
+        Queue text for the next frame.
+
+        Args:
+            text (str): Frame text.
+
+        Returns:
+            int: Number of characters accepted.
+        """
+        if text:
+            self._frame.append(text)
+        return len(text)
+
+    def flush(self):
+        """Encode the queued frame once and send it to every client."""
+        text = "".join(self._frame)
+        self._frame = []
+        data = text.encode(self.encoding)
+        with self._lock:
+            if text:
+                self._line.feed(text)
+                self._resync = None
+            for client in list(self._clients):
+                self._send(client, data)
+
+    def _send(self, client: _Client, data: bytes):
+        if client.pending is not None and not self._drain(client):
+            if data:
+                client.behind = True
+                self.skipped += 1
+            return
+        if client.behind:
+            if self._resync is None:
+                line = self._line.replay()
+                if line is None:
+                    # Nothing to catch up from until the line is redrawn
+                    if data:
+                        self.skipped += 1
+                    return
+                self._resync = ("\r\033[K" + line).encode(self.encoding)
+            data = self._resync
+            client.behind = False
+        if data:
+            client.pending = memoryview(data)
+            self._drain(client)
+
+    def _drain(self, client: _Client) -> bool:
+        """Write as much pending data as the client takes; True when done."""
+        view = client.pending
+        while view:
+            try:
+                written = os.write(client.fd, view)
+            except InterruptedError:
+                continue
+            except BlockingIOError:
+                break
+            except OSError as exc:
+                if exc.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    break
+                # Disconnected (EPIPE, ECONNRESET, ...)
+                self._clients.remove(client)
+                client.pending = None
+                return False
+            view = view[written:]
+        client.pending = view if view else None
+        return client.pending is None
+
+    def close(self):
+        """Forget all clients (they are not closed)."""
+        with self._lock:
+            self._clients = []
+
+
+def _flush_std_streams(fd: int):
+    """
+    Flush ``sys.stdout`` / ``sys.stderr`` if they write to *fd*.
+
+    Their text layers buffer output that a raw write to the same
+    descriptor would otherwise overtake.
+    """
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            if stream is not None and stream.fileno() == fd:
+                stream.flush()
+        except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+            pass
+
+
+def write_all(fd: int, data: bytes):
+    """
+    Write every byte of *data* to *fd*, retrying partial writes.
+
+    Args:
+        fd (int): Target file descriptor (blocking or non-blocking).
+        data (bytes): Bytes to write.
+    """
+    view = memoryview(data)
+    while view:
+        try:
+            written = os.write(fd, view)
+        except BlockingIOError:
+            _wait_writable(fd)
+            continue
+        except InterruptedError:
+            continue
+        except OSError as exc:
+            if exc.errno not in (errno.EAGAIN, errno.EWOULDBLOCK):
+                raise
+            _wait_writable(fd)
+            continue
+        view = view[written:]
+
+
+def _wait_writable(fd: int, timeout: float = 1.0):
+    """Block until *fd* accepts more data (or *timeout* passes)."""
+    try:
+        select.select([], [fd], [], timeout)
+    except (OSError, ValueError):
+        # select() does not support this descriptor type (e.g. pipes on
+        # Windows); back off briefly instead
+        time.sleep(0.001)
+
+
+def resolve_stream(stream=None):
+    """
+    Turn an effect's *stream* argument into something with ``write``/``flush``
+
+    Args:
+        stream: None for ``sys.stdout``, a file descriptor (int), a binary
+            stream, or any text stream
+
+    Returns:
+        Text stream or :class:`FdWriter`
+    """
+    if stream is None:
+        return sys.stdout
+    if isinstance(stream, int) or isinstance(
+        stream, (io.RawIOBase, io.BufferedIOBase)
+    ):
+        return FdWriter(stream)
+    return stream
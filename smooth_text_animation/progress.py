@@ -0,0 +1,280 @@
+"""
+Live, thread-safe progress bars rendered from a background thread
+"""
+
+import itertools
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+from .utils import create_progress_bar
+
+
+class ProgressBar:
+    """
+    A single progress bar whose ``update`` is safe to call from many threads.
+
+    Unit updates are a single ``next()`` on an ``itertools.count``, which is
+    atomic under the GIL, so workers never take a lock in the common case.
+    Only the render thread reads the counter back.
+
+    Args:
+        total (int): Value that represents 100%.
+        description (str): Label shown before the bar.
+        width (int): Width of the bar in characters.
+        filled_char (str): Character for the filled portion.
+        empty_char (str): Character for the empty portion.
+        smoothing (float): Weight of the newest sample in the throughput
+            moving average (0.0–1.0). Lower values give a steadier ETA.
+    """
+
+    def __init__(self, total: int, description: str = "", width: int = 30,
+                 filled_char: str = "█", empty_char: str = "░",
+                 smoothing: float = 0.3):
+        self.total = max(0, int(total))
+        self.description = description
+        self.width = width
+        self.filled_char = filled_char
+        self.empty_char = empty_char
+        self.smoothing = max(0.0, min(1.0, smoothing))
+
+        self._ticks = itertools.count()
+        self._reads = 0
+        self._bulk = 0
+        self._bulk_lock = threading.Lock()
+        self._read_lock = threading.Lock()
+
+        self._bar_cache: Dict[int, str] = {}
+        self._rate = None
+        self._last_time = None
+        self._last_value = 0
+
+    def update(self, n: int = 1):
+        """
+        Advance the bar by *n* units.
+
+        Args:
+            n (int): Number of completed units. ``1`` takes the lock-free path.
+        """
+        if n == 1:
+            next(self._ticks)
+        elif n:
+            with self._bulk_lock:
+                self._bulk += n
+
+    @property
+    def completed(self) -> int:
+        """Number of units completed so far."""
+        with self._read_lock:
+            # Every read consumes one value from the counter as well, so
+            # subtract the reads made so far to recover the update count.
+            ticks = next(self._ticks) - self._reads
+            self._reads += 1
+        return ticks + self._bulk
+
+    @property
+    def rate(self) -> Optional[float]:
+        """Smoothed throughput in units per second, or None before two samples."""
+        return self._rate
+
+    def sample(self, now: float = None) -> int:
+        """
+        Read the counter and feed the throughput estimator.
+
+        Args:
+            now (float): Timestamp from ``time.monotonic`` (auto if None).
+
+        Returns:
+            int: Number of units completed.
+        """
+        if now is None:
+            now = time.monotonic()
+        value = self.completed
+        if self._last_time is not None:
+            elapsed = now - self._last_time
+            if elapsed > 0:
+                instant = (value - self._last_value) / elapsed
+                if self._rate is None:
+                    self._rate = instant
+                else:
+                    self._rate += self.smoothing * (instant - self._rate)
+        self._last_time = now
+        self._last_value = value
+        return value
+
+    def eta(self, value: int = None) -> Optional[float]:
+        """
+        Estimated seconds until completion, or None if unknown.
+
+        Args:
+            value (int): Completed units (read from the counter if None).
+        """
+        if value is None:
+            value = self._last_value
+        if not self._rate or self._rate <= 0:
+            return None
+        return max(0.0, (self.total - value) / self._rate)
+
+    def _bar(self, value: int) -> str:
+        """Bar body for *value*, cached per filled width."""
+        if self.total == 0:
+            filled = 0
+        else:
+            filled = min(self.width, int(value / self.total * self.width))
+        bar = self._bar_cache.get(filled)
+        if bar is None:
+            bar = create_progress_bar(filled, self.width, self.width,
+                                      self.filled_char, self.empty_char)
+            bar = bar[:bar.rindex("]") + 1]
+            self._bar_cache[filled] = bar
+        return bar
+
+    def render(self, now: float = None) -> str:
+        """
+        Sample the counter and build the bar line.
+
+        Args:
+            now (float): Timestamp from ``time.monotonic`` (auto if None).
+
+        Returns:
+            str: Rendered progress line.
+        """
+        value = self.sample(now)
+        if self.total == 0:
+            percentage = 0
+        else:
+            percentage = min(100, int(value / self.total * 100))
+        parts = [self._bar(value), f"{percentage:3d}%", f"{value}/{self.total}"]
+        if self.description:
+            parts.insert(0, self.description)
+        if self._rate is not None:
+            parts.append(f"{self._rate:.1f}/s")
+            eta = self.eta(value)
+            if eta is not None:
+                parts.append(f"ETA {format_seconds(eta)}")
+        return " ".join(parts)
+
+
+class LiveProgress:
+    """
+    Stack of progress bars redrawn by a background thread.
+
+    Redraws happen at most *refresh_per_second* times a second no matter
+    how often the bars are updated, and a frame is only written when its
+    text changed.
+
+    Example::
+
+        with LiveProgress() as live:
+            bar = live.add_bar(1000, "download")
+            for _ in range(1000):
+                bar.update()
+
+    Args:
+        refresh_per_second (float): Maximum number of redraws per second.
+        stream: Text stream to draw on (defaults to ``sys.stdout``).
+    """
+
+    def __init__(self, refresh_per_second: float = 10, stream=None):
+        self.interval = 1.0 / max(0.1, refresh_per_second)
+        self.stream = stream
+        self.bars: List[ProgressBar] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._drawn_lines = 0
+        self._last_frame = None
+
+    def add_bar(self, total: int, description: str = "", **kwargs) -> ProgressBar:
+        """
+        Create a bar and append it below the existing ones.
+
+        Args:
+            total (int): Value that represents 100%.
+            description (str): Label shown before the bar.
+            **kwargs: Extra arguments for :class:`ProgressBar`.
+
+        Returns:
+            ProgressBar: The new bar.
+        """
+        bar = ProgressBar(total, description, **kwargs)
+        with self._lock:
+            self.bars.append(bar)
+        return bar
+
+    def start(self):
+        """Start the render thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="LiveProgress",
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the render thread and draw the final state."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        self.refresh()
+        if self._drawn_lines:
+            self._out().write("\n")
+            self._out().flush()
+            self._drawn_lines = 0
+            self._last_frame = None
+
+    def refresh(self):
+        """Redraw all bars now if anything changed."""
+        now = time.monotonic()
+        with self._lock:
+            lines = [bar.render(now) for bar in self.bars]
+            frame = "\n".join(lines)
+            if frame == self._last_frame:
+                return
+            out = self._out()
+            parts = []
+            if self._drawn_lines > 1:
+                parts.append(f"\033[{self._drawn_lines - 1}A")
+            for i, line in enumerate(lines):
+                if i:
+                    parts.append("\n")
+                parts.append("\r" + line + "\033[K")
+            out.write("".join(parts))
+            out.flush()
+            self._drawn_lines = len(lines)
+            self._last_frame = frame
+
+    def _out(self):
+        return self.stream if self.stream is not None else sys.stdout
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.refresh()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+
+def format_seconds(seconds: float) -> str:
+    """
+    Format a duration as ``M:SS`` or ``H:MM:SS``
+
+    Args:
+        seconds (float): Duration in seconds
+
+    Returns:
+        str: Formatted duration
+    """
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes}:{secs:02d}"
@@ -0,0 +1,184 @@
+"""
+Frame quality that adapts to how fast the terminal accepts output
+"""
+
+import re
+import weakref
+
+from .output import _CURSOR_MOVE
+
+_SGR = re.compile(r"\033\[[\d;]*m")
+
+# Latency / frame delay above which each level is entered, and below which
+# it is left again (lower, so quality does not flap around one threshold)
+_RAISE = (0.5, 1.0, 2.0)
+_LOWER = (0.25, 0.5, 1.0)
+
+
+def _common_prefix(a: str, b: str) -> int:
+    """Length of the common prefix, found with slice comparisons."""
+    high = min(len(a), len(b))
+    if a[:high] == b[:high]:
+        return high
+    low = 0
+    while high - low > 1:
+        mid = (low + high) // 2
+        if a[:mid] == b[:mid]:
+            low = mid
+        else:
+            high = mid
+    return low
+
+
+class AdaptiveQuality:
+    """
+    Degrades frame output while writes are slow and restores it after.
+
+    Write-plus-flush time is tracked as an exponential moving average and
+    compared with the time frames are meant to stay up. As the ratio
+    grows the level rises:
+
+    * 1 — full-line ``"\\r"`` redraws are sent as a cursor move plus the
+      changed tail (diff-only output);
+    * 2 — full-line redraws are also dropped until the last write has had
+      twice its measured latency to drain (lower frame rate);
+    * 3 — colour escapes are stripped as well.
+
+    Levels fall back one at a time once the ratio drops below a lower
+    threshold. A dropped redraw is kept and written ahead of the next
+    frame that is not a redraw (such as the newline ending an effect),
+    so the final state always reaches the terminal.
+
+    Args:
+        smoothing (float): Weight of the newest latency sample (0–1).
+    """
+
+    MAX_LEVEL = 3
+
+    def __init__(self, smoothing: float = 0.3):
+        self.smoothing = smoothing
+        self.latency = None
+        self.level = 0
+        self._last_write = None
+        self._held = None
+        # Text the terminal shows on the current line, if known
+        self._shown = None
+
+    def prepare(self, data: str, now: float):
+        """
+        Adapt one frame to the current level.
+
+        Args:
+            data (str): Frame as produced by the effect.
+            now (float): Current time on the player's clock.
+
+        Returns:
+            str: Text to write, or None to drop the frame.
+        """
+        if self.level >= 3:
+            data = _SGR.sub("", data)
+        if (data.startswith("\r") and "\n" not in data
+                and not _CURSOR_MOVE.search(data)):
+            if (self.level >= 2 and self._last_write is not None
+                    and now - self._last_write < 2 * self.latency):
+                self._held = data
+                return None
+            self._held = None
+            return self._redraw(data)
+        held, self._held = self._held, None
+        data = (self._redraw(held) if held else "") + data
+        self._shown = None
+        return data
+
+    def _redraw(self, data: str) -> str:
+        text = data[1:]
+        shown = self._shown
+        self._shown = text if shown is None else text + shown[len(text):]
+        if self.level >= 1 and shown is not None and "\033" not in text + shown:
+            same = _common_prefix(text, shown)
+            if text[:same].isascii():
+                return "\r" + (f"\033[{same}C" if same else "") + text[same:]
+        return data
+
+    def record(self, seconds: float, now: float):
+        """
+        Account for one write and flush.
+
+        Args:
+            seconds (float): Time the write and flush took.
+            now (float): Time the write finished.
+        """
+        self._last_write = now
+        if self.latency is None:
+            self.latency = seconds
+        else:
+            self.latency += self.smoothing * (seconds - self.latency)
+
+    def adjust(self, delay: float):
+        """
+        Pick the level for frames meant to stay up for *delay* seconds.
+
+        Args:
+            delay (float): Frame delay the effect is pacing with.
+        """
+        if delay <= 0 or self.latency is None:
+            return
+        ratio = self.latency / delay
+        while self.level < self.MAX_LEVEL and ratio > _RAISE[self.level]:
+            self.level += 1
+        while self.level > 0 and ratio < _LOWER[self.level - 1]:
+            self.level -= 1
+
+
+class _PassThrough:
+    """Quality for outputs that are not terminals: frames go out as made."""
+
+    level = 0
+
+    def prepare(self, data: str, now: float) -> str:
+        """Return *data* unchanged."""
+        return data
+
+    def record(self, seconds: float, now: float):
+        """Write times say nothing about a terminal here; ignored."""
+
+    def adjust(self, delay: float):
+        """The level never changes."""
+
+
+_PASS_THROUGH = _PassThrough()
+_by_stream = weakref.WeakKeyDictionary()
+
+
+def _is_terminal(stream) -> bool:
+    try:
+        return bool(stream.isatty())
+    except (AttributeError, ValueError, OSError):
+        return False
+
+
+def quality_for(stream) -> AdaptiveQuality:
+    """
+    Return the quality state shared by everything writing to *stream*.
+
+    Only terminals are adapted. Other outputs (files, pipes, worker
+    handles) may keep just part of each frame, so they get every frame
+    unchanged, however slow their writes are.
+
+    Args:
+        stream: Resolved output stream.
+
+    Returns:
+        AdaptiveQuality: Shared state (a fresh one if *stream* cannot be
+        weakly referenced), or a pass-through one if *stream* is not a
+        terminal.
+    """
+    if not _is_terminal(stream):
+        return _PASS_THROUGH
+    try:
+        quality = _by_stream.get(stream)
+        if quality is None:
+            quality = _by_stream[stream] = AdaptiveQuality()
+    except TypeError:
+        quality = AdaptiveQuality()
+    return quality
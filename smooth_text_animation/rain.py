@@ -0,0 +1,166 @@
+"""
+Full-screen matrix rain that resolves into a message
+"""
+
+import random
+
+from .animations import _play_screen, _screen_size
+from .screen import ScreenBuffer
+
+_GLYPHS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789@#$%&*+=<>"
+
+_STYLE_CODES = (
+    "\033[0;97m",      # Bright white head
+    "\033[0;92m",      # Bright green trail
+    "\033[0;2;32m",    # Dim green tail
+    "\033[0;1;97m",    # Bold white message
+)
+
+
+class MatrixRain:
+    """
+    Cell grid and per-column state for the matrix rain effect.
+
+    The grid is a :class:`~smooth_text_animation.screen.ScreenBuffer`, so
+    :meth:`step` only emits the cells that changed since the previous frame.
+
+    Args:
+        text (str): Message the rain resolves into (may be empty).
+        cols (int): Grid width in cells.
+        rows (int): Grid height in cells.
+        reveal_at (float): Progress (0.0–1.0) after which falling heads lock
+            message characters in place.
+    """
+
+    def __init__(self, text: str = "", cols: int = 80, rows: int = 24,
+                 reveal_at: float = 0.4):
+        self.cols = max(1, cols)
+        self.rows = max(1, rows)
+        self.reveal_at = reveal_at
+        self.screen = ScreenBuffer(self.rows, self.cols)
+        self.blank_style = 0
+        self.head_style, self.trail_style, self.fade_style, self.message_style = (
+            self.screen.styles.intern(code) for code in _STYLE_CODES
+        )
+
+        self.message_row = self.rows // 2
+        text = text[:self.cols]
+        self.message_col = (self.cols - len(text)) // 2
+        self.message = text
+        self.locked = bytearray(self.cols)
+
+        self.heads = [random.uniform(-self.rows, 0) for _ in range(self.cols)]
+        self.speeds = [random.uniform(0.3, 1.2) for _ in range(self.cols)]
+        self.trails = [random.randint(4, max(5, self.rows // 2)) for _ in range(self.cols)]
+
+    def _message_char(self, col):
+        offset = col - self.message_col
+        if 0 <= offset < len(self.message):
+            return self.message[offset]
+        return None
+
+    def _erase(self, row, col):
+        if row == self.message_row and self.locked[col]:
+            self.screen.put(row, col, self._message_char(col), self.message_style)
+        else:
+            self.screen.put(row, col, " ", self.blank_style)
+
+    def _restyle(self, row, col, style):
+        if 0 <= row < self.rows and not (row == self.message_row and self.locked[col]):
+            index = row * self.cols + col
+            if self.screen.style_ids[index] != self.blank_style:
+                self.screen.put(row, col, chr(self.screen.codes[index]), style)
+
+    def advance(self, progress: float):
+        """
+        Move every column one frame forward.
+
+        Args:
+            progress (float): Overall effect progress (0.0–1.0).
+        """
+        rows = self.rows
+        reveal = self.message and progress >= self.reveal_at
+        for col in range(self.cols):
+            head = self.heads[col]
+            old = int(head)
+            head += self.speeds[col]
+            new = int(head)
+            trail = self.trails[col]
+            for row in range(old + 1, new + 1):
+                if 0 <= row < rows:
+                    if row == self.message_row and self.locked[col]:
+                        pass
+                    elif reveal and row == self.message_row and \
+                            self._message_char(col) is not None:
+                        self.locked[col] = 1
+                        self._erase(row, col)
+                    else:
+                        self.screen.put(row, col, random.choice(_GLYPHS), self.head_style)
+                self._restyle(row - 1, col, self.trail_style)
+                self._restyle(row - trail // 2, col, self.fade_style)
+                tail = row - trail
+                if 0 <= tail < rows:
+                    self._erase(tail, col)
+            if head - trail >= rows:
+                # Column fell off the bottom; restart above the screen
+                head = random.uniform(-rows // 2, 0)
+                self.speeds[col] = random.uniform(0.3, 1.2)
+            self.heads[col] = head
+
+    def settle(self):
+        """Clear the rain and leave only the message."""
+        self.screen.fill(" ", self.blank_style)
+        for offset in range(len(self.message)):
+            col = self.message_col + offset
+            self.locked[col] = 1
+            self._erase(self.message_row, col)
+
+    def render(self) -> str:
+        """
+        Build the escape sequence for all cells changed since the last call.
+
+        Returns:
+            str: Cursor moves, style changes and characters for changed cells.
+        """
+        return self.screen.render()
+
+    def step(self, progress: float) -> str:
+        """
+        Advance one frame and return its output.
+
+        Args:
+            progress (float): Overall effect progress (0.0–1.0).
+
+        Returns:
+            str: Escape sequence that updates the terminal to the new frame.
+        """
+        self.advance(progress)
+        return self.render()
+
+
+def matrix_rain(text="", duration=3.0, fps=60, width=None, height=None,
+                stream=None, clock=None):
+    """
+    Full-screen matrix rain whose trails resolve into a message.
+
+    Args:
+        text (str): Message revealed in the middle of the screen.
+        duration (float): Total run time (seconds).
+        fps (float): Target frame rate.
+        width (int): Columns to use (auto-detected if None).
+        height (int): Rows to use (auto-detected if None).
+        stream: Output target — text stream, binary stream or file
+            descriptor (defaults to ``sys.stdout``).
+        clock: Clock used for pacing (defaults to the real monotonic clock).
+    """
+    width, height = _screen_size(width, height)
+    rain = MatrixRain(text, width, height)
+
+    def step(frame, frames, interval):
+        return rain.step(frame / frames)
+
+    def finish():
+        rain.settle()
+        return rain.render()
+
+    _play_screen(rain.rows, step, duration, fps, stream, clock, finish)
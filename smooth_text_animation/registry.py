@@ -0,0 +1,114 @@
+"""
+Name-based registry of line effects
+"""
+
+from typing import Callable, Dict, List
+
+from . import animations
+
+EFFECTS: Dict[str, Callable] = {}
+
+
+def register_effect(name: str, func: Callable = None):
+    """
+    Register an effect under *name*; usable as a decorator.
+
+    The effect must accept ``text`` plus the ``delay``, ``stream`` and
+    ``clock`` keyword arguments, like the built-in effects, and draw on a
+    single line.
+
+    Args:
+        name (str): Name to look the effect up by.
+        func (callable): Effect function (omit to use as a decorator).
+
+    Returns:
+        callable: *func*, or a decorator when *func* is None.
+    """
+    if func is None:
+        def decorator(f):
+            EFFECTS[name] = f
+            return f
+        return decorator
+    EFFECTS[name] = func
+    return func
+
+
+def get_effect(name: str) -> Callable:
+    """
+    Look up a registered effect.
+
+    Args:
+        name (str): Registered name.
+
+    Returns:
+        callable: The effect function.
+
+    Raises:
+        ValueError: If no effect is registered under *name*.
+    """
+    try:
+        return EFFECTS[name]
+    except KeyError:
+        raise ValueError(
+            f"unknown effect {name!r}; choose from: {', '.join(available_effects())}"
+        ) from None
+
+
+def available_effects() -> List[str]:
+    """Sorted list of registered effect names."""
+    return sorted(EFFECTS)
+
+
+# bounce_text, drop_text and rise_text draw over several rows and are left out
+for _func in (
+    animations.animated_line,
+    animations.animated_line_dual,
+    animations.fade_in_text,
+    animations.marquee_text,
+    animations.marquee_stream,
+    animations.wave_text,
+    animations.blinking_text,
+    animations.random_fill,
+    animations.reverse_text,
+    animations.rotate_text,
+    animations.combined_animation_simultaneous,
+    animations.glitch_text,
+    animations.rainbow_text,
+    animations.matrix_reveal,
+    animations.typewriter_advanced,
+    animations.scramble_solve,
+    animations.slide_in,
+    animations.pulse_text,
+    animations.reveal_mask,
+    animations.zigzag_text,
+    animations.expanding_center,
+    animations.neon_flicker,
+):
+    register_effect(_func.__name__, _func)
+
+# Short names for the command line
+for _alias, _name in {
+    "typing": "animated_line",
+    "typewriter": "typewriter_advanced",
+    "dual": "animated_line_dual",
+    "fade": "fade_in_text",
+    "marquee": "marquee_text",
+    "ticker": "marquee_stream",
+    "wave": "wave_text",
+    "blink": "blinking_text",
+    "random": "random_fill",
+    "reverse": "reverse_text",
+    "rotate": "rotate_text",
+    "combined": "combined_animation_simultaneous",
+    "glitch": "glitch_text",
+    "rainbow": "rainbow_text",
+    "matrix": "matrix_reveal",
+    "scramble": "scramble_solve",
+    "slide": "slide_in",
+    "pulse": "pulse_text",
+    "reveal": "reveal_mask",
+    "zigzag": "zigzag_text",
+    "expand": "expanding_center",
+    "neon": "neon_flicker",
+}.items():
+    register_effect(_alias, EFFECTS[_name])
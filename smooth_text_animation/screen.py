@@ -0,0 +1,337 @@
+"""
+Screen buffer shared by grid-based effects
+"""
+
+from array import array
+from typing import Dict, Iterator, List, Tuple
+
+
+class Cell:
+    """
+    Snapshot of a single buffer cell.
+
+    Args:
+        char (str): Character in the cell.
+        style (int): Style ID from the buffer's :class:`StyleTable`.
+    """
+
+    __slots__ = ("char", "style")
+
+    def __init__(self, char: str = " ", style: int = 0):
+        self.char = char
+        self.style = style
+
+    def __eq__(self, other):
+        if not isinstance(other, Cell):
+            return NotImplemented
+        return self.char == other.char and self.style == other.style
+
+    def __repr__(self):
+        return f"Cell({self.char!r}, {self.style})"
+
+
+class StyleTable:
+    """
+    Interns ANSI style sequences so cells can store a small integer.
+
+    ID 0 is always the default style (``"\\033[0m"``).
+    """
+
+    __slots__ = ("_codes", "_ids")
+
+    def __init__(self):
+        self._codes: List[str] = ["\033[0m"]
+        self._ids: Dict[str, int] = {"\033[0m": 0, "": 0}
+
+    def intern(self, sequence: str) -> int:
+        """
+        Return the ID for *sequence*, adding it if needed.
+
+        Args:
+            sequence (str): Complete SGR sequence, e.g. ``"\\033[1;32m"``.
+
+        Returns:
+            int: Style ID.
+        """
+        style = self._ids.get(sequence)
+        if style is None:
+            style = len(self._codes)
+            if style > 0xFFFF:
+                raise ValueError("style table is full")
+            self._codes.append(sequence)
+            self._ids[sequence] = style
+        return style
+
+    def sequence(self, style: int) -> str:
+        """
+        Return the escape sequence for a style ID.
+
+        Args:
+            style (int): Style ID.
+
+        Returns:
+            str: SGR sequence.
+        """
+        return self._codes[style]
+
+    def __len__(self):
+        return len(self._codes)
+
+
+class ScreenBuffer:
+    """
+    Fixed rows × cols grid of cells with change tracking.
+
+    Cells live in two flat arrays — codepoints (``array('I')``) and style
+    IDs (``array('H')``). Writes mark their row in a dirty-row bitmap and
+    record the cell range they touched, and :meth:`render` compares only
+    those ranges against what was last rendered, so both the work and the
+    output are proportional to what changed rather than to the buffer size.
+
+    Args:
+        rows (int): Number of rows.
+        cols (int): Number of columns.
+        styles (StyleTable): Style table to share (a new one if None).
+        fill (str): Initial character for every cell.
+    """
+
+    __slots__ = ("rows", "cols", "styles", "codes", "style_ids",
+                 "_front_codes", "_front_styles", "_dirty", "_dirty_rows",
+                 "_spans")
+
+    def __init__(self, rows: int, cols: int, styles: StyleTable = None,
+                 fill: str = " "):
+        if rows < 1 or cols < 1:
+            raise ValueError("rows and cols must be positive")
+        self.rows = rows
+        self.cols = cols
+        self.styles = styles if styles is not None else StyleTable()
+        size = rows * cols
+        self.codes = array("I", [ord(fill)]) * size
+        self.style_ids = array("H", [0]) * size
+        # What the terminal currently shows
+        self._front_codes = array("I", self.codes)
+        self._front_styles = array("H", self.style_ids)
+        self._dirty = bytearray(rows)
+        self._dirty_rows: List[int] = []
+        self._spans: List[Tuple[int, int]] = []
+
+    def _mark(self, row: int, start: int, stop: int):
+        if not self._dirty[row]:
+            self._dirty[row] = 1
+            self._dirty_rows.append(row)
+        base = row * self.cols
+        self._spans.append((base + start, base + stop))
+
+    def put(self, row: int, col: int, char: str, style: int = 0):
+        """
+        Set one cell.
+
+        Args:
+            row (int): Row index.
+            col (int): Column index.
+            char (str): Single character.
+            style (int): Style ID.
+        """
+        index = row * self.cols + col
+        code = ord(char)
+        if self.codes[index] != code or self.style_ids[index] != style:
+            self.codes[index] = code
+            self.style_ids[index] = style
+            self._mark(row, col, col + 1)
+
+    def cell(self, row: int, col: int) -> Cell:
+        """
+        Read one cell.
+
+        Args:
+            row (int): Row index.
+            col (int): Column index.
+
+        Returns:
+            Cell: Snapshot of the cell.
+        """
+        index = row * self.cols + col
+        return Cell(chr(self.codes[index]), self.style_ids[index])
+
+    def blit(self, row: int, col: int, text: str, style: int = 0) -> int:
+        """
+        Write *text* into a row starting at *col*, clipped to the buffer.
+
+        Args:
+            row (int): Row index.
+            col (int): First column (may be negative).
+            text (str): Characters to write.
+            style (int): Style ID for every written cell.
+
+        Returns:
+            int: Number of cells written.
+        """
+        if not 0 <= row < self.rows:
+            return 0
+        if col < 0:
+            text = text[-col:]
+            col = 0
+        text = text[:self.cols - col]
+        if not text:
+            return 0
+        start = row * self.cols + col
+        stop = start + len(text)
+        self.codes[start:stop] = array("I", map(ord, text))
+        self.style_ids[start:stop] = array("H", [style]) * len(text)
+        self._mark(row, col, col + len(text))
+        return len(text)
+
+    def fill(self, char: str = " ", style: int = 0, row: int = 0, col: int = 0,
+             rows: int = None, cols: int = None):
+        """
+        Fill a rectangle with one character and style.
+
+        Args:
+            char (str): Fill character.
+            style (int): Style ID.
+            row (int): Top row.
+            col (int): Left column.
+            rows (int): Height (to the bottom edge if None).
+            cols (int): Width (to the right edge if None).
+        """
+        last_row = self.rows if rows is None else min(self.rows, row + rows)
+        last_col = self.cols if cols is None else min(self.cols, col + cols)
+        col = max(0, col)
+        width = last_col - col
+        if width <= 0:
+            return
+        codes = array("I", [ord(char)]) * width
+        styles = array("H", [style]) * width
+        for r in range(max(0, row), last_row):
+            start = r * self.cols + col
+            self.codes[start:start + width] = codes
+            self.style_ids[start:start + width] = styles
+            self._mark(r, col, last_col)
+
+    def text(self, row: int, start: int = 0, stop: int = None) -> str:
+        """
+        Return the characters of a row slice without styles.
+
+        Args:
+            row (int): Row index.
+            start (int): First column.
+            stop (int): Column after the last one (row end if None).
+
+        Returns:
+            str: Row text.
+        """
+        if stop is None:
+            stop = self.cols
+        base = row * self.cols
+        return "".join(map(chr, self.codes[base + start:base + stop]))
+
+    def composite(self, other: "ScreenBuffer", row: int = 0, col: int = 0,
+                  transparent: str = " "):
+        """
+        Draw another buffer on top of this one.
+
+        Cells of *other* holding *transparent* with the default style are
+        skipped. Both buffers must share a :class:`StyleTable`.
+
+        Args:
+            other (ScreenBuffer): Buffer to draw.
+            row (int): Target row of *other*'s top edge.
+            col (int): Target column of *other*'s left edge.
+            transparent (str): Character treated as see-through (None for
+                an opaque copy).
+        """
+        skip = None if transparent is None else ord(transparent)
+        for src_row in range(other.rows):
+            dst_row = row + src_row
+            if not 0 <= dst_row < self.rows:
+                continue
+            base = src_row * other.cols
+            for src_col in range(other.cols):
+                dst_col = col + src_col
+                if not 0 <= dst_col < self.cols:
+                    continue
+                code = other.codes[base + src_col]
+                style = other.style_ids[base + src_col]
+                if code == skip and style == 0:
+                    continue
+                self.put(dst_row, dst_col, chr(code), style)
+
+    def dirty_rows(self) -> Iterator[int]:
+        """Iterate over rows changed since the last render, top to bottom."""
+        return iter(sorted(self._dirty_rows))
+
+    def invalidate(self):
+        """Force the next render to redraw every cell."""
+        for row in range(self.rows):
+            self._mark(row, 0, self.cols)
+        self._front_codes = array("I", [0]) * (self.rows * self.cols)
+
+    def render(self, inline: bool = False) -> str:
+        """
+        Build the output that brings the terminal up to date with the buffer.
+
+        Only written cells that differ from the last render are emitted,
+        grouped into runs.
+
+        Args:
+            inline (bool): Position with ``\\r`` and relative moves from
+                the buffer's first row (where the cursor must be on entry)
+                instead of absolute screen coordinates. The cursor is
+                returned to the first row afterwards.
+
+        Returns:
+            str: Escape sequence and characters for the changed cells.
+        """
+        if not self._spans:
+            return ""
+        cols = self.cols
+        codes = self.codes
+        style_ids = self.style_ids
+        front_codes = self._front_codes
+        front_styles = self._front_styles
+        sequence = self.styles.sequence
+        parts = []
+        # Every render starts and ends in the default style
+        style = 0
+        cursor_row = 0
+        cursor = -1
+        done = 0
+        self._spans.sort()
+        for start, stop in self._spans:
+            # Overlapping and repeated ranges are only visited once
+            if start < done:
+                start = done
+            for index in range(start, stop):
+                code = codes[index]
+                cell_style = style_ids[index]
+                if code == front_codes[index] and cell_style == front_styles[index]:
+                    continue
+                front_codes[index] = code
+                front_styles[index] = cell_style
+                if index != cursor:
+                    row, col = divmod(index, cols)
+                    if not inline:
+                        parts.append(f"\033[{row + 1};{col + 1}H")
+                    else:
+                        if row != cursor_row:
+                            parts.append(f"\033[{row - cursor_row}B")
+                            cursor_row = row
+                        parts.append("\r" + (f"\033[{col}C" if col else ""))
+                if cell_style != style:
+                    parts.append(sequence(cell_style))
+                    style = cell_style
+                parts.append(chr(code))
+                # The cursor does not advance past the last column
+                cursor = index + 1 if (index + 1) % cols else -1
+            if stop > done:
+                done = stop
+        for row in self._dirty_rows:
+            self._dirty[row] = 0
+        self._dirty_rows = []
+        self._spans = []
+        if style > 0:
+            parts.append("\033[0m")
+        if inline and cursor_row:
+            parts.append(f"\033[{cursor_row}A")
+        return "".join(parts)
@@ -0,0 +1,170 @@
+"""
+Ordinary output printed above a running single-line animation
+"""
+
+import contextlib
+import threading
+from typing import List
+
+from .output import _LineLog, resolve_stream
+
+
+class _FrameStream:
+    """Stream handed to the effect; each ``flush`` ends one frame."""
+
+    def __init__(self, session: "LiveSession"):
+        self.session = session
+
+    def write(self, text: str) -> int:
+        if text:
+            with self.session._lock:
+                self.session._frame.append(text)
+        return len(text)
+
+    def flush(self):
+        self.session._draw_frame()
+
+    def isatty(self) -> bool:
+        return self.session.isatty()
+
+
+class LiveSession:
+    """
+    Lets the application print while a single-line animation runs.
+
+    The animation writes to :attr:`stream`; ordinary text goes through
+    :meth:`write` / :meth:`print` (or ``print()`` itself inside
+    :meth:`redirect`). Complete lines of that text are held until the
+    next frame, then the animated line is cleared, the text is written
+    and the animation is redrawn — all in one write. A burst of prints
+    therefore costs one redraw per frame rather than one per print. If
+    no frame comes within *interval* seconds (the animation is holding,
+    or none is running) the text is written on its own.
+
+    Args:
+        stream: Output target — text stream, binary stream or file
+            descriptor (defaults to ``sys.stdout``).
+        interval (float): Longest time printed text waits for a frame.
+    """
+
+    def __init__(self, stream=None, interval: float = 1 / 30):
+        self.out = resolve_stream(stream)
+        self.interval = interval
+        self.stream = _FrameStream(self)
+        self._lock = threading.RLock()
+        self._line = _LineLog()
+        self._frame: List[str] = []
+        self._above: List[str] = []
+        self._timer = None
+
+    def write(self, text: str) -> int:
+        """
+        Queue text to appear above the animation.
+
+        Text after the last newline waits for the rest of its line.
+
+        Args:
+            text (str): Text as it would be written to stdout.
+
+        Returns:
+            int: Number of characters accepted.
+        """
+        if text:
+            with self._lock:
+                self._above.append(text)
+                if self._timer is None and "\n" in text:
+                    self._timer = threading.Timer(self.interval, self._draw_above)
+                    self._timer.daemon = True
+                    self._timer.start()
+        return len(text)
+
+    def print(self, text: str = ""):
+        """
+        Print a line above the animation.
+
+        Args:
+            text (str): Line to print.
+        """
+        self.write(text + "\n")
+
+    def flush(self):
+        """Queued lines are written with the next frame; nothing to do."""
+
+    def isatty(self) -> bool:
+        try:
+            return self.out.isatty()
+        except (AttributeError, ValueError):
+            return False
+
+    def _compose(self, frame: str, final: bool = False) -> str:
+        above = "".join(self._above)
+        cut = len(above) if final else above.rfind("\n") + 1
+        rest = above[cut:]
+        self._above = [rest] if rest else []
+        lines = above[:cut]
+        if lines and self._line:
+            # Clear the animated line, print, then put the animation back;
+            # a line too long to replay comes back with its next redraw
+            data = "\r\033[K" + lines + (self._line.replay() or "") + frame
+        else:
+            data = lines + frame
+        self._line.feed(frame)
+        return data
+
+    def _write(self, data: str):
+        if data:
+            self.out.write(data)
+            self.out.flush()
+
+    def _draw_frame(self):
+        with self._lock:
+            frame = "".join(self._frame)
+            self._frame = []
+            self._write(self._compose(frame))
+
+    def _draw_above(self):
+        with self._lock:
+            self._timer = None
+            self._write(self._compose(""))
+
+    def effect(self, func, *args, **kwargs):
+        """
+        Run an animation with its output going to this session.
+
+        Args:
+            func: Animation function, or its registered name.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+        """
+        if isinstance(func, str):
+            from .registry import get_effect
+            func = get_effect(func)
+        return func(*args, stream=self.stream, **kwargs)
+
+    @contextlib.contextmanager
+    def redirect(self):
+        """
+        Send ``sys.stdout`` through :meth:`write` for the enclosed block.
+
+        The redirect is process-wide; the animation itself must write to
+        :attr:`stream` (as :meth:`effect` does), not to stdout.
+        """
+        with contextlib.redirect_stdout(self):
+            yield self
+
+    def close(self):
+        """Write anything still queued, including an unfinished line."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            frame = "".join(self._frame)
+            self._frame = []
+            self._write(self._compose(frame, final=True))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
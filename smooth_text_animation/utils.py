@@ -160,34 +160,19 @@ def split_text_to_lines(text: str, max_width: int) -> List[str]:
     """
     Split text into multiple lines based on max width
     
+    Whitespace (including newlines) is collapsed to single spaces and
+    words longer than *max_width* are broken. For large documents, or to
+    keep whitespace and paragraphs, use :func:`smooth_text_animation.layout.wrap`.
+    
     Args:
         text (str): Text to split
-        max_width (int): Maximum width per line
+        max_width (int): Maximum width per line (in terminal cells)
     
     Returns:
         list: List of text lines
     """
-    words = text.split()
-    lines = []
-    current_line = []
-    current_length = 0
-    
-    for word in words:
-        word_length = len(word)
-        
-        if current_length + word_length + len(current_line) <= max_width:
-            current_line.append(word)
-            current_length += word_length
-        else:
-            if current_line:
-                lines.append(" ".join(current_line))
-            current_line = [word]
-            current_length = word_length
-    
-    if current_line:
-        lines.append(" ".join(current_line))
-    
-    return lines
+    from .layout import wrap
+    return list(wrap(" ".join(text.split()), max(1, max_width)))
 
 
 def is_terminal_available() -> bool:
@@ -0,0 +1,77 @@
+# smooth-text-animation/tests/conftest.py
+"""
+Shared fixtures for the test suite
+"""
+
+import re
+
+import pytest
+from smooth_text_animation.layout import char_width
+
+
+class Terminal:
+    """
+    Terminal model for line-based effect output.
+
+    Understands ``"\\r"``, ``"\\n"``, cursor forward (``"\\033[nC"``) and
+    erase to end of line (``"\\033[K"``); colours are ignored and any other
+    escape fails the test. Wide characters take two columns, and
+    overwriting either half erases them. Every flush snapshots the current
+    line into :attr:`frames` as a column-to-character dict; every newline
+    commits it to :attr:`lines`.
+    """
+
+    _TOKEN = re.compile(r"\033\[([\d;]*)([A-Za-z])|.", re.S)
+
+    def __init__(self):
+        self.cells = {}
+        self.col = 0
+        self.lines = []
+        self.frames = []
+
+    def write(self, text):
+        for match in self._TOKEN.finditer(text):
+            code = match.group(2)
+            if code == "C":
+                self.col += int(match.group(1) or 1)
+            elif code == "K":
+                self.cells = {c: ch for c, ch in self.cells.items() if c < self.col}
+            elif code == "m":
+                continue
+            elif code:
+                raise AssertionError(f"unexpected escape {match.group()!r}")
+            elif match.group() == "\r":
+                self.col = 0
+            elif match.group() == "\n":
+                self.lines.append(self.text())
+                self.cells, self.col = {}, 0
+            else:
+                self._put(match.group())
+        return len(text)
+
+    def flush(self):
+        self.frames.append(dict(self.cells))
+
+    def _put(self, char):
+        width = char_width(char)
+        if char_width(self.cells.get(self.col - 1, "")) == 2:
+            del self.cells[self.col - 1]
+        for col in range(self.col + 1, self.col + width):
+            self.cells.pop(col, None)
+        self.cells[self.col] = char
+        self.col += width
+
+    def text(self):
+        """The current line, without trailing blanks."""
+        chars, col, end = [], 0, max(self.cells, default=-1) + 1
+        while col < end:
+            char = self.cells.get(col, " ")
+            chars.append(char)
+            col += char_width(char)
+        return "".join(chars).rstrip()
+
+
+@pytest.fixture
+def terminal():
+    """A fresh :class:`Terminal`."""
+    return Terminal()
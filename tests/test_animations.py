@@ -3,12 +3,17 @@
 Unit tests for smooth_text_animation package
 """
 
+import io
+import itertools
+import tracemalloc
+
 import pytest
 from smooth_text_animation import (
     animated_line,
     animated_line_dual,
     fade_in_text,
     marquee_text,
+    marquee_stream,
     wave_text,
     blinking_text,
     random_fill,
@@ -20,6 +25,8 @@ from smooth_text_animation import (
     matrix_reveal,
     typewriter_advanced,
     bounce_text,
+    drop_text,
+    rise_text,
     scramble_solve,
     slide_in,
     pulse_text,
@@ -27,7 +34,9 @@ from smooth_text_animation import (
     zigzag_text,
     expanding_center,
     neon_flicker,
+    VirtualClock,
 )
+from smooth_text_animation.layout import char_width
 
 
 # ---------------------------------------------------------------------------
@@ -115,6 +124,28 @@ class TestNewAnimations:
         bounce_text("Bounce", delay=0, bounces=1)
         assert len(capsys.readouterr().out) > 0
 
+    def test_bounce_text_does_not_scroll(self, capsys):
+        bounce_text("Bounce", delay=0, bounces=1)
+        short = capsys.readouterr().out
+        bounce_text("Bounce", delay=0, bounces=10)
+        long = capsys.readouterr().out
+        # Rows are reserved once; frames only use cursor movement
+        assert short.count("\n") == long.count("\n") == 3
+        per_frame = (len(long) - len(short)) / (9 * 7)
+        assert per_frame < 40
+
+    def test_drop_text(self, capsys):
+        drop_text("Drop", delay=0, height=4)
+        out = capsys.readouterr().out
+        assert "Drop" in out
+        assert out.endswith("\n")
+
+    def test_rise_text(self, capsys):
+        rise_text("Rise", delay=0, height=4)
+        out = capsys.readouterr().out
+        assert out.count("Rise") == 4
+        assert out.count("\n") == 3
+
     def test_scramble_solve(self, capsys):
         scramble_solve("Scramble", delay=0, iterations=5)
         out = capsys.readouterr().out
@@ -200,6 +231,202 @@ class TestParameterValidation:
         capsys.readouterr()
 
 
+# ---------------------------------------------------------------------------
+# Complexity
+# ---------------------------------------------------------------------------
+
+class _CountingStream:
+    """Text stream that only counts the characters written to it."""
+
+    def __init__(self):
+        self.chars = 0
+
+    def write(self, text):
+        self.chars += len(text)
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+class TestRevealComplexity:
+    """Reveal effects emit output proportional to the cells they change."""
+
+    @pytest.mark.parametrize("fn", [
+        random_fill, matrix_reveal, zigzag_text, expanding_center,
+        lambda text, **kw: scramble_solve(text, iterations=20, **kw),
+    ])
+    def test_output_scales_linearly(self, fn):
+        sizes = []
+        for n in (1000, 4000):
+            stream = _CountingStream()
+            fn("x" * n, delay=0, stream=stream)
+            sizes.append(stream.chars)
+        # Quadratic frame building would grow 16x; allow for longer
+        # cursor-move escapes on wider lines
+        assert sizes[1] < sizes[0] * 5
+
+
+class TestWideText:
+    """Cell-diff effects keep wide characters at their display column."""
+
+    @pytest.mark.parametrize("fn", [
+        random_fill, matrix_reveal, zigzag_text, expanding_center,
+        lambda text, **kw: scramble_solve(text, iterations=5, **kw),
+    ])
+    def test_cjk_columns(self, fn, terminal):
+        text = "你好·世界"
+        final = {}
+        column = 0
+        for char in text:
+            final[char] = column
+            column += char_width(char)
+        fn(text, delay=0, stream=terminal)
+        for frame in terminal.frames:
+            for col, char in frame.items():
+                if char in final:
+                    assert col == final[char], (char, frame)
+        assert terminal.lines == [text]
+
+
+# ---------------------------------------------------------------------------
+# Streaming marquee
+# ---------------------------------------------------------------------------
+
+class _StopAfter(_CountingStream):
+    """Counting stream that stops the effect after a number of frames."""
+
+    def __init__(self, frames):
+        super().__init__()
+        self.frames = frames
+
+    def flush(self):
+        self.frames -= 1
+        if self.frames < 0:
+            raise KeyboardInterrupt
+
+
+class TestMarqueeStream:
+    """Marquee over iterables of segments with bounded memory."""
+
+    def _frames(self, *args, **kwargs):
+        out = io.StringIO()
+        marquee_stream(*args, stream=out, clock=VirtualClock(), **kwargs)
+        return out.getvalue().rstrip("\n").split("\r")[1:]
+
+    def test_matches_marquee_text(self):
+        out = io.StringIO()
+        marquee_text("Ticker", width=4, delay=0, stream=out)
+        assert self._frames(["Tic", "ker"], width=4, delay=0) == \
+            out.getvalue().rstrip("\n").split("\r")[1:]
+
+    def test_separator(self):
+        frames = self._frames(["AB", "CD"], width=5, separator=" | ")
+        assert "AB | " in frames
+        assert frames[-1] == " " * 5
+
+    def test_pulls_input_lazily(self):
+        pulled = []
+
+        def feed():
+            for i in itertools.count():
+                pulled.append(i)
+                yield f"<{i}>"
+
+        with pytest.raises(KeyboardInterrupt):
+            marquee_stream(feed(), width=10, delay=0, stream=_StopAfter(100))
+        # 100 one-cell steps need about 100 characters of 3-4 char segments
+        assert len(pulled) < 40
+
+    def test_memory_bounded(self):
+        feed = itertools.cycle(["AAPL 187.20 ", "MSFT 402.10 ", "NVDA 880.00 "])
+        tracemalloc.start()
+        try:
+            with pytest.raises(KeyboardInterrupt):
+                marquee_stream(feed, width=80, delay=0, stream=_StopAfter(50_000))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert peak < 64 * 1024
+
+    def test_fractional_speed_holds_frames(self):
+        clock = VirtualClock()
+        out = io.StringIO()
+        marquee_stream("abcd", width=2, delay=0.1, speed=0.5, stream=out, clock=clock)
+        frames = out.getvalue().rstrip("\n").split("\r")[1:]
+        assert len(frames) == 7
+        # Each of the 7 windows is held for two steps
+        assert clock.now() == pytest.approx(1.4)
+
+    def test_variable_speed(self):
+        frames = self._frames("abcdef", width=3, speed=lambda step: step + 1)
+        assert frames[:4] == ["   ", "  a", "abc", "def"]
+
+    def test_invalid_speed(self):
+        with pytest.raises(ValueError):
+            marquee_stream("abc", speed=0)
+
+
+# ---------------------------------------------------------------------------
+# Duration and easing
+# ---------------------------------------------------------------------------
+
+class TestDuration:
+    """Effects given a duration run for that long at any text length."""
+
+    @pytest.mark.parametrize("fn", [
+        animated_line, animated_line_dual, random_fill, reverse_text, slide_in,
+        reveal_mask, zigzag_text, expanding_center,
+    ])
+    @pytest.mark.parametrize("length", [4, 10_000])
+    def test_runtime_independent_of_length(self, fn, length):
+        clock = VirtualClock()
+        out = io.StringIO()
+        fn("x" * length, duration=1.5, fps=60, stream=out, clock=clock)
+        assert clock.now() == pytest.approx(1.5, abs=1 / 60)
+        assert len(clock.schedule) <= 91
+        assert out.getvalue().rstrip("\n").endswith("x" * min(length, 4))
+
+    def test_many_characters_per_frame(self):
+        clock = VirtualClock()
+        out = io.StringIO()
+        animated_line("x" * 10_000, duration=1.0, fps=10, stream=out, clock=clock)
+        frames = out.getvalue().split("\r")[1:]
+        lengths = [len(frame.rstrip("\n")) for frame in frames]
+        assert lengths == sorted(lengths)
+        assert len(frames) == 11
+        assert lengths[-1] == 10_000
+
+    def test_easing_changes_pacing(self):
+        def revealed_at_half(easing):
+            clock = VirtualClock()
+            shown = {}
+
+            class Recorder(io.StringIO):
+                def write(self, text):
+                    if text.startswith("\r"):
+                        shown[round(clock.now(), 6)] = len(text) - 1
+                    return len(text)
+
+            animated_line("x" * 100, duration=1.0, fps=10, easing=easing,
+                          stream=Recorder(), clock=clock)
+            return max(count for at, count in shown.items() if at <= 0.5)
+
+        assert revealed_at_half("linear") == 50
+        assert revealed_at_half("ease_in") == 25
+        assert revealed_at_half(lambda t: t ** 3) == 12
+
+    def test_unknown_easing(self):
+        with pytest.raises(ValueError, match="unknown easing"):
+            animated_line("x", duration=1.0, easing="bouncy", stream=io.StringIO(),
+                          clock=VirtualClock())
+
+    def test_step_mode_unchanged(self):
+        clock = VirtualClock()
+        animated_line("abc", delay=0.1, stream=io.StringIO(), clock=clock)
+        assert clock.durations == pytest.approx([0.1] * 4)
+
+
 # ---------------------------------------------------------------------------
 # Integration
 # ---------------------------------------------------------------------------
@@ -0,0 +1,143 @@
+# smooth-text-animation/tests/test_cli.py
+"""
+Unit tests for the streaming command-line interface
+"""
+
+import io
+import subprocess
+import sys
+import time
+
+import pytest
+from smooth_text_animation.cli import main
+from smooth_text_animation.registry import (
+    EFFECTS, available_effects, get_effect, register_effect,
+)
+
+
+class TestRegistry:
+    """Test suite for the effect registry."""
+
+    def test_builtin_names_and_aliases(self):
+        assert get_effect("typewriter") is get_effect("typewriter_advanced")
+        assert "glitch_text" in available_effects()
+
+    def test_unknown_effect(self):
+        with pytest.raises(ValueError, match="unknown effect"):
+            get_effect("nope")
+
+    def test_register_decorator(self):
+        @register_effect("test_upper")
+        def upper(text, delay=0, stream=None, clock=None):
+            stream.write(text.upper() + "\n")
+
+        try:
+            out = io.StringIO()
+            main(["--effect", "test_upper", "--force"],
+                 stdin=io.StringIO("hi\n"), stdout=out)
+            assert out.getvalue() == "HI\r\033[Khi\n"
+        finally:
+            del EFFECTS["test_upper"]
+
+
+class TestCli:
+    """Test suite for stdin streaming."""
+
+    def test_passthrough_when_not_tty(self):
+        data = "one\n\ntwo\nno newline"
+        out = io.StringIO()
+        assert main(["--effect", "glitch"], stdin=io.StringIO(data), stdout=out) == 0
+        assert out.getvalue() == data
+
+    def test_animates_last_line(self):
+        out = io.StringIO()
+        main(["--effect", "typing", "--force", "--fps", "1000"],
+             stdin=io.StringIO("abc\n"), stdout=out)
+        assert out.getvalue() == "\r\ra\rab\rabc\r\033[Kabc\n"
+
+    def test_burst_is_passed_through_in_order(self):
+        lines = [f"line {i}\n" for i in range(2000)]
+        out = io.StringIO()
+        start = time.perf_counter()
+        main(["--effect", "typewriter", "--force", "--fps", "10"],
+             stdin=io.StringIO("".join(lines)), stdout=out)
+        assert time.perf_counter() - start < 5.0
+        text = out.getvalue()
+        positions = [text.index(line.strip()) for line in lines[::100]]
+        assert positions == sorted(positions)
+        assert text.endswith("line 1999\n")
+
+    def test_latency_budget_cuts_animation_short(self):
+        out = io.StringIO()
+        start = time.perf_counter()
+        main(["--effect", "typing", "--force", "--fps", "10",
+              "--max-latency", "0.2"],
+             stdin=io.StringIO("x" * 100 + "\n"), stdout=out)
+        assert time.perf_counter() - start < 2.0
+        assert out.getvalue().endswith("\r\033[K" + "x" * 100 + "\n")
+
+    def test_block_heads_animates_first_line_only(self):
+        out = io.StringIO()
+        calls = []
+
+        def record(text, delay=0, stream=None, clock=None):
+            calls.append(text)
+            stream.write(text + "\n")
+
+        register_effect("test_block", record)
+        try:
+            # Feed one line at a time so nothing is treated as backlog
+            class SlowStdin:
+                def __init__(self, lines):
+                    self.lines = list(lines)
+
+                def readline(self):
+                    time.sleep(0.01)
+                    return self.lines.pop(0) if self.lines else ""
+
+            main(["--effect", "test_block", "--force", "--block-heads"],
+                 stdin=SlowStdin(["head\n", "body\n", "\n", "head2\n"]),
+                 stdout=out)
+        finally:
+            del EFFECTS["test_block"]
+        assert calls == ["head", "head2"]
+        assert out.getvalue() == "head\r\033[Khead\nbody\n\nhead2\r\033[Khead2\n"
+
+    def test_list(self):
+        out = io.StringIO()
+        assert main(["--list"], stdout=out) == 0
+        assert "typewriter" in out.getvalue().split()
+
+    def test_invalid_fps(self):
+        with pytest.raises(SystemExit):
+            main(["--fps", "0"], stdin=io.StringIO(""), stdout=io.StringIO())
+
+
+class TestEveryEffect:
+    """Every registered effect leaves its input line in the output."""
+
+    @pytest.mark.parametrize("name", [
+        name for name in available_effects() if get_effect(name).__name__ == name
+    ])
+    def test_line_survives(self, name, terminal):
+        out = io.StringIO()
+        main(["--effect", name, "--force", "--fps", "1000", "--max-latency", "5"],
+             stdin=io.StringIO("hello world\n"), stdout=out)
+        terminal.write(out.getvalue())
+        assert terminal.lines[-1] == "hello world"
+
+    def test_erasing_effect_keeps_every_line(self, terminal):
+        out = io.StringIO()
+        main(["--effect", "combined", "--force"],
+             stdin=io.StringIO("first\nsecond\n"), stdout=out)
+        terminal.write(out.getvalue())
+        assert terminal.lines == ["first", "second"]
+
+
+def test_module_entry_point():
+    result = subprocess.run(
+        [sys.executable, "-m", "smooth_text_animation"],
+        input="piped\n", capture_output=True, text=True, timeout=30,
+    )
+    assert result.returncode == 0
+    assert result.stdout == "piped\n"
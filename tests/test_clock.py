@@ -0,0 +1,100 @@
+# smooth-text-animation/tests/test_clock.py
+"""
+Timing tests driven by a virtual clock
+"""
+
+import io
+import time
+
+import pytest
+from smooth_text_animation import (
+    animated_line,
+    blinking_text,
+    combined_animation_simultaneous,
+    typewriter_advanced,
+    matrix_rain,
+)
+from smooth_text_animation.clock import MonotonicClock, VirtualClock
+
+
+class TestVirtualClock:
+    """Test suite for the simulated clock."""
+
+    def test_sleep_advances_and_records(self):
+        clock = VirtualClock()
+        clock.sleep(0.5)
+        clock.sleep(0)
+        clock.sleep_until(2.0)
+        clock.sleep_until(1.0)
+        assert clock.now() == 2.0
+        assert clock.schedule == [(0.0, 0.5), (0.5, 2.0)]
+
+    def test_advance_is_not_recorded(self):
+        clock = VirtualClock(start=10.0)
+        clock.advance(1.0)
+        assert clock.now() == 11.0
+        assert clock.schedule == []
+
+
+def test_monotonic_clock_sleep_until():
+    clock = MonotonicClock()
+    deadline = clock.now() + 0.01
+    clock.sleep_until(deadline)
+    assert clock.now() >= deadline
+
+
+class TestEffectTiming:
+    """Effects hold each frame for exactly the requested time."""
+
+    def test_animated_line_holds(self):
+        clock = VirtualClock()
+        animated_line("Hello", delay=0.05, stream=io.StringIO(), clock=clock)
+        assert clock.durations == pytest.approx([0.05] * 6)
+
+    def test_blinking_text_duration(self):
+        clock = VirtualClock()
+        blinking_text("Blink", repeat=3, delay=0.3, stream=io.StringIO(),
+                      clock=clock)
+        assert clock.now() == pytest.approx(1.8)
+
+    def test_combined_pause(self):
+        clock = VirtualClock()
+        combined_animation_simultaneous("Test", delay=0.1, pause=0.5,
+                                        stream=io.StringIO(), clock=clock)
+        durations = clock.durations
+        # Three fade-in steps, the pause, then three fade-out steps
+        assert durations == pytest.approx([0.1] * 3 + [0.5] + [0.1] * 3)
+
+    def test_typewriter_jitter_bounds(self):
+        clock = VirtualClock()
+        typewriter_advanced("x" * 200, delay=0.08, mistake_probability=0.0,
+                            stream=io.StringIO(), clock=clock)
+        durations = clock.durations
+        assert len(durations) == 200
+        assert all(0.06 - 1e-9 <= d <= 0.12 + 1e-9 for d in durations)
+
+    def test_typewriter_mistake_half_hold(self):
+        clock = VirtualClock()
+        typewriter_advanced("ab", delay=0.1, mistake_probability=1.0,
+                            stream=io.StringIO(), clock=clock)
+        # First char, then wrong char, half-length correction, second char
+        assert clock.durations[1:3] == pytest.approx([0.1, 0.05])
+
+    def test_slow_frames_do_not_drift(self):
+        class SlowClock(VirtualClock):
+            def sleep_until(self, deadline):
+                super().sleep_until(deadline)
+                self.advance(0.01)  # Simulated write cost after every frame
+
+        clock = SlowClock()
+        animated_line("x" * 9, delay=0.1, stream=io.StringIO(), clock=clock)
+        # Ten holds of 0.1s, with the write time absorbed into each hold
+        assert clock.now() == pytest.approx(1.01)
+
+    def test_large_simulation_is_instant(self):
+        clock = VirtualClock()
+        start = time.perf_counter()
+        matrix_rain("SIM", duration=60.0, fps=30, width=40, height=10,
+                    stream=io.StringIO(), clock=clock)
+        assert clock.now() == pytest.approx(60.0)
+        assert time.perf_counter() - start < 5.0
@@ -0,0 +1,53 @@
+# smooth-text-animation/tests/test_easing.py
+"""
+Unit tests for easing curves
+"""
+
+import pytest
+from smooth_text_animation.easing import (
+    EASINGS, cubic_bezier, ease_in, ease_in_out, ease_out, linear, resolve_easing,
+)
+
+
+class TestEasing:
+    """Test suite for the easing functions."""
+
+    @pytest.mark.parametrize("ease", list(EASINGS.values()))
+    def test_endpoints(self, ease):
+        assert ease(0.0) == pytest.approx(0.0)
+        assert ease(1.0) == pytest.approx(1.0)
+
+    @pytest.mark.parametrize("ease", list(EASINGS.values()))
+    def test_monotonic(self, ease):
+        values = [ease(i / 100) for i in range(101)]
+        assert values == sorted(values)
+
+    def test_shapes(self):
+        assert linear(0.3) == 0.3
+        assert ease_in(0.5) < 0.5 < ease_out(0.5)
+        assert ease_in_out(0.5) == pytest.approx(0.5)
+        assert ease_in_out(0.25) < 0.25
+
+    def test_cubic_bezier_linear(self):
+        ease = cubic_bezier(0.25, 0.25, 0.75, 0.75)
+        for i in range(11):
+            assert ease(i / 10) == pytest.approx(i / 10, abs=1e-5)
+
+    def test_cubic_bezier_matches_css_ease(self):
+        # Reference value of CSS "ease" at t = 0.5
+        assert EASINGS["ease"](0.5) == pytest.approx(0.8024, abs=1e-3)
+
+    def test_cubic_bezier_overshoot(self):
+        ease = cubic_bezier(0.3, 1.8, 0.7, 1.4)
+        assert max(ease(i / 100) for i in range(101)) > 1.0
+
+    def test_cubic_bezier_invalid(self):
+        with pytest.raises(ValueError):
+            cubic_bezier(1.5, 0, 0.5, 1)
+
+    def test_resolve(self):
+        assert resolve_easing(None) is linear
+        assert resolve_easing("ease_in") is ease_in
+        assert resolve_easing(ease_out) is ease_out
+        with pytest.raises(ValueError, match="unknown easing"):
+            resolve_easing("nope")
@@ -0,0 +1,161 @@
+# smooth-text-animation/tests/test_grid.py
+"""
+Unit tests for whole-grid frames and their backends
+"""
+
+import io
+import random
+import time
+
+import pytest
+from smooth_text_animation import grid
+from smooth_text_animation.clock import VirtualClock
+from smooth_text_animation.grid import (
+    GridFrame,
+    available_backends,
+    grid_frame,
+    plasma_field,
+    scramble_screen,
+)
+from smooth_text_animation.screen import Cell
+
+BACKENDS = available_backends()
+
+
+def _draw(backend):
+    """Reveal half of a text block, then shade the grid; return all output."""
+    frame = grid_frame(4, 7, backend=backend)
+    palette = [frame.styles.intern(f"\033[3{i}m") for i in range(4)]
+    bold = frame.styles.intern("\033[1m")
+    rng = random.Random(7)
+    values = [rng.random() for _ in range(28)]
+    values = [v * ((i % 5) + 1) / 5 for i, v in enumerate(values)]
+    thresholds = frame.field(values)
+    target = frame.text_field("hello\nworld wide\nx")
+    frame.reveal(target, thresholds, 0.5, bold, palette)
+    revealed = frame.render()
+    frame.shade(thresholds, " .:#", palette, shift=0.3)
+    return revealed, frame.render(), frame.render()
+
+
+class TestGridFrame:
+    """Test suite shared by every available backend."""
+
+    @pytest.fixture(params=BACKENDS)
+    def backend(self, request):
+        return request.param
+
+    def test_invalid_size(self, backend):
+        with pytest.raises(ValueError):
+            grid_frame(0, 3, backend=backend)
+
+    def test_field_size_checked(self, backend):
+        frame = grid_frame(2, 2, backend=backend)
+        with pytest.raises(ValueError):
+            frame.field([0.5] * 3)
+
+    def test_reveal_locks_reached_cells(self, backend):
+        frame = grid_frame(1, 4, backend=backend)
+        palette = [frame.styles.intern("\033[2m"), frame.styles.intern("\033[32m")]
+        target = frame.text_field("abcd")
+        thresholds = frame.field([0.0, 0.5, 0.55, 0.9])
+        frame.reveal(target, thresholds, 0.5, 9, palette, window=0.2)
+        assert frame.text(0) == "ab  "
+        assert frame.cell(0, 1) == Cell("b", 9)
+        # Close to locking gets the bright end of the palette, far the dim one
+        assert frame.cell(0, 2).style == palette[1]
+        assert frame.cell(0, 3).style == palette[0]
+
+    def test_scatter_spares_revealed_cells(self, backend):
+        frame = grid_frame(2, 50, backend=backend, seed=3)
+        thresholds = frame.field([0.0] * 50 + [1.0] * 50)
+        frame.scatter("#", 1.0, thresholds, 0.5)
+        assert frame.text(0) == " " * 50
+        assert frame.text(1) == "#" * 50
+
+    def test_text_field_clips(self, backend):
+        frame = grid_frame(2, 3, backend=backend)
+        frame.reveal(frame.text_field("abcdef\ngh\nzzz"),
+                     frame.field([0.0] * 6), 0.0, 0)
+        assert [frame.text(0), frame.text(1)] == ["abc", "gh "]
+
+    def test_shade_ramps(self, backend):
+        frame = grid_frame(1, 3, backend=backend)
+        frame.shade(frame.field([0.0, 0.5, 1.0]), " .#", [4, 5], shift=0.25)
+        assert frame.text(0) == " .#"
+        assert [frame.cell(0, c).style for c in range(3)] == [4, 5, 4]
+
+    def test_render_only_changed_rows(self, backend):
+        frame = grid_frame(3, 4, backend=backend)
+        frame.fill("x")
+        assert frame.render().count(";1H") == 3
+        assert frame.render() == ""
+        frame.shade(frame.field([0.0] * 8 + [1.0] * 4), "x#", [0])
+        out = frame.render()
+        assert out == "\033[3;1H\033[0m####\033[0m"
+
+    def test_plasma_in_range(self, backend):
+        frame = grid_frame(5, 9, backend=backend)
+        values = list(map(float, _flat(frame.plasma(1.3))))
+        assert len(values) == 45
+        assert all(0.0 <= v <= 1.0 for v in values)
+
+    def test_scramble_screen_resolves(self, backend):
+        buf = io.StringIO()
+        scramble_screen("DONE\nok", duration=0.2, fps=20, width=12, height=3,
+                        backend=backend, stream=buf, clock=VirtualClock())
+        out = buf.getvalue()
+        assert out.startswith("\033[?25l\033[2J")
+        assert out.endswith("\033[3;1H\033[?25h\n")
+        # The last frame shows every remaining cell in its final state
+        assert "ok          " in out
+
+    def test_plasma_field_output(self, backend):
+        buf = io.StringIO()
+        plasma_field(duration=0.1, fps=20, width=10, height=3,
+                     backend=backend, stream=buf, clock=VirtualClock())
+        assert "\033[0;38;5;" in buf.getvalue()
+        with pytest.raises(ValueError):
+            plasma_field(glyphs="", width=5, height=2, backend=backend)
+
+
+def _flat(values):
+    return values.ravel() if hasattr(values, "ravel") else values
+
+
+def test_grid_frame_is_abstract():
+    with pytest.raises(TypeError):
+        GridFrame(2, 2)
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        grid_frame(2, 2, backend="gpu")
+
+
+def test_numpy_backend_missing(monkeypatch):
+    monkeypatch.setattr(grid, "numpy", None)
+    assert available_backends() == ["python"]
+    assert grid_frame(2, 2).backend == "python"
+    with pytest.raises(ImportError):
+        grid_frame(2, 2, backend="numpy")
+
+
+def test_backends_render_identically():
+    pytest.importorskip("numpy")
+    assert _draw("numpy") == _draw("python")
+
+
+def test_numpy_frame_budget_100k_cells():
+    pytest.importorskip("numpy")
+    frame = grid_frame(250, 400, backend="numpy")
+    palette = [frame.styles.intern(f"\033[38;5;{c}m") for c in range(16, 46)]
+    thresholds = frame.random_field()
+    target = frame.text_field("log line\n" * 250)
+    start = time.perf_counter()
+    for i in range(10):
+        frame.scatter("ABC", 0.3, thresholds, i / 10)
+        frame.reveal(target, thresholds, i / 10, 1, palette)
+        frame.render()
+    # Generous bound: 10 full-screen frames of 100k cells
+    assert time.perf_counter() - start < 2.0
@@ -0,0 +1,221 @@
+# smooth-text-animation/tests/test_handlers.py
+"""
+Unit tests for the animated logging handler
+"""
+
+import io
+import logging
+import threading
+import time
+
+import pytest
+from smooth_text_animation import AnimatedLogHandler
+from smooth_text_animation.registry import available_effects, get_effect
+
+
+class _RecordingEffect:
+    """Effect that records its calls and paces frames through the clock."""
+
+    def __init__(self, frames=3):
+        self.frames = frames
+        self.calls = []
+
+    def __call__(self, text, delay=0.0, stream=None, clock=None):
+        self.calls.append(text)
+        deadline = clock.now()
+        for i in range(1, self.frames + 1):
+            stream.write("\r" + text[:len(text) * i // self.frames])
+            stream.flush()
+            deadline += delay
+            clock.sleep_until(deadline)
+        stream.write("\n")
+
+
+@pytest.fixture
+def logger():
+    log = logging.getLogger("test_handlers")
+    log.propagate = False
+    log.setLevel(logging.DEBUG)
+    yield log
+    for handler in list(log.handlers):
+        log.removeHandler(handler)
+        handler.close()
+
+
+def _lines(out):
+    # Final state of every terminal line
+    return [line.rpartition("\r")[2].replace("\033[K", "")
+            for line in out.getvalue().split("\n")[:-1]]
+
+
+class TestAnimatedLogHandler:
+    """Test suite for AnimatedLogHandler."""
+
+    def test_plain_and_animated(self, logger):
+        out = io.StringIO()
+        effect = _RecordingEffect()
+        handler = AnimatedLogHandler(stream=out, effects={logging.ERROR: effect},
+                                     delay=0)
+        logger.addHandler(handler)
+        logger.info("starting")
+        handler.flush()
+        logger.error("failed")
+        handler.flush()
+        assert effect.calls == ["failed"]
+        assert _lines(out) == ["starting", "failed"]
+
+    def test_emit_never_waits_for_animation(self, logger):
+        out = io.StringIO()
+        effect = _RecordingEffect(frames=10)
+        handler = AnimatedLogHandler(stream=out, effects={logging.INFO: effect},
+                                     delay=0.05)
+        logger.addHandler(handler)
+        started = time.monotonic()
+        for i in range(100):
+            logger.info("line %d", i)
+        # One animation alone takes 0.5s
+        assert time.monotonic() - started < 0.25
+        handler.flush(timeout=5)
+        assert _lines(out) == [f"line {i}" for i in range(100)]
+
+    def test_burst_animates_most_important(self, logger):
+        out = io.StringIO()
+        effect = _RecordingEffect()
+        handler = AnimatedLogHandler(stream=out, delay=0,
+                                     effects={logging.INFO: effect, logging.ERROR: effect})
+        gate = threading.Event()
+        blocker = lambda text, delay=0, stream=None, clock=None: gate.wait()
+        logger.addHandler(handler)
+        # Hold the render thread so the next records queue up as one burst
+        logger.info("hold", extra={"animation": blocker})
+        time.sleep(0.05)
+        logger.info("a")
+        logger.error("b")
+        logger.info("c")
+        gate.set()
+        handler.flush(timeout=5)
+        assert effect.calls == ["b"]
+        assert _lines(out)[-3:] == ["a", "b", "c"]
+
+    def test_animation_gives_way_to_new_records(self, logger):
+        out = io.StringIO()
+        effect = _RecordingEffect(frames=100)
+        handler = AnimatedLogHandler(stream=out, effects={logging.ERROR: effect},
+                                     delay=0.1)
+        logger.addHandler(handler)
+        started = time.monotonic()
+        logger.error("slow")
+        time.sleep(0.05)
+        logger.info("next")
+        handler.flush(timeout=5)
+        assert time.monotonic() - started < 2
+        assert _lines(out) == ["slow", "next"]
+
+    def test_budget_exhausted(self, logger):
+        out = io.StringIO()
+        effect = _RecordingEffect()
+        handler = AnimatedLogHandler(stream=out, effects={logging.INFO: effect},
+                                     max_animation_share=0, burst=0, delay=0)
+        logger.addHandler(handler)
+        logger.info("plain")
+        handler.flush()
+        assert effect.calls == []
+        assert out.getvalue() == "plain\n"
+
+    def test_per_record_override(self, logger):
+        out = io.StringIO()
+        effect = _RecordingEffect()
+        handler = AnimatedLogHandler(stream=out, delay=0)
+        logger.addHandler(handler)
+        logger.info("milestone", extra={"animation": effect})
+        handler.flush()
+        logger.error("quiet", extra={"animation": False})
+        handler.flush()
+        assert effect.calls == ["milestone"]
+        assert out.getvalue().endswith("quiet\n")
+
+    def test_registered_name_and_traceback(self, logger):
+        out = io.StringIO()
+        handler = AnimatedLogHandler(stream=out, effects={logging.ERROR: "fade"},
+                                     delay=0)
+        logger.addHandler(handler)
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            logger.exception("crashed")
+        handler.flush()
+        text = out.getvalue()
+        assert "crashed" in text
+        assert text.rstrip().endswith("RuntimeError: boom")
+
+    def test_close_writes_remaining(self, logger):
+        out = io.StringIO()
+        handler = AnimatedLogHandler(stream=out)
+        logger.addHandler(handler)
+        for i in range(5):
+            logger.info("r%d", i)
+        logger.removeHandler(handler)
+        handler.close()
+        assert not handler._thread.is_alive()
+        assert out.getvalue() == "".join(f"r{i}\n" for i in range(5))
+
+    def test_failing_effect_is_reported(self, logger):
+        out = io.StringIO()
+        errors = []
+
+        def broken(text, delay=0.0, stream=None, clock=None):
+            stream.write("\r" + text[:2])
+            raise RuntimeError("effect failed")
+
+        handler = AnimatedLogHandler(stream=out, effects={logging.ERROR: broken},
+                                     delay=0)
+        handler.handleError = errors.append
+        logger.addHandler(handler)
+        def plain(message):
+            record = logger.makeRecord(logger.name, logging.INFO, __file__, 0,
+                                       message, (), None)
+            return record, message, None
+
+        with handler._cond:
+            # Queue the burst before the render thread picks any of it up
+            handler._pending.append(plain("before"))
+            logger.error("bad")
+            handler._pending.append(plain("after"))
+        handler.flush()
+        assert [record.getMessage() for record in errors] == ["bad"]
+        assert _lines(out) == ["before", "bad", "after"]
+
+    def test_failing_stream_is_reported(self, logger):
+        class Flaky(io.StringIO):
+            fail = True
+
+            def write(self, text):
+                if self.fail:
+                    self.fail = False
+                    raise OSError("stream failed")
+                return super().write(text)
+
+        out = Flaky()
+        errors = []
+        handler = AnimatedLogHandler(stream=out)
+        handler.handleError = errors.append
+        logger.addHandler(handler)
+        logger.info("lost?")
+        handler.flush()
+        logger.info("next")
+        handler.flush()
+        assert [record.getMessage() for record in errors] == ["lost?"]
+        assert out.getvalue() == "lost?\nnext\n"
+
+
+@pytest.mark.parametrize("name", [
+    name for name in available_effects() if get_effect(name).__name__ == name
+])
+def test_every_effect_keeps_the_record(logger, name):
+    out = io.StringIO()
+    handler = AnimatedLogHandler(stream=out, effects={logging.INFO: name},
+                                 delay=0, burst=100.0)
+    logger.addHandler(handler)
+    logger.info("deploy finished")
+    handler.flush()
+    assert _lines(out) == ["deploy finished"]
@@ -0,0 +1,127 @@
+# smooth-text-animation/tests/test_layout.py
+"""
+Unit tests for the streaming text layout engine
+"""
+
+import itertools
+import tracemalloc
+
+import pytest
+import smooth_text_animation.layout as layout_module
+from smooth_text_animation.layout import (
+    TextLayout, char_width, layout_for, text_width, wrap,
+)
+from smooth_text_animation.utils import split_text_to_lines
+
+
+class TestWidth:
+    """Display width measurement."""
+
+    def test_widths(self):
+        assert char_width("a") == 1
+        assert char_width("日") == 2
+        assert char_width("́") == 0
+        assert text_width("éte") == 3
+        assert text_width("日本 ok") == 7
+
+
+class TestWrap:
+    """Test suite for wrap()."""
+
+    def test_basic(self):
+        assert list(wrap("the quick brown fox", 10)) == ["the quick", "brown fox"]
+
+    def test_keeps_whitespace_and_paragraphs(self):
+        text = "  indented  two\n\n\tnext"
+        assert list(wrap(text, 40)) == ["  indented  two", "", "        next"]
+
+    def test_drops_whitespace_at_breaks(self):
+        assert list(wrap("aaaa    bbbb   ", 6)) == ["aaaa", "bbbb"]
+
+    def test_hard_breaks_long_words(self):
+        assert list(wrap("ab abcdefghij", 4)) == ["ab", "abcd", "efgh", "ij"]
+
+    def test_wide_characters(self):
+        lines = list(wrap("日本語のテキスト", 5))
+        assert all(text_width(line) <= 5 for line in lines)
+        assert "".join(lines) == "日本語のテキスト"
+
+    def test_chunks_split_mid_word(self):
+        chunks = ["hel", "lo wo", "rld\nsecond ", "", "line"]
+        assert list(wrap(chunks, 5)) == ["hello", "world", "secon", "d", "line"]
+
+    def test_lazy(self):
+        pulled = []
+
+        def chunks():
+            for i in itertools.count():
+                pulled.append(i)
+                yield "word "
+
+        lines = wrap(chunks(), 20)
+        assert [next(lines) for _ in range(3)] == ["word word word word"] * 3
+        assert len(pulled) < 20
+
+    def test_first_line_memory_bounded(self):
+        text = "word " * 2_000_000
+        tracemalloc.start()
+        try:
+            first = next(wrap(text, 80))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert first == ("word " * 16).rstrip()
+        assert peak < 64 * 1024
+
+    def test_invalid_width(self):
+        with pytest.raises(ValueError):
+            wrap("x", 0)
+
+    def test_split_text_to_lines_uses_engine(self):
+        assert split_text_to_lines("one  two\nthree", 9) == ["one two", "three"]
+        assert split_text_to_lines("abcdefgh", 3) == ["abc", "def", "gh"]
+        assert split_text_to_lines("", 5) == []
+
+
+class TestTextLayout:
+    """Test suite for TextLayout caching."""
+
+    DOC = "short\n" + "a long paragraph that has to wrap " * 3 + "\n\nend\n"
+
+    def test_matches_wrap(self):
+        layout = TextLayout(self.DOC)
+        for width in (8, 20, 80):
+            assert list(layout.lines(width)) == list(wrap(self.DOC, width))
+
+    def _count_wraps(self, monkeypatch):
+        calls = []
+        real = layout_module._wrap
+        monkeypatch.setattr(layout_module, "_wrap",
+                            lambda text, *args: calls.append(text) or real(text, *args))
+        return calls
+
+    def test_edit_relayouts_from_first_change(self, monkeypatch):
+        layout = TextLayout(self.DOC)
+        list(layout.lines(20))
+        expected = list(wrap(self.DOC + "more\n", 20))
+        calls = self._count_wraps(monkeypatch)
+        assert layout.set_text(self.DOC + "more\n") == 4
+        assert list(layout.lines(20)) == expected
+        # Earlier paragraphs came from the cache; "more" fits on one line
+        assert calls == []
+        assert layout.set_text("changed\n" + self.DOC) == 0
+
+    def test_resize_rewraps_only_wrapping_paragraphs(self, monkeypatch):
+        layout = TextLayout(self.DOC)
+        list(layout.lines(20))
+        expected = list(wrap(self.DOC, 30))
+        calls = self._count_wraps(monkeypatch)
+        assert list(layout.lines(30)) == expected
+        assert len(calls) == 1
+        list(layout.lines(20))
+        assert len(calls) == 1
+
+    def test_layout_for_is_cached_by_identity(self):
+        text = "some document " * 10
+        assert layout_for(text) is layout_for(text)
+        assert layout_for(text) is not layout_for(text[:-1])
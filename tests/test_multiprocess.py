@@ -0,0 +1,118 @@
+# smooth-text-animation/tests/test_multiprocess.py
+"""
+Unit tests for the cross-process render server
+"""
+
+import io
+import multiprocessing
+import queue
+import threading
+
+import pytest
+from smooth_text_animation import RenderServer, RenderHandle
+from smooth_text_animation.multiprocess import _FRAME, _LINE, _CLOSE
+
+
+def _worker(handle, text):
+    handle.effect("rotate_text", text, delay=0, cycles=2)
+    handle.close()
+
+
+def _thread_worker(handle, text):
+    for i in range(100):
+        handle.update(f"{text} {i}")
+    handle.print(text)
+    handle.close()
+
+
+class TestRenderHandle:
+    """Test suite for the worker-side proxy."""
+
+    def _handle(self):
+        q = queue.Queue()
+        return q, RenderHandle(q, slot=3, min_interval=0)
+
+    def _messages(self, q):
+        out = []
+        while not q.empty():
+            out.append(q.get())
+        return out
+
+    def test_frames_are_last_redraw(self):
+        q, handle = self._handle()
+        handle.write("\rab")
+        handle.write("\rabc")
+        handle.flush()
+        assert self._messages(q) == [(3, _FRAME, "abc")]
+
+    def test_unchanged_frame_not_resent(self):
+        q, handle = self._handle()
+        handle.update("x")
+        handle.update("x")
+        assert len(self._messages(q)) == 1
+
+    def test_lines_always_delivered(self):
+        q, handle = self._handle()
+        handle.min_interval = 60
+        handle.update("a")
+        handle.update("b")
+        handle.print("done")
+        handle.close()
+        assert self._messages(q) == [
+            (3, _FRAME, "a"), (3, _LINE, "done"), (3, _CLOSE, ""),
+        ]
+
+    def test_effect_is_redirected(self, capsys):
+        q, handle = self._handle()
+        handle.effect("animated_line", "Hi", delay=0)
+        assert capsys.readouterr().out == ""
+        assert (3, _LINE, "Hi") in self._messages(q)
+
+
+class TestRenderServer:
+    """Test suite for the parent-side compositor."""
+
+    def test_threads_composite(self):
+        stream = io.StringIO()
+        with RenderServer(stream=stream, queue=queue.Queue()) as server:
+            handles = [server.handle(min_interval=0) for _ in range(4)]
+            threads = [
+                threading.Thread(target=_thread_worker, args=(h, f"job{i}"))
+                for i, h in enumerate(handles)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        out = stream.getvalue()
+        for i in range(4):
+            assert f"job{i}" in out
+
+    def test_closed_slot_becomes_permanent_line(self):
+        stream = io.StringIO()
+        server = RenderServer(stream=stream, queue=queue.Queue())
+        handle = server.handle(min_interval=0)
+        handle.update("final")
+        handle.close()
+        server.stop()
+        assert "final\033[K\n" in stream.getvalue()
+
+    @pytest.mark.skipif(
+        "fork" not in multiprocessing.get_all_start_methods(),
+        reason="requires the fork start method",
+    )
+    def test_processes(self):
+        ctx = multiprocessing.get_context("fork")
+        stream = io.StringIO()
+        with RenderServer(stream=stream, queue=ctx.Queue()) as server:
+            procs = [
+                ctx.Process(target=_worker, args=(server.handle(), f"proc{i}"))
+                for i in range(3)
+            ]
+            for p in procs:
+                p.start()
+            for p in procs:
+                p.join()
+        out = stream.getvalue()
+        for i in range(3):
+            assert f"proc{i}" in out
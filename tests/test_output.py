@@ -0,0 +1,242 @@
+# smooth-text-animation/tests/test_output.py
+"""
+Unit tests for output backends
+"""
+
+import io
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+from smooth_text_animation import animated_line, rotate_text, glitch_text
+from smooth_text_animation.output import (
+    BroadcastSink, FdWriter, resolve_stream, write_all,
+)
+
+
+def _read_all(fd):
+    chunks = []
+    while True:
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+class TestFdWriter:
+    """Test suite for the raw descriptor writer."""
+
+    def test_writes_utf8_on_flush(self):
+        r, w = os.pipe()
+        writer = FdWriter(w)
+        writer.write("\r█ ok")
+        writer.write(" ✓")
+        writer.flush()
+        os.close(w)
+        assert _read_all(r) == "\r█ ok ✓".encode("utf-8")
+        os.close(r)
+
+    def test_repeated_frames_encoded_once(self):
+        writer = FdWriter(io.BytesIO())
+        assert writer.encode("frame") is writer.encode("frame")
+
+    def test_binary_stream_without_fileno(self):
+        buf = io.BytesIO()
+        writer = FdWriter(buf)
+        writer.write("héllo")
+        writer.write_bytes(b"!")
+        assert buf.getvalue() == b""
+        writer.flush()
+        assert buf.getvalue() == "héllo!".encode("utf-8")
+
+    @pytest.mark.skipif(not hasattr(os, "set_blocking"),
+                        reason="requires os.set_blocking")
+    def test_nonblocking_partial_writes(self):
+        r, w = os.pipe()
+        os.set_blocking(w, False)
+        payload = b"x" * (1 << 20)
+        received = []
+        reader = threading.Thread(target=lambda: received.append(_read_all(r)))
+        reader.start()
+        write_all(w, payload)
+        os.close(w)
+        reader.join()
+        os.close(r)
+        assert received[0] == payload
+
+
+class TestEffectTargets:
+    """Effects can target descriptors and binary streams."""
+
+    def test_effect_to_fd(self):
+        r, w = os.pipe()
+        rotate_text("Spin", delay=0, cycles=1, stream=w)
+        os.close(w)
+        out = _read_all(r)
+        os.close(r)
+        assert out.endswith(b"\\ Spin\n")
+
+    def test_effect_to_binary_stream(self):
+        buf = io.BytesIO()
+        animated_line("Hi", delay=0, stream=buf)
+        assert buf.getvalue() == b"\r\rH\rHi\n"
+
+    @pytest.mark.parametrize("target", ["1", "sys.stdout.buffer"])
+    def test_buffered_stdout_written_first(self, target):
+        code = ("import sys\n"
+                "from smooth_text_animation import animated_line\n"
+                "print('header')\n"
+                f"animated_line('abc', delay=0, stream={target})\n")
+        env = dict(os.environ)
+        env.pop("PYTHONUNBUFFERED", None)
+        result = subprocess.run([sys.executable, "-c", code], env=env,
+                                capture_output=True, timeout=30)
+        assert result.stdout.startswith(b"header\n")
+        assert result.stdout.endswith(b"abc\n")
+
+    def test_effect_to_text_stream(self, capsys):
+        buf = io.StringIO()
+        glitch_text("Glitch", delay=0, stream=buf)
+        assert "Glitch" in buf.getvalue()
+        assert capsys.readouterr().out == ""
+
+
+def _recv_all(sock):
+    chunks = []
+    while True:
+        try:
+            chunk = sock.recv(65536)
+        except BlockingIOError:
+            break
+        if not chunk:
+            break
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+class TestBroadcastSink:
+    """Test suite for BroadcastSink."""
+
+    @pytest.fixture
+    def pairs(self):
+        made = []
+
+        def make(count):
+            for _ in range(count):
+                made.append(socket.socketpair())
+            return made[-count:]
+
+        yield make
+        for a, b in made:
+            a.close()
+            b.close()
+
+    def test_same_bytes_to_every_client(self, pairs):
+        sink = BroadcastSink()
+        clients = pairs(20)
+        for server, _ in clients:
+            sink.add(server)
+        expected = io.StringIO()
+        rotate_text("Busy", delay=0, cycles=2, stream=expected)
+        rotate_text("Busy", delay=0, cycles=2, stream=sink)
+        for _, client in clients:
+            client.setblocking(False)
+            assert _recv_all(client) == expected.getvalue().encode()
+
+    def test_slow_client_skips_to_latest(self, pairs):
+        (fast_server, fast), (slow_server, slow) = pairs(2)
+        slow_server.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+        sink = BroadcastSink()
+        sink.add(fast_server)
+        sink.add(slow_server)
+        fast.setblocking(False)
+        slow.setblocking(False)
+
+        started = time.monotonic()
+        received = []
+        for i in range(2000):
+            sink.write(f"\rframe {i:05d} " + "x" * 500)
+            sink.flush()
+            received.append(_recv_all(fast))
+        # Never blocked on the slow reader
+        assert time.monotonic() - started < 5
+        assert sink.skipped > 0
+        assert b"frame 01999" in b"".join(received)
+
+        # Once the slow client drains it jumps straight to the last frame
+        data = b""
+        state = sink._clients[1]
+        for _ in range(1000):
+            data += _recv_all(slow)
+            sink.flush()
+            if state.pending is None and not state.behind:
+                break
+        data += _recv_all(slow)
+        assert data.endswith(b"\r\033[K\rframe 01999 " + b"x" * 500)
+        assert data.count(b"frame") < 2000
+
+    def test_late_joiner_gets_current_line(self, pairs):
+        (first_server, _), (late_server, late) = pairs(2)
+        sink = BroadcastSink()
+        sink.add(first_server)
+        sink.write("done\n\rpar")
+        sink.flush()
+        sink.add(late_server)
+        sink.write("tial")
+        sink.flush()
+        late.setblocking(False)
+        assert _recv_all(late) == b"\r\033[K\rpartial"
+
+    def test_long_diff_line_stays_bounded(self, pairs):
+        (first_server, _), (late_server, late) = pairs(2)
+        sink = BroadcastSink()
+        sink._line.limit = 1000
+        sink.add(first_server)
+        sink.write("\rstart")
+        sink.flush()
+        # Diff frames (cursor moves) keep adding to the same line
+        for i in range(5000):
+            sink.write(f"\r\033[{i % 40}C{i % 10}")
+            sink.flush()
+        assert sink._line.size <= 1000
+        # A client joining now waits for a whole-line redraw to catch up from
+        sink.add(late_server)
+        late.setblocking(False)
+        sink.write("\r\033[3Cx")
+        sink.flush()
+        assert _recv_all(late) == b""
+        sink.write("\rredrawn")
+        sink.flush()
+        assert _recv_all(late) == b"\r\033[K\rredrawn"
+
+    def test_disconnected_client_dropped(self, pairs):
+        (server, client), = pairs(1)
+        sink = BroadcastSink()
+        sink.add(server)
+        client.close()
+        sink.write("\rhello")
+        sink.flush()
+        assert sink.clients == 0
+
+    def test_pipe_client(self):
+        read_fd, write_fd = os.pipe()
+        try:
+            sink = BroadcastSink()
+            sink.add(write_fd)
+            animated_line("pipe", delay=0, stream=sink)
+            assert os.read(read_fd, 1024).endswith(b"\rpipe\n")
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+
+def test_resolve_stream(capsys):
+    import sys
+    assert resolve_stream() is sys.stdout
+    buf = io.StringIO()
+    assert resolve_stream(buf) is buf
+    assert isinstance(resolve_stream(io.BytesIO()), FdWriter)
@@ -0,0 +1,99 @@
+# smooth-text-animation/tests/test_progress.py
+"""
+Unit tests for live progress bars
+"""
+
+import io
+import threading
+
+import pytest
+from smooth_text_animation import ProgressBar, LiveProgress
+from smooth_text_animation.progress import format_seconds
+
+
+class TestProgressBar:
+    """Test suite for the ProgressBar counter and renderer."""
+
+    def test_concurrent_updates(self):
+        bar = ProgressBar(40000)
+
+        def work():
+            for _ in range(10000):
+                bar.update()
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert bar.completed == 40000
+
+    def test_repeated_reads_do_not_count(self):
+        bar = ProgressBar(10)
+        bar.update()
+        assert bar.completed == 1
+        assert bar.completed == 1
+
+    def test_bulk_update(self):
+        bar = ProgressBar(100)
+        bar.update(25)
+        bar.update()
+        bar.update(0)
+        assert bar.completed == 26
+
+    def test_render(self):
+        bar = ProgressBar(10, "job", width=10)
+        bar.update(5)
+        line = bar.render(now=0.0)
+        assert line.startswith("job [█████░░░░░]")
+        assert " 50%" in line
+        assert "5/10" in line
+
+    def test_zero_total(self):
+        assert "0%" in ProgressBar(0).render(now=0.0)
+
+    def test_rate_and_eta(self):
+        bar = ProgressBar(100, smoothing=1.0)
+        bar.sample(now=0.0)
+        bar.update(10)
+        bar.sample(now=1.0)
+        assert bar.rate == pytest.approx(10.0)
+        assert bar.eta() == pytest.approx(9.0)
+
+    def test_bar_segments_cached(self):
+        bar = ProgressBar(1000, width=10)
+        for _ in range(1000):
+            bar.update()
+            bar.render(now=0.0)
+        assert len(bar._bar_cache) == 11
+
+
+class TestLiveProgress:
+    """Test suite for the stacked live renderer."""
+
+    def test_stacked_bars(self):
+        stream = io.StringIO()
+        with LiveProgress(refresh_per_second=100, stream=stream) as live:
+            first = live.add_bar(10, "first")
+            second = live.add_bar(10, "second")
+            first.update(10)
+            second.update(5)
+        out = stream.getvalue()
+        assert "first" in out and "second" in out
+        assert "100%" in out
+        assert out.endswith("\n")
+
+    def test_unchanged_frame_not_redrawn(self):
+        stream = io.StringIO()
+        live = LiveProgress(stream=stream)
+        live.add_bar(10)
+        live.refresh()
+        live.refresh()
+        size = len(stream.getvalue())
+        live.refresh()
+        assert len(stream.getvalue()) == size
+
+
+def test_format_seconds():
+    assert format_seconds(5) == "0:05"
+    assert format_seconds(3725) == "1:02:05"
@@ -0,0 +1,138 @@
+# smooth-text-animation/tests/test_quality.py
+"""
+Unit tests for adaptive frame quality
+"""
+
+import io
+import queue
+import time
+
+from smooth_text_animation import (
+    RenderHandle,
+    VirtualClock,
+    animated_line,
+    rainbow_text,
+)
+from smooth_text_animation.multiprocess import _LINE
+from smooth_text_animation.quality import AdaptiveQuality
+
+
+class _Link(io.StringIO):
+    """Text stream whose flush takes simulated time per character."""
+
+    def __init__(self, clock, seconds_per_char):
+        super().__init__()
+        self.clock = clock
+        self.seconds_per_char = seconds_per_char
+        self._unsent = 0
+
+    def write(self, text):
+        self._unsent += len(text)
+        return super().write(text)
+
+    def flush(self):
+        self.clock.advance(self._unsent * self.seconds_per_char)
+        self._unsent = 0
+
+    def isatty(self):
+        return True
+
+
+class _SlowQueue(queue.Queue):
+    """Queue whose ``put`` takes a few milliseconds, like a busy pipe."""
+
+    def put(self, item, block=True, timeout=None):
+        time.sleep(0.004)
+        super().put(item, block, timeout)
+
+
+class TestAdaptiveQuality:
+    """Test suite for AdaptiveQuality."""
+
+    def test_levels_rise_and_recover(self):
+        quality = AdaptiveQuality(smoothing=1.0)
+        for latency, level in ((0.08, 1), (0.3, 3), (0.07, 2), (0.001, 0)):
+            quality.record(latency, 0.0)
+            quality.adjust(0.1)
+            assert quality.level == level
+
+    def test_diff_only_frames(self):
+        quality = AdaptiveQuality()
+        quality.level = 1
+        assert quality.prepare("\rHello", 0.0) == "\rHello"
+        assert quality.prepare("\rHello, world", 0.0) == "\r\033[5C, world"
+        assert quality.prepare("\rHello, world", 0.0) == "\r\033[12C"
+
+    def test_drops_only_redraws(self):
+        quality = AdaptiveQuality()
+        quality.record(1.0, 0.0)
+        quality.adjust(0.1)
+        assert quality.level == 3
+        assert quality.prepare("\rabc", 0.5) is None
+        assert quality.prepare("\033[2;3Hx", 0.5) == "\rabc\033[2;3Hx"
+        assert quality.prepare("\033[2;3Hy", 0.5) == "\033[2;3Hy"
+
+    def test_dropped_redraw_written_before_end(self):
+        quality = AdaptiveQuality()
+        quality.record(1.0, 0.0)
+        quality.adjust(0.1)
+        assert quality.prepare("\rdone", 0.5) is None
+        assert quality.prepare("\n", 0.5) == "\rdone\n"
+
+    def test_strips_colour_at_top_level(self):
+        quality = AdaptiveQuality()
+        quality.level = 3
+        assert quality.prepare("\r\033[1;31mred\033[0m\n", 0.0) == "\rred\n"
+
+
+class TestAdaptiveEffects:
+    """Effects on fast and slow simulated links."""
+
+    def test_fast_link_unchanged(self):
+        expected = io.StringIO()
+        animated_line("Hello", delay=0.05, stream=expected, clock=VirtualClock())
+        clock = VirtualClock()
+        link = _Link(clock, 1e-7)
+        animated_line("Hello", delay=0.05, stream=link, clock=clock)
+        assert link.getvalue() == expected.getvalue()
+
+    def test_slow_link_keeps_up(self, terminal):
+        text = "The quick brown fox jumps over the lazy dog. " * 8
+        clock = VirtualClock()
+        # About 3 ms per character: a full frame costs more than the delay
+        link = _Link(clock, 0.003)
+        animated_line(text, delay=0.02, stream=link, clock=clock)
+        full = sum(i + 1 for i in range(len(text) + 1)) + 1
+        assert len(link.getvalue()) < full / 10
+        terminal.write(link.getvalue())
+        assert terminal.lines == [text.rstrip()]
+        # Close to the intended 0.02 s per character, not the 100x slower
+        # time that writing every full frame would take
+        assert clock.now() < len(text) * 0.02 * 2
+
+    def test_colour_dropped_and_restored(self):
+        clock = VirtualClock()
+        link = _Link(clock, 0.01)
+        rainbow_text("Rainbow!", delay=0.01, stream=link, clock=clock)
+        slow = link.getvalue()
+        assert "\033[3" not in slow.rpartition("\n")[0].split("\r")[-1]
+
+        # Once the link is fast again, colour comes back within a second
+        link.seconds_per_char = 1e-7
+        started = clock.now()
+        while clock.now() - started < 1.0:
+            link.seek(0)
+            link.truncate()
+            rainbow_text("Rainbow!", delay=0.01, stream=link, clock=clock)
+            if "\033[3" in link.getvalue():
+                break
+        assert "\033[3" in link.getvalue()
+
+    def test_slow_non_terminal_unchanged(self):
+        # A worker handle keeps only the text after the last "\r"; trimmed
+        # redraws would reach the render server as broken rows
+        q = _SlowQueue()
+        handle = RenderHandle(q, slot=0, min_interval=0)
+        animated_line("Hello world", delay=0.005, stream=handle)
+        lines = [m[2] for m in list(q.queue) if m[1] == _LINE]
+        assert lines == ["Hello world"]
@@ -0,0 +1,55 @@
+# smooth-text-animation/tests/test_rain.py
+"""
+Unit tests for the matrix rain effect
+"""
+
+import io
+import time
+
+from smooth_text_animation import matrix_rain
+from smooth_text_animation.rain import MatrixRain
+
+
+class TestMatrixRain:
+    """Test suite for the rain grid and its diff renderer."""
+
+    def test_only_changed_cells_emitted(self):
+        rain = MatrixRain("", cols=40, rows=10)
+        rain.step(0.0)
+        assert rain.render() == ""
+
+    def test_settle_leaves_message(self):
+        rain = MatrixRain("HELLO", cols=20, rows=5)
+        for i in range(30):
+            rain.step(i / 30)
+        rain.settle()
+        rain.render()
+        screen = rain.screen
+        assert screen.text(rain.message_row).strip() == "HELLO"
+        assert screen.cell(rain.message_row, rain.message_col).style == rain.message_style
+        others = {screen.cell(r, c).style
+                  for r in range(screen.rows) for c in range(screen.cols)
+                  if r != rain.message_row}
+        assert others == {rain.blank_style}
+
+    def test_message_revealed_by_rain(self):
+        rain = MatrixRain("AB", cols=2, rows=3, reveal_at=0.0)
+        for _ in range(200):
+            rain.step(1.0)
+        assert list(rain.locked) == [1, 1]
+
+    def test_frame_budget_large_grid(self):
+        rain = MatrixRain("SPLASH", cols=300, rows=80)
+        start = time.perf_counter()
+        for i in range(60):
+            rain.step(i / 60)
+        # Generous bound: a 60 FPS run needs 60 frames per second
+        assert time.perf_counter() - start < 1.0
+
+
+def test_matrix_rain_output():
+    buf = io.StringIO()
+    matrix_rain("DONE", duration=0.05, fps=200, width=30, height=6, stream=buf)
+    out = buf.getvalue()
+    assert out.startswith("\033[?25l\033[2J")
+    assert "D" in out and out.endswith("\033[?25h\n")
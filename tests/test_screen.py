@@ -0,0 +1,103 @@
+# smooth-text-animation/tests/test_screen.py
+"""
+Unit tests for the screen buffer
+"""
+
+import time
+
+import pytest
+from smooth_text_animation.screen import Cell, ScreenBuffer, StyleTable
+
+
+class TestStyleTable:
+    """Test suite for style interning."""
+
+    def test_intern_is_stable(self):
+        table = StyleTable()
+        bold = table.intern("\033[1m")
+        assert table.intern("\033[1m") == bold
+        assert table.intern("\033[2m") != bold
+        assert table.sequence(bold) == "\033[1m"
+        assert table.intern("") == 0
+
+
+class TestScreenBuffer:
+    """Test suite for ScreenBuffer storage and rendering."""
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            ScreenBuffer(0, 10)
+
+    def test_put_and_cell(self):
+        screen = ScreenBuffer(2, 3)
+        screen.put(1, 2, "x", 4)
+        assert screen.cell(1, 2) == Cell("x", 4)
+        assert screen.cell(0, 0) == Cell(" ", 0)
+
+    def test_blit_clips(self):
+        screen = ScreenBuffer(1, 5)
+        assert screen.blit(0, -2, "abcdefg") == 5
+        assert screen.text(0) == "cdefg"
+        assert screen.blit(0, 3, "XYZ") == 2
+        assert screen.text(0) == "cdeXY"
+        assert screen.blit(5, 0, "no") == 0
+
+    def test_fill_rectangle(self):
+        screen = ScreenBuffer(3, 4)
+        screen.fill("#", row=1, col=1, rows=1, cols=2)
+        assert [screen.text(r) for r in range(3)] == ["    ", " ## ", "    "]
+
+    def test_render_only_changes(self):
+        screen = ScreenBuffer(3, 10)
+        assert screen.render() == ""
+        screen.put(2, 4, "a")
+        assert screen.render() == "\033[3;5Ha"
+        # Writing the same content again emits nothing
+        screen.put(2, 4, "a")
+        screen.blit(2, 4, "a")
+        assert screen.render() == ""
+
+    def test_render_runs_and_styles(self):
+        screen = ScreenBuffer(1, 10)
+        red = screen.styles.intern("\033[31m")
+        screen.blit(0, 2, "ab", red)
+        assert screen.render() == "\033[1;3H\033[31mab\033[0m"
+
+    def test_render_inline(self):
+        screen = ScreenBuffer(2, 10)
+        screen.put(0, 0, "a")
+        screen.put(1, 3, "b")
+        assert screen.render(inline=True) == "\ra\033[1B\r\033[3Cb\033[1A"
+
+    def test_dirty_rows(self):
+        screen = ScreenBuffer(4, 4)
+        screen.put(3, 0, "x")
+        screen.put(1, 0, "y")
+        assert list(screen.dirty_rows()) == [1, 3]
+        screen.render()
+        assert list(screen.dirty_rows()) == []
+
+    def test_invalidate(self):
+        screen = ScreenBuffer(1, 3)
+        screen.blit(0, 0, "abc")
+        screen.render()
+        screen.invalidate()
+        assert screen.render() == "\033[1;1Habc"
+
+    def test_composite(self):
+        base = ScreenBuffer(2, 4)
+        base.fill(".")
+        overlay = ScreenBuffer(1, 3, styles=base.styles)
+        overlay.blit(0, 0, "a b")
+        base.composite(overlay, row=1, col=1)
+        assert base.text(1) == ".a.b"
+
+    def test_render_cost_follows_changes(self):
+        # Two far-apart writes per frame must not scan the cells between them
+        screen = ScreenBuffer(1, 200000)
+        start = time.perf_counter()
+        for i in range(1000):
+            screen.put(0, i, "a")
+            screen.put(0, 199999 - i, "b")
+            screen.render()
+        assert time.perf_counter() - start < 1.0
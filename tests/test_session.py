@@ -0,0 +1,109 @@
+# smooth-text-animation/tests/test_session.py
+"""
+Unit tests for printing above a live animation
+"""
+
+import time
+
+from smooth_text_animation import LiveSession, VirtualClock, rotate_text
+
+
+class _Recorder:
+    """Text stream that keeps every write separately."""
+
+    def __init__(self):
+        self.writes = []
+
+    def write(self, text):
+        self.writes.append(text)
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def getvalue(self):
+        return "".join(self.writes)
+
+
+def _frame(session, text):
+    session.stream.write(text)
+    session.stream.flush()
+
+
+class TestLiveSession:
+    """Test suite for LiveSession."""
+
+    def test_print_redraws_in_one_write(self):
+        out = _Recorder()
+        session = LiveSession(stream=out)
+        _frame(session, "\r| Working")
+        session.print("hello")
+        _frame(session, "\r/ Working")
+        assert out.writes == [
+            "\r| Working",
+            "\r\033[Khello\n\r| Working\r/ Working",
+        ]
+
+    def test_prints_batched_per_frame(self):
+        out = _Recorder()
+        session = LiveSession(stream=out, interval=10)
+        _frame(session, "\r| Working")
+        for i in range(100):
+            session.print(f"line {i}")
+        _frame(session, "\r/ Working")
+        assert len(out.writes) == 2
+        assert out.writes[1].count("\n") == 100
+
+    def test_partial_line_waits_for_newline(self):
+        out = _Recorder()
+        session = LiveSession(stream=out, interval=10)
+        _frame(session, "\r| Working")
+        session.write("abc")
+        _frame(session, "\r/ Working")
+        session.write("def\n")
+        _frame(session, "\r- Working")
+        assert out.writes[1] == "\r/ Working"
+        assert out.writes[2] == "\r\033[Kabcdef\n\r/ Working\r- Working"
+
+    def test_diff_frames_replayed(self):
+        out = _Recorder()
+        session = LiveSession(stream=out)
+        _frame(session, "\r\033[K....\r")
+        _frame(session, "\r\033[2Cx")
+        session.print("note")
+        _frame(session, "\ry")
+        assert out.writes[-1] == "\r\033[Knote\n\r\033[K....\r\r\033[2Cx\ry"
+
+    def test_text_written_without_frames(self):
+        out = _Recorder()
+        session = LiveSession(stream=out, interval=0.01)
+        session.print("idle")
+        deadline = time.monotonic() + 2
+        while not out.writes and time.monotonic() < deadline:
+            time.sleep(0.005)
+        assert out.writes == ["idle\n"]
+
+    def test_redirect_stdout(self):
+        out = _Recorder()
+        with LiveSession(stream=out, interval=10) as session:
+            _frame(session, "\r| Working")
+            with session.redirect():
+                print("from print")
+            _frame(session, "\r/ Working")
+        assert out.writes[1] == "\r\033[Kfrom print\n\r| Working\r/ Working"
+
+    def test_effect_and_close(self):
+        out = _Recorder()
+        with LiveSession(stream=out, interval=10) as session:
+            session.print("before")
+            session.effect("rotate", "Work", delay=0, cycles=1, clock=VirtualClock())
+            session.write("tail")
+        text = out.getvalue()
+        assert text.startswith("before\n\r| Work")
+        assert text.endswith("\r\\ Work\ntail")
+
+    def test_effect_by_function(self):
+        out = _Recorder()
+        session = LiveSession(stream=out)
+        session.effect(rotate_text, "Go", delay=0, cycles=1)
+        assert out.getvalue().endswith("\r\\ Go\n")